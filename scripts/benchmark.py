@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+"""
+Benchmark the calendars of the ISO registry and the continent imports.
+
+For each calendar (subregions included), it times:
+
+* ``holidays(year)``, on a new instance with the process-wide caches cleared
+  (cold) and once computed (warm),
+* ``is_working_day()`` on every day of the year,
+* ``add_working_days()`` with small and large deltas,
+* ``get_working_days_delta()`` over a multi-year span.
+
+The results (in seconds, best of ``--repeat`` runs) are written as a JSON
+document, so that two runs (e.g. two releases) can be compared per ISO code.
+With ``--compare``, the operations slower than in a previous run are listed.
+
+Usage::
+
+    python scripts/benchmark.py --output benchmark.json
+    python scripts/benchmark.py --output new.json --compare benchmark.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from datetime import date, timedelta
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+import workalendar  # noqa: E402
+from workalendar import astronomy, core, hebrew  # noqa: E402
+from workalendar.cache import clear_shared_caches  # noqa: E402
+from workalendar.registry import IsoRegistry  # noqa: E402
+
+CONTINENTS = ('africa', 'america', 'asia', 'europe', 'oceania', 'usa')
+
+# Fixed, so that runs are comparable
+DEFAULT_YEAR = 2019
+SMALL_DELTA = 5
+LARGE_DELTA = 500
+DELTA_SPAN = 5  # years
+
+
+def best_of(function, repeat):
+    """
+    Return the shortest duration of ``repeat`` calls to ``function``.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def time_import(module):
+    """
+    Return the duration of the import of ``module``, in a new interpreter.
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import {}\n"
+        "print(time.perf_counter() - start)\n"
+    ).format(module)
+    return float(subprocess.check_output([sys.executable, '-c', code]))
+
+
+def clear_caches():
+    """
+    Drop the process-wide caches and memos, so that the next computation of
+    holidays is a cold one.
+    """
+    clear_shared_caches()
+    core._nth_weekday_in_month.cache_clear()
+    core._last_weekday_in_month.cache_clear()
+    core._easter_sunday.cache_clear()
+    core._lunar_months.cache_clear()
+    hebrew._hebrew_calendars.invalidate()
+    with astronomy._ephemeris_lock:
+        astronomy._ephemeris = None
+
+
+def benchmark_calendar(cls, year, repeat):
+    """
+    Return the durations of the calendar operations, by name.
+
+    An operation that fails (e.g. a year not supported by the calendar) is
+    reported as ``{"error": ...}``.
+    """
+    days = [date(year, 1, 1) + timedelta(days=i) for i in range(365)]
+    start, end = date(year, 1, 1), date(year + DELTA_SPAN, 12, 31)
+    calendar = cls()
+
+    def holidays_cold():
+        clear_caches()
+        cls().holidays(year)
+
+    def is_working_day():
+        for day in days:
+            calendar.is_working_day(day)
+
+    def add_working_days(delta):
+        def function():
+            for day in days[::7]:
+                calendar.add_working_days(day, delta)
+                calendar.add_working_days(day, -delta)
+        return function
+
+    # The first run of the "warm" operations computes the holidays they need,
+    # only the best run is kept.
+    operations = (
+        ('holidays_cold', holidays_cold),
+        ('holidays_warm', lambda: calendar.holidays(year)),
+        ('is_working_day', is_working_day),
+        ('add_working_days_small', add_working_days(SMALL_DELTA)),
+        ('add_working_days_large', add_working_days(LARGE_DELTA)),
+        ('get_working_days_delta',
+         lambda: calendar.get_working_days_delta(start, end)),
+    )
+    results = {}
+    for name, function in operations:
+        try:
+            results[name] = best_of(function, repeat)
+        except Exception as exc:
+            results[name] = {'error': repr(exc)}
+    return results
+
+
+def compare(previous, results, threshold):
+    """
+    Print the imports and operations at least ``threshold`` times slower in
+    ``results`` than in ``previous``.
+    """
+    pairs = [
+        (module, previous['imports'].get(module), duration)
+        for module, duration in results['imports'].items()
+    ]
+    for iso_code, operations in sorted(results['calendars'].items()):
+        old_operations = previous['calendars'].get(iso_code, {})
+        for name, duration in sorted(operations.items()):
+            pairs.append((
+                '{} {}'.format(iso_code, name),
+                old_operations.get(name), duration))
+    for name, old, new in pairs:
+        if not isinstance(old, float) or not isinstance(new, float):
+            continue
+        if new >= old * threshold:
+            print('{:<40} {:>10.6f}s -> {:>10.6f}s (x{:.2f})'.format(
+                name, old, new, new / old))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the calendars of the ISO registry.")
+    parser.add_argument(
+        '--output', default='benchmark.json',
+        help="Path of the JSON file to write (default: benchmark.json)")
+    parser.add_argument(
+        '--year', type=int, default=DEFAULT_YEAR,
+        help="Year of the benchmarks (default: {})".format(DEFAULT_YEAR))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--iso-code', action='append', dest='iso_codes',
+        help="ISO code of a calendar to benchmark (default: all)")
+    parser.add_argument(
+        '--compare', metavar='PATH',
+        help="Results of a previous run, to list the slower operations")
+    parser.add_argument(
+        '--threshold', type=float, default=1.2,
+        help="Slowdown ratio reported by --compare (default: 1.2)")
+    args = parser.parse_args()
+
+    results = {
+        'workalendar': workalendar.__version__,
+        'python': platform.python_version(),
+        'year': args.year,
+        'repeat': args.repeat,
+        'imports': {},
+        'calendars': {},
+    }
+    for continent in CONTINENTS:
+        module = 'workalendar.{}'.format(continent)
+        results['imports'][module] = min(
+            time_import(module) for _ in range(args.repeat))
+
+    registry = IsoRegistry(lazy=False)
+    calendars = registry.get_calendars(
+        args.iso_codes, include_subregions=not args.iso_codes)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for iso_code, cls in sorted(calendars.items()):
+            sys.stderr.write('{:<10}\r'.format(iso_code))
+            results['calendars'][iso_code] = benchmark_calendar(
+                cls, args.year, args.repeat)
+    sys.stderr.write('\n')
+
+    with open(args.output, 'w') as fd:
+        json.dump(results, fd, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as fd:
+            compare(json.load(fd), results, args.threshold)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Generate the ``workalendar/astronomy_data.py`` module.
+
+It contains the 24 solar terms and the two equinoxes of every year covered by
+the ``de421.bsp`` ephemeris, for each of the timezones used by the calendars.
+
+Usage::
+
+    python scripts/generate_astronomy_data.py > workalendar/astronomy_data.py
+"""
+import sys
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+import pytz  # noqa: E402
+from workalendar.astronomy import (  # noqa: E402
+    equinox_datetimes, solar_term_datetime
+)
+
+# The de421 ephemeris covers 1899-07-29 through 2053-10-09
+FIRST_YEAR = 1900
+LAST_YEAR = 2052
+TIMEZONES = ('UTC', 'Asia/Hong_Kong', 'Asia/Taipei', 'Asia/Tokyo')
+
+HEADER = '''"""
+Precomputed solar terms and equinoxes, used by ``workalendar.astronomy``.
+
+Generated by ``scripts/generate_astronomy_data.py``. Do not edit.
+
+For each timezone, a year row is made of 26 dates: the 24 solar terms
+(0, 15, ... 345 degrees), then the vernal and autumnal equinoxes. Each date
+is stored as a one-digit offset to add to the day of year in ``ANCHORS``.
+"""
+'''
+
+
+def compute_year(year):
+    """
+    Return the UTC datetimes of the 24 solar terms and the 2 equinoxes.
+    """
+    datetimes = [solar_term_datetime(year, degrees)
+                 for degrees in range(0, 360, 15)]
+    datetimes.extend(equinox_datetimes(year))
+    return datetimes
+
+
+def main():
+    years = range(FIRST_YEAR, LAST_YEAR + 1)
+    datetimes = {}
+    for year in years:
+        sys.stderr.write('Computing {}\r'.format(year))
+        datetimes[year] = compute_year(year)
+
+    anchors, offsets = {}, {}
+    for timezone in TIMEZONES:
+        tz = pytz.timezone(timezone)
+        days_of_year = {
+            year: [dt.astimezone(tz).timetuple().tm_yday
+                   for dt in datetimes[year]]
+            for year in years
+        }
+        anchors[timezone] = [
+            min(days_of_year[year][index] for year in years)
+            for index in range(26)
+        ]
+        rows = []
+        for year in years:
+            row = [day - anchor for day, anchor
+                   in zip(days_of_year[year], anchors[timezone])]
+            assert max(row) < 10, "Offset too large in {}".format(year)
+            rows.append(''.join(map(str, row)))
+        offsets[timezone] = rows
+
+    print(HEADER)
+    print('FIRST_YEAR = {}'.format(FIRST_YEAR))
+    print('LAST_YEAR = {}'.format(LAST_YEAR))
+    print()
+    print('ANCHORS = {')
+    for timezone in TIMEZONES:
+        values = anchors[timezone]
+        print("    '{}': (".format(timezone))
+        for start in range(0, 26, 13):
+            print('        {},'.format(
+                ', '.join(map(str, values[start:start + 13]))))
+        print('    ),')
+    print('}')
+    print()
+    print('OFFSETS = {')
+    for timezone in TIMEZONES:
+        print("    '{}': (".format(timezone))
+        for year, row in zip(years, offsets[timezone]):
+            print("        '{}',  # {}".format(row, year))
+        print('    ),')
+    print('}')
+
+
+if __name__ == '__main__':
+    main()
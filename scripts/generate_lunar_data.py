@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Generate the ``workalendar/lunar_data.py`` module.
+
+It contains the Chinese New Year and the month lengths of every lunar year
+supported by the ``lunardate`` library.
+
+Usage::
+
+    python scripts/generate_lunar_data.py > workalendar/lunar_data.py
+"""
+from datetime import date
+
+from lunardate import LunarDate
+
+# Range supported by lunardate
+FIRST_YEAR = 1900
+LAST_YEAR = 2099
+
+HEADER = '''"""
+Precomputed Chinese lunar calendar, used by ``LunarCalendar.lunar()``.
+
+Generated by ``scripts/generate_lunar_data.py``. Do not edit.
+
+A year row is made of: the day of year of the Chinese New Year (2 digits),
+the leap month (2 digits, ``00`` if none), then the length of each month of
+the year, in order (leap month included): ``0`` for 29 days, ``1`` for 30.
+"""
+'''
+
+
+def to_solar_date(year, month, day, is_leap_month=False):
+    return LunarDate(year, month, day, is_leap_month).to_solar_date()
+
+
+def month_length(year, month, is_leap_month):
+    try:
+        to_solar_date(year, month, 30, is_leap_month)
+    except ValueError:
+        return 29
+    return 30
+
+
+def compute_year(year):
+    new_year = to_solar_date(year, 1, 1)
+    leap_month = LunarDate.leap_month_for_year(year) or 0
+    months = []
+    for month in range(1, 13):
+        months.append(month_length(year, month, False))
+        if month == leap_month:
+            months.append(month_length(year, month, True))
+    row = '{:02}{:02}'.format(
+        (new_year - date(year, 1, 1)).days + 1, leap_month)
+    return row + ''.join('1' if length == 30 else '0' for length in months)
+
+
+def main():
+    print(HEADER)
+    print('FIRST_YEAR = {}'.format(FIRST_YEAR))
+    print('LAST_YEAR = {}'.format(LAST_YEAR))
+    print()
+    print('YEARS = (')
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        print("    '{}',  # {}".format(compute_year(year), year))
+    print(')')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Generate the ``workalendar/registry_manifest.py`` module.
+
+It lists the calendars registered with the ``@iso_register`` decorator, with
+the module and the name of their class, for the lazy ISO registry.
+
+Usage::
+
+    python scripts/generate_registry_manifest.py \
+        > workalendar/registry_manifest.py
+"""
+import sys
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from workalendar.registry import IsoRegistry  # noqa: E402
+
+HEADER = '''"""
+ISO code -> (module, class name) manifest, used by the lazy ISO registry.
+
+Generated by ``scripts/generate_registry_manifest.py``. Do not edit.
+"""
+'''
+
+
+def main():
+    registry = IsoRegistry(lazy=False)
+    print(HEADER)
+    print('REGISTRY_MANIFEST = {')
+    for iso_code, cls in registry.region_registry.items():
+        print("    '{}': (".format(iso_code))
+        print("        '{}', '{}'),".format(cls.__module__, cls.__name__))
+    print('}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import io
+import re
 from os.path import join, dirname, abspath
 from setuptools import setup, find_packages
 
@@ -16,6 +17,16 @@ def read_relative_file(filename):
         return f.read()
 
 
+def read_version():
+    """
+    Return the package version, defined in ``workalendar/_version.py``.
+
+    The file is parsed, not imported, to avoid importing the package.
+    """
+    contents = read_relative_file(join('workalendar', '_version.py'))
+    return re.search(r"__version__ = '([^']+)'", contents).group(1)
+
+
 NAME = 'workalendar'
 DESCRIPTION = 'Worldwide holidays and working days helper and toolkit.'
 REQUIREMENTS = [
@@ -26,9 +37,8 @@ REQUIREMENTS = [
     'pytz',
     'pyCalverter',
     'pyluach',
-    'setuptools>=1.0',
 ]
-version = '8.4.0.dev0'
+version = read_version()
 __VERSION__ = version
 
 params = dict(
@@ -1,5 +1 @@
-import pkg_resources
-
-
-#: Module version, as defined in PEP-0396.
-__version__ = pkg_resources.get_distribution(__package__).version
+from ._version import __version__  # noqa: F401
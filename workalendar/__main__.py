@@ -0,0 +1,182 @@
+"""
+Command-line tool, streaming dates through a calendar of the ISO registry.
+
+Each input line is a CSV row; the row is written back with the result
+appended as a new column::
+
+    $ printf '2018-12-24\n2018-12-25\n' | python -m workalendar FR working-day
+    2018-12-24,true
+    2018-12-25,false
+
+The rows are processed in chunks of ``--chunk-size`` rows, using the array
+methods of the calendars, so the memory use doesn't depend on the input size.
+Dates are ISO 8601 dates (or datetimes, their time being ignored), missing
+dates are errors. Empty lines are skipped. NumPy is required.
+"""
+import argparse
+import csv
+import sys
+from itertools import islice
+
+from .registry import registry
+
+
+def get_column(rows, column):
+    try:
+        return [row[column] for row in rows]
+    except IndexError:
+        raise ValueError("missing column {}".format(column))
+
+
+def parse_dates(rows, column):
+    """
+    Return the dates of the given column of the rows, as a NumPy array.
+    """
+    import numpy
+    values = get_column(rows, column)
+    try:
+        days = numpy.array(values, dtype='datetime64')
+    except ValueError:
+        for value in values:
+            try:
+                numpy.datetime64(value)
+            except ValueError:
+                raise ValueError("invalid date {!r}".format(value))
+        raise
+    # Blank fields (and "NaT") are parsed as missing dates
+    missing = numpy.isnat(days)
+    if missing.any():
+        raise ValueError("missing date {!r} in column {}".format(
+            values[int(missing.argmax())], column))
+    return days.astype('datetime64[D]')
+
+
+def format_dates(days):
+    import numpy
+    return numpy.datetime_as_string(days, unit='D').tolist()
+
+
+def working_day(calendar, rows, args):
+    days = parse_dates(rows, args.column)
+    return [
+        'true' if value else 'false'
+        for value in calendar.is_working_day_array(days).tolist()
+    ]
+
+
+def holiday(calendar, rows, args):
+    days = parse_dates(rows, args.column)
+    return [
+        calendar.get_holiday_label(day) or ''
+        for day in days.tolist()
+    ]
+
+
+def add_working_days(calendar, rows, args):
+    days = parse_dates(rows, args.column)
+    if args.delta_column is not None:
+        deltas = [int(value) for value in get_column(
+            rows, args.delta_column)]
+    else:
+        deltas = args.delta
+    return format_dates(calendar.add_working_days_array(days, deltas))
+
+
+def delta(calendar, rows, args):
+    starts = parse_dates(rows, args.column)
+    ends = parse_dates(rows, args.end_column)
+    return calendar.get_working_days_delta_array(
+        starts, ends, include_start=args.include_start).tolist()
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m workalendar',
+        description="Read CSV rows of dates, write them back with a column "
+                    "computed using the calendar of the given ISO code.")
+    parser.add_argument('iso_code', help="ISO code of the calendar, e.g. FR")
+    parser.add_argument(
+        '--input', type=argparse.FileType('r'), default=sys.stdin,
+        help="Input file (default: standard input)")
+    parser.add_argument(
+        '--output', type=argparse.FileType('w'), default=sys.stdout,
+        help="Output file (default: standard output)")
+    parser.add_argument('--delimiter', default=',')
+    parser.add_argument(
+        '--header', action='store_true',
+        help="The first row is a header")
+    parser.add_argument(
+        '--column', type=int, default=0,
+        help="Position of the date in the rows (default: 0)")
+    parser.add_argument(
+        '--chunk-size', type=int, default=10000,
+        help="Number of rows processed at once (default: 10000)")
+
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+    command = commands.add_parser(
+        'working-day', help="Add `true` if the date is a working day, "
+                            "`false` otherwise")
+    command.set_defaults(function=working_day)
+    command = commands.add_parser(
+        'holiday', help="Add the holiday label (empty if it's not a holiday)")
+    command.set_defaults(function=holiday)
+    command = commands.add_parser(
+        'add-working-days', help="Add the date moved by a number of "
+                                 "working days")
+    command.set_defaults(function=add_working_days)
+    group = command.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        '--delta', type=int, help="Number of working days to add")
+    group.add_argument(
+        '--delta-column', type=int,
+        help="Position of the number of working days in the rows")
+    command = commands.add_parser(
+        'delta', help="Add the number of working days between two dates "
+                      "(see get_working_days_delta())")
+    command.set_defaults(function=delta)
+    command.add_argument(
+        '--end-column', type=int, default=1,
+        help="Position of the end date in the rows (default: 1)")
+    command.add_argument('--include-start', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        parser.error("NumPy is required, install it using `pip install numpy`")
+    cls = registry.get_calendar_class(args.iso_code)
+    if cls is None:
+        parser.error("unknown ISO code `{}`".format(args.iso_code))
+    calendar = cls()
+
+    # Empty lines are skipped
+    reader = (
+        row for row in csv.reader(args.input, delimiter=args.delimiter)
+        if row
+    )
+    writer = csv.writer(
+        args.output, delimiter=args.delimiter, lineterminator='\n')
+    if args.header:
+        row = next(reader, None)
+        if row is not None:
+            writer.writerow(row + [args.command])
+    while True:
+        rows = list(islice(reader, args.chunk_size))
+        if not rows:
+            break
+        try:
+            results = args.function(calendar, rows, args)
+        except ValueError as exc:
+            parser.exit(1, "{}: error: {}\n".format(parser.prog, exc))
+        writer.writerows(
+            row + [result] for row, result in zip(rows, results))
+    args.output.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2 @@
+#: Module version, as defined in PEP-0396.
+__version__ = '8.4.0.dev0'
@@ -2,12 +2,11 @@
 Astronomical functions
 """
 from math import pi, radians
-import pytz
-from skyfield.api import Loader
-from skyfield import almanac
-from skyfield_data import get_skyfield_data_path
+from threading import Lock
 from datetime import date, timedelta
 
+from . import astronomy_data
+
 
 # Parameter for the newton method to converge towards the closest solution
 # to the function. By default it'll be an approximation of a 10th of a second.
@@ -19,21 +18,85 @@ newton_precision = second / 10.
 # ``math.tau`` appears only in Python 3.6+
 tau = 2 * pi
 
+# Ephemeris and timescale, loaded once per process (see ``get_ephemeris()``).
+# The skyfield & pytz libraries are only imported when a date has to be
+# computed, i.e. when it's not available in the precomputed tables.
+_ephemeris = None
+_ephemeris_lock = Lock()
 
-def calculate_equinoxes(year, timezone='UTC'):
-    """ calculate equinox with time zone """
-    tz = pytz.timezone(timezone)
 
-    load = Loader(get_skyfield_data_path())
-    ts = load.timescale()
-    planets = load('de421.bsp')
+def get_ephemeris():
+    """
+    Return the ``(timescale, planets)`` pair used by astronomical functions.
+
+    The ``de421.bsp`` ephemeris file and the timescale are loaded on the first
+    call, then shared by all the following calls, in all threads.
+    """
+    global _ephemeris
+    if _ephemeris is None:
+        with _ephemeris_lock:
+            if _ephemeris is None:
+                from skyfield.api import Loader
+                from skyfield_data import get_skyfield_data_path
+                load = Loader(get_skyfield_data_path())
+                _ephemeris = (load.timescale(), load('de421.bsp'))
+    return _ephemeris
+
+
+def preload():
+    """
+    Load the ephemeris data right now.
+
+    Useful at server startup, to avoid paying the loading cost during the
+    first holiday computation.
+    """
+    get_ephemeris()
+
+
+def _lookup_table(year, index, timezone):
+    """
+    Return the date stored in the precomputed tables, or None if the year or
+    the timezone is not covered.
+
+    ``index`` is the position of the date in the year row: 0 to 23 for the
+    solar terms, 24 and 25 for the vernal and autumnal equinoxes.
+    """
+    if not astronomy_data.FIRST_YEAR <= year <= astronomy_data.LAST_YEAR:
+        return None
+    if timezone not in astronomy_data.OFFSETS:
+        return None
+    row = astronomy_data.OFFSETS[timezone][year - astronomy_data.FIRST_YEAR]
+    day_of_year = astronomy_data.ANCHORS[timezone][index] + int(row[index])
+    return date(year, 1, 1) + timedelta(days=day_of_year - 1)
+
+
+def equinox_datetimes(year):
+    """
+    Compute the vernal and autumnal equinoxes as UTC datetimes.
+    """
+    from skyfield import almanac
+    ts, planets = get_ephemeris()
 
     t0 = ts.utc(year, 1, 1)
     t1 = ts.utc(year, 12, 31)
     datetimes, _ = almanac.find_discrete(t0, t1, almanac.seasons(planets))
-    vernal_equinox = datetimes[0].astimezone(tz).date()
-    autumn_equinox = datetimes[2].astimezone(tz).date()
-    return vernal_equinox, autumn_equinox
+    return datetimes[0].utc_datetime(), datetimes[2].utc_datetime()
+
+
+def calculate_equinoxes(year, timezone='UTC'):
+    """ calculate equinox with time zone """
+    vernal_equinox = _lookup_table(year, 24, timezone)
+    autumn_equinox = _lookup_table(year, 25, timezone)
+    if vernal_equinox and autumn_equinox:
+        return vernal_equinox, autumn_equinox
+
+    import pytz
+    tz = pytz.timezone(timezone)
+    vernal_equinox, autumn_equinox = equinox_datetimes(year)
+    return (
+        vernal_equinox.astimezone(tz).date(),
+        autumn_equinox.astimezone(tz).date(),
+    )
 
 
 def get_current_longitude(current_date, earth, sun):
@@ -60,17 +123,10 @@ def newton(f, x0, x1, precision=newton_precision):
     return x1
 
 
-def solar_term(year, degrees, timezone='UTC'):
+def solar_term_datetime(year, degrees):
     """
-    Returns the date of the solar term for the given longitude
-    and the given year.
-
-    Solar terms are used for Chinese and Taiwanese holidays
-    (e.g. Qingming Festival in Taiwan).
-
-    More information:
-    - https://en.wikipedia.org/wiki/Solar_term
-    - https://en.wikipedia.org/wiki/Qingming
+    Compute the solar term for the given longitude and the given year, as an
+    UTC datetime.
 
     This function is adapted from the following topic:
     https://answers.launchpad.net/pyephem/+question/110832
@@ -78,12 +134,9 @@ def solar_term(year, degrees, timezone='UTC'):
     # Target angle as radians
     target_angle = radians(degrees)
 
-    load = Loader(get_skyfield_data_path())
-    planets = load('de421.bsp')
+    ts, planets = get_ephemeris()
     earth = planets['earth']
     sun = planets['sun']
-    ts = load.timescale()
-    tz = pytz.timezone(timezone)
 
     jan_first = ts.utc(date(year, 1, 1))
     current_longitude = get_current_longitude(jan_first, earth, sun)
@@ -100,10 +153,11 @@ def solar_term(year, degrees, timezone='UTC'):
         sky_tt = ts.tt_jd(t)
         longitude = get_current_longitude(sky_tt, earth, sun)
         result = target_angle - longitude
+        # Wrap the angle around a full turn, to stay in [-pi, pi]
         if result > pi:
-            result = result - pi
+            result = result - tau
         elif result < -pi:
-            result = result + pi
+            result = result + tau
         return result
 
     # Using datetimes to compute the next step date
@@ -120,7 +174,31 @@ def solar_term(year, degrees, timezone='UTC'):
     # Here we have a float to convert to julian days.
     t = ts.tt_jd(t)
     # To convert to datetime
-    t = t.utc_datetime()
+    return t.utc_datetime()
+
+
+def solar_term(year, degrees, timezone='UTC'):
+    """
+    Returns the date of the solar term for the given longitude
+    and the given year.
+
+    Solar terms are used for Chinese and Taiwanese holidays
+    (e.g. Qingming Festival in Taiwan).
+
+    Dates are read from the precomputed tables when possible, and computed
+    using :func:`solar_term_datetime` otherwise.
+
+    More information:
+    - https://en.wikipedia.org/wiki/Solar_term
+    - https://en.wikipedia.org/wiki/Qingming
+    """
+    if degrees % 15 == 0 and 0 <= degrees < 360:
+        result = _lookup_table(year, int(degrees // 15), timezone)
+        if result:
+            return result
+
+    import pytz
+    tz = pytz.timezone(timezone)
     # Convert in the timezone
-    result = t.astimezone(tz)
+    result = solar_term_datetime(year, degrees).astimezone(tz)
     return result.date()
@@ -0,0 +1,654 @@
+"""
+Precomputed solar terms and equinoxes, used by ``workalendar.astronomy``.
+
+Generated by ``scripts/generate_astronomy_data.py``. Do not edit.
+
+For each timezone, a year row is made of 26 dates: the 24 solar terms
+(0, 15, ... 345 degrees), then the vernal and autumnal equinoxes. Each date
+is stored as a one-digit offset to add to the day of year in ``ANCHORS``.
+"""
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2052
+
+ANCHORS = {
+    'UTC': (
+        79, 94, 109, 125, 140, 156, 171, 187, 203, 219, 234, 250, 265,
+        280, 295, 310, 325, 340, 355, 4, 19, 34, 49, 64, 79, 265,
+    ),
+    'Asia/Hong_Kong': (
+        79, 94, 109, 125, 140, 156, 172, 187, 203, 219, 234, 250, 265,
+        281, 296, 311, 326, 341, 355, 5, 19, 34, 49, 64, 79, 265,
+    ),
+    'Asia/Taipei': (
+        79, 94, 109, 125, 140, 156, 172, 187, 203, 219, 234, 250, 265,
+        281, 296, 311, 326, 341, 355, 5, 19, 34, 49, 64, 79, 265,
+    ),
+    'Asia/Tokyo': (
+        79, 94, 110, 125, 140, 156, 172, 188, 203, 219, 235, 250, 265,
+        281, 296, 311, 326, 341, 355, 5, 20, 34, 49, 64, 79, 265,
+    ),
+}
+
+OFFSETS = {
+    'UTC': (
+        '11101111111111111111111111',  # 1900
+        '11111121111111221111111111',  # 1901
+        '11212122112112222212111111',  # 1902
+        '11212122212122222222211112',  # 1903
+        '22212222222222222222222122',  # 1904
+        '11111121111111221111111111',  # 1905
+        '11212122112112222212111111',  # 1906
+        '11212122212122222212211112',  # 1907
+        '22212222212222222222222122',  # 1908
+        '11111121111111221111111111',  # 1909
+        '11111122112112222112111111',  # 1910
+        '11212122212122222212211112',  # 1911
+        '12212222212222222222221112',  # 1912
+        '11111121111111221111111111',  # 1913
+        '11111122112112222112111111',  # 1914
+        '11212122112122222212211112',  # 1915
+        '12212222212122222222221112',  # 1916
+        '11111121111111111111111111',  # 1917
+        '11111121111112222112111111',  # 1918
+        '11212122112122222212211112',  # 1919
+        '12212222212122222222221112',  # 1920
+        '11111111111111111111111111',  # 1921
+        '11111121111112222112111111',  # 1922
+        '11212122112122222212211112',  # 1923
+        '12212122212122222222221112',  # 1924
+        '11111111111111111111111111',  # 1925
+        '11111121111112222112111111',  # 1926
+        '11212122112122222212211112',  # 1927
+        '12212122212122222222221112',  # 1928
+        '11111111111111111111111111',  # 1929
+        '11111121111112222112111111',  # 1930
+        '11212122112122222212211112',  # 1931
+        '11212122212122222222221112',  # 1932
+        '11101111111111111111111111',  # 1933
+        '11111121111111221112111111',  # 1934
+        '11212122112112222212111111',  # 1935
+        '11212122212122222222211112',  # 1936
+        '11101111101111111111111011',  # 1937
+        '11111121111111221111111111',  # 1938
+        '11111122112112222212111111',  # 1939
+        '11212122212122222212211112',  # 1940
+        '11101111101111111111111011',  # 1941
+        '11111121111111221111111111',  # 1942
+        '11111122112112222112111111',  # 1943
+        '11212122112122222212211112',  # 1944
+        '01101111101111111111111001',  # 1945
+        '11111121111111221111111111',  # 1946
+        '11111121112112222112111111',  # 1947
+        '11212122112122222212211112',  # 1948
+        '01101111101011111111110001',  # 1949
+        '11111111111111111111111111',  # 1950
+        '11111121111112222112111111',  # 1951
+        '11212122112122222212211112',  # 1952
+        '01101111101011111111110001',  # 1953
+        '11111111111111111111111111',  # 1954
+        '11111121111112222112111111',  # 1955
+        '11212122112122222212211112',  # 1956
+        '01101011101011111111110001',  # 1957
+        '11111111111111111111111111',  # 1958
+        '11111121111112222112111111',  # 1959
+        '11212122112122222212211112',  # 1960
+        '01101011101011111111110001',  # 1961
+        '11111111111111111111111111',  # 1962
+        '11111121111112222112111111',  # 1963
+        '11212122112122222212211112',  # 1964
+        '00101011101011111111110001',  # 1965
+        '11101111101111111111111111',  # 1966
+        '11111121111111221112111111',  # 1967
+        '11211122112112222212111111',  # 1968
+        '00101011101011111111100001',  # 1969
+        '11101111101111111111111011',  # 1970
+        '11111121111111221111111111',  # 1971
+        '11111122112112222212111111',  # 1972
+        '00101011001011111101100001',  # 1973
+        '01101111101111111111111011',  # 1974
+        '11111121111111221111111111',  # 1975
+        '11111121112112222112111111',  # 1976
+        '00101011001011111101100001',  # 1977
+        '01101111101011111111111001',  # 1978
+        '11111111111111221111111111',  # 1979
+        '11111121111112222112111111',  # 1980
+        '00101011001011111101100001',  # 1981
+        '01101111101011111111110001',  # 1982
+        '11111111111111111111111111',  # 1983
+        '11111121111112222112111111',  # 1984
+        '00101011001011111101100001',  # 1985
+        '01101011101011111111110001',  # 1986
+        '11111111111111111111111111',  # 1987
+        '11111121111112222112111111',  # 1988
+        '00101011001011111101100001',  # 1989
+        '01101011101011111111110001',  # 1990
+        '11111111111111111111111111',  # 1991
+        '11111121111112222112111111',  # 1992
+        '00101011001011111101100001',  # 1993
+        '01101011101011111111110001',  # 1994
+        '11101111101111111111111111',  # 1995
+        '11111121111112222112111111',  # 1996
+        '00101011001001111101100000',  # 1997
+        '00101011101011111111110001',  # 1998
+        '11101111101111111111111111',  # 1999
+        '11111121111111222112111111',  # 2000
+        '00100011001001111101100000',  # 2001
+        '00101011101011111111110001',  # 2002
+        '11101111101111111111111011',  # 2003
+        '11111121111111221112111111',  # 2004
+        '00000011001001111101000000',  # 2005
+        '00101011001011111111100001',  # 2006
+        '01101111101111111111111011',  # 2007
+        '11111111111111221111111111',  # 2008
+        '00000010000001111001000000',  # 2009
+        '00101011001011111101100001',  # 2010
+        '01101111101011111111111001',  # 2011
+        '11111111111111221111111111',  # 2012
+        '00000010000001111001000000',  # 2013
+        '00101011001011111101100001',  # 2014
+        '01101011101011111111110001',  # 2015
+        '11111111111111111111111111',  # 2016
+        '00000010000001111001000000',  # 2017
+        '00101011001011111101100001',  # 2018
+        '01101011101011111111110001',  # 2019
+        '11111111111111111111111111',  # 2020
+        '00000010000001111001000000',  # 2021
+        '00101011001011111101100001',  # 2022
+        '01101011101011111111110001',  # 2023
+        '11111111111111111111111111',  # 2024
+        '00000010000001111001000000',  # 2025
+        '00101011001001111101100001',  # 2026
+        '01101011101011111111110001',  # 2027
+        '11101111101111111111111111',  # 2028
+        '00000010000000111001000000',  # 2029
+        '00100011001001111101100000',  # 2030
+        '00101011101011111111110001',  # 2031
+        '11101111101111111111111111',  # 2032
+        '00000010000000111001000000',  # 2033
+        '00000011001001111101100000',  # 2034
+        '00101011001011111111110001',  # 2035
+        '11101111101111111111111111',  # 2036
+        '00000010000000110001000000',  # 2037
+        '00000010001001111101000000',  # 2038
+        '00101011001011111111100001',  # 2039
+        '11101111101111111111111011',  # 2040
+        '00000000000000110000000000',  # 2041
+        '00000010000001111101000000',  # 2042
+        '00101011001011111101100001',  # 2043
+        '01101011101011111111111001',  # 2044
+        '00000000000000110000000000',  # 2045
+        '00000010000001111001000000',  # 2046
+        '00101011001011111101100001',  # 2047
+        '01101011101011111111110001',  # 2048
+        '00000000000000000000000000',  # 2049
+        '00000010000001111001000000',  # 2050
+        '00101011001011111101100001',  # 2051
+        '01101011101011111111110001',  # 2052
+    ),
+    'Asia/Hong_Kong': (
+        '11111111111111111011111111',  # 1900
+        '11212112112121111111211112',  # 1901
+        '12212112212121111121221112',  # 1902
+        '22222212222221111121222222',  # 1903
+        '22222222222222222122222222',  # 1904
+        '11212112112121111111211112',  # 1905
+        '12212112212121111121221112',  # 1906
+        '22222212222221111121222222',  # 1907
+        '22222222222222222122222222',  # 1908
+        '11212112112121111111211112',  # 1909
+        '12212112212121111121221112',  # 1910
+        '22212212222221111121222222',  # 1911
+        '22222222222221221121222222',  # 1912
+        '11212112112111111111111111',  # 1913
+        '11212112212121111121211112',  # 1914
+        '22212212212221111121222122',  # 1915
+        '22222222222221221121222222',  # 1916
+        '11211112112111111011111111',  # 1917
+        '11212112212121111111211112',  # 1918
+        '22212212212221111121222122',  # 1919
+        '22222222222221221121222222',  # 1920
+        '11111112112111111011111111',  # 1921
+        '11212112212121111111211112',  # 1922
+        '12212212212221111121221112',  # 1923
+        '22222222222221221121222222',  # 1924
+        '11111112112111111011111111',  # 1925
+        '11212112112121111111211112',  # 1926
+        '12212212212121111121221112',  # 1927
+        '22222212222221111121222222',  # 1928
+        '11111111111111111011111111',  # 1929
+        '11212112112121111111211112',  # 1930
+        '12212212212121111121221112',  # 1931
+        '22222212222221111121222222',  # 1932
+        '11111111111111111011111111',  # 1933
+        '11212112112121111111211112',  # 1934
+        '12212112212121111121221112',  # 1935
+        '22222212222221111121222222',  # 1936
+        '11111111111111111011111111',  # 1937
+        '11212112112121111111211112',  # 1938
+        '12212112212121111121221112',  # 1939
+        '22222212222221111121222222',  # 1940
+        '11111111111111111011111111',  # 1941
+        '11212112112121111111211112',  # 1942
+        '12212112212121111121221112',  # 1943
+        '22222212222221111121222222',  # 1944
+        '11111111111111110011111111',  # 1945
+        '11212112112121111111111112',  # 1946
+        '11212112212121111121211112',  # 1947
+        '22212212222221111121222122',  # 1948
+        '11111111111111110010111111',  # 1949
+        '11212112112111111111111111',  # 1950
+        '11212112212121111111211112',  # 1951
+        '22212212212221111121222122',  # 1952
+        '11111111111110110010111111',  # 1953
+        '11211112112111111011111111',  # 1954
+        '11212112212121111111211112',  # 1955
+        '22212212212221111121221122',  # 1956
+        '11111111111110110010111111',  # 1957
+        '11111112112111111011111111',  # 1958
+        '11212112112121111111211112',  # 1959
+        '12212212212221111121221112',  # 1960
+        '11111111111110100010111111',  # 1961
+        '11111111112111111011111111',  # 1962
+        '11212112112121111111211112',  # 1963
+        '12212212212121111121221112',  # 1964
+        '11111101111110000010111111',  # 1965
+        '11111111111111111011111111',  # 1966
+        '11212112112121111111211112',  # 1967
+        '12212212212121111121221112',  # 1968
+        '11111101111110000010111111',  # 1969
+        '11111111111111111011111111',  # 1970
+        '11212112112121111111211112',  # 1971
+        '12212112212121111121221112',  # 1972
+        '11111101111110000010111111',  # 1973
+        '11111111111111111011111111',  # 1974
+        '11212112112121111111211112',  # 1975
+        '11212112212121111121221112',  # 1976
+        '11101101101110000010111111',  # 1977
+        '11111111111110110011111111',  # 1978
+        '11212112112121111111111112',  # 1979
+        '11212112212121111121221112',  # 1980
+        '11101101101110000010111011',  # 1981
+        '11111111111110110010111111',  # 1982
+        '11111112112111111111111111',  # 1983
+        '11212112112121111121211112',  # 1984
+        '11101101101110000010111011',  # 1985
+        '11111111111110110010111111',  # 1986
+        '11111111112111111011111111',  # 1987
+        '11212112112121111111211112',  # 1988
+        '01101101101010000010111001',  # 1989
+        '11111101111110110010111111',  # 1990
+        '11111111111111111011111111',  # 1991
+        '11212112112121111111211112',  # 1992
+        '01101101101010000010110001',  # 1993
+        '11111101111110000010111111',  # 1994
+        '11111111111111111011111111',  # 1995
+        '11212112112121111111211112',  # 1996
+        '01101001101010000010110001',  # 1997
+        '11111101111110000010111111',  # 1998
+        '11111111111111111011111111',  # 1999
+        '11212112112121111111211112',  # 2000
+        '01101001101010000010110001',  # 2001
+        '11111101111110000010111111',  # 2002
+        '11111111111111111011111111',  # 2003
+        '11212112112121111111211112',  # 2004
+        '01101001101010000010110001',  # 2005
+        '11101101101110000010111111',  # 2006
+        '11111111111111111011111111',  # 2007
+        '11211112112111111111211111',  # 2008
+        '00101001101010000010110001',  # 2009
+        '11101101101110000010111111',  # 2010
+        '11111111111110110011111111',  # 2011
+        '11211112112111111111211111',  # 2012
+        '00101001001010000010110001',  # 2013
+        '11101101101110000010111011',  # 2014
+        '11111111111110110011111111',  # 2015
+        '11111111112111111111111111',  # 2016
+        '00101001001010000010100001',  # 2017
+        '11101101101110000010111011',  # 2018
+        '11111101111110110010111111',  # 2019
+        '11111111111111111111111111',  # 2020
+        '00101001001010000000100001',  # 2021
+        '01101101101010000010111001',  # 2022
+        '11111101111110110010111111',  # 2023
+        '11111111111111111011111111',  # 2024
+        '00101001001010000000100001',  # 2025
+        '01101001101010000010110001',  # 2026
+        '11111101111110000010111111',  # 2027
+        '11111111111111111011111111',  # 2028
+        '00101001001010000000100001',  # 2029
+        '01101001101010000010110001',  # 2030
+        '11111101111110000010111111',  # 2031
+        '11111111111111111011111111',  # 2032
+        '00101001001010000000100001',  # 2033
+        '01101001101010000010110001',  # 2034
+        '11101101101110000010111111',  # 2035
+        '11111111111111111011111111',  # 2036
+        '00101001001010000000100001',  # 2037
+        '01101001101010000010110001',  # 2038
+        '11101101101110000010111111',  # 2039
+        '11111111111110111011111111',  # 2040
+        '00100001001000000000100000',  # 2041
+        '00101001001010000010110001',  # 2042
+        '11101101101110000010111111',  # 2043
+        '11111111111110111011111111',  # 2044
+        '00000000001000000000100000',  # 2045
+        '00101001001010000010110001',  # 2046
+        '11101101101110000010111011',  # 2047
+        '11111101111110110011111111',  # 2048
+        '00000000000000000000000000',  # 2049
+        '00101001001010000010100001',  # 2050
+        '01101101101010000010111001',  # 2051
+        '11111101111110110010111111',  # 2052
+    ),
+    'Asia/Taipei': (
+        '11111111111111111011111111',  # 1900
+        '11212112112121111111211112',  # 1901
+        '12212212212121111121221112',  # 1902
+        '22222212222221111121222222',  # 1903
+        '22222222222222222122222222',  # 1904
+        '11212112112121111111211112',  # 1905
+        '12212112212121111121221112',  # 1906
+        '22222212222221111121222222',  # 1907
+        '22222222222222222122222222',  # 1908
+        '11212112112121111111211112',  # 1909
+        '12212112212121111121221112',  # 1910
+        '22212212222221111121222222',  # 1911
+        '22222222222221221121222222',  # 1912
+        '11212112112111111111111111',  # 1913
+        '11212112212121111121211112',  # 1914
+        '22212212212221111121222122',  # 1915
+        '22222222222221221121222222',  # 1916
+        '11211112112111111011111111',  # 1917
+        '11212112212121111111211112',  # 1918
+        '22212212212221111121222122',  # 1919
+        '22222222222221221121222222',  # 1920
+        '11111112112111111011111111',  # 1921
+        '11212112212121111111211112',  # 1922
+        '12212212212221111121221112',  # 1923
+        '22222222222221221121222222',  # 1924
+        '11111112112111111011111111',  # 1925
+        '11212112112121111111211112',  # 1926
+        '12212212212121111121221112',  # 1927
+        '22222212222221111121222222',  # 1928
+        '11111111111111111011111111',  # 1929
+        '11212112112121111111211112',  # 1930
+        '12212212212121111121221112',  # 1931
+        '22222212222221111121222222',  # 1932
+        '11111111111111111011111111',  # 1933
+        '11212112112121111111211112',  # 1934
+        '12212112212121111121221112',  # 1935
+        '22222212222221111121222222',  # 1936
+        '11111111111111111011111111',  # 1937
+        '11212112112121111111211112',  # 1938
+        '12212112212121111121221112',  # 1939
+        '22222212222221111121222222',  # 1940
+        '11111111111111111011111111',  # 1941
+        '11212112112121111111211112',  # 1942
+        '12212112212121111121221112',  # 1943
+        '22222212222221111121222222',  # 1944
+        '11111111111110110011111111',  # 1945
+        '11212112112121111111111112',  # 1946
+        '11212112212121111121211112',  # 1947
+        '22212212222221111121222122',  # 1948
+        '11111111111110110010111111',  # 1949
+        '11112112112111111111111111',  # 1950
+        '11212112212121111111211112',  # 1951
+        '22212212212221111121222122',  # 1952
+        '11111111111110110010111111',  # 1953
+        '11211112112111111011111111',  # 1954
+        '11212112212121111111211112',  # 1955
+        '12212212212221111121221112',  # 1956
+        '11111111111110110010111111',  # 1957
+        '11111112112111111011111111',  # 1958
+        '11212112112121111111211112',  # 1959
+        '12212212212221111121221112',  # 1960
+        '11111111111110000010111111',  # 1961
+        '11111111111111111011111111',  # 1962
+        '11212112112121111111211112',  # 1963
+        '12212212212121111121221112',  # 1964
+        '11111101111110000010111111',  # 1965
+        '11111111111111111011111111',  # 1966
+        '11212112112121111111211112',  # 1967
+        '12212112212121111121221112',  # 1968
+        '11111101111110000010111111',  # 1969
+        '11111111111111111011111111',  # 1970
+        '11212112112121111111211112',  # 1971
+        '12212112212121111121221112',  # 1972
+        '11101101111110000010111111',  # 1973
+        '11111111111111111011111111',  # 1974
+        '11212112112121111111211112',  # 1975
+        '11212112212121111121221112',  # 1976
+        '11101101101110000010111111',  # 1977
+        '11111111111110110011111111',  # 1978
+        '11211112112121111111111112',  # 1979
+        '11212112212121111121221112',  # 1980
+        '11101101101110000010111011',  # 1981
+        '11111111111110110010111111',  # 1982
+        '11111112112111111111111111',  # 1983
+        '11212112112121111121211112',  # 1984
+        '11101101101110000010111011',  # 1985
+        '11111111111110110010111111',  # 1986
+        '11111111112111111011111111',  # 1987
+        '11212112112121111111211112',  # 1988
+        '01101101101010000010111001',  # 1989
+        '11111101111110110010111111',  # 1990
+        '11111111111111111011111111',  # 1991
+        '11212112112121111111211112',  # 1992
+        '01101101101010000010110001',  # 1993
+        '11111101111110000010111111',  # 1994
+        '11111111111111111011111111',  # 1995
+        '11212112112121111111211112',  # 1996
+        '01101001101010000010110001',  # 1997
+        '11111101111110000010111111',  # 1998
+        '11111111111111111011111111',  # 1999
+        '11212112112121111111211112',  # 2000
+        '01101001101010000010110001',  # 2001
+        '11111101111110000010111111',  # 2002
+        '11111111111111111011111111',  # 2003
+        '11212112112121111111211112',  # 2004
+        '01101001101010000010110001',  # 2005
+        '11101101101110000010111111',  # 2006
+        '11111111111111111011111111',  # 2007
+        '11211112112111111111211111',  # 2008
+        '00101001101010000010110001',  # 2009
+        '11101101101110000010111111',  # 2010
+        '11111111111110110011111111',  # 2011
+        '11211112112111111111211111',  # 2012
+        '00101001001010000010110001',  # 2013
+        '11101101101110000010111011',  # 2014
+        '11111111111110110011111111',  # 2015
+        '11111111112111111111111111',  # 2016
+        '00101001001010000010100001',  # 2017
+        '11101101101110000010111011',  # 2018
+        '11111101111110110010111111',  # 2019
+        '11111111111111111111111111',  # 2020
+        '00101001001010000000100001',  # 2021
+        '01101101101010000010111001',  # 2022
+        '11111101111110110010111111',  # 2023
+        '11111111111111111011111111',  # 2024
+        '00101001001010000000100001',  # 2025
+        '01101001101010000010110001',  # 2026
+        '11111101111110000010111111',  # 2027
+        '11111111111111111011111111',  # 2028
+        '00101001001010000000100001',  # 2029
+        '01101001101010000010110001',  # 2030
+        '11111101111110000010111111',  # 2031
+        '11111111111111111011111111',  # 2032
+        '00101001001010000000100001',  # 2033
+        '01101001101010000010110001',  # 2034
+        '11101101101110000010111111',  # 2035
+        '11111111111111111011111111',  # 2036
+        '00101001001010000000100001',  # 2037
+        '01101001101010000010110001',  # 2038
+        '11101101101110000010111111',  # 2039
+        '11111111111110111011111111',  # 2040
+        '00100001001000000000100000',  # 2041
+        '00101001001010000010110001',  # 2042
+        '11101101101110000010111111',  # 2043
+        '11111111111110111011111111',  # 2044
+        '00000000001000000000100000',  # 2045
+        '00101001001010000010110001',  # 2046
+        '11101101101110000010111011',  # 2047
+        '11111101111110110011111111',  # 2048
+        '00000000000000000000000000',  # 2049
+        '00101001001010000010100001',  # 2050
+        '01101101101010000010111001',  # 2051
+        '11111101111110110010111111',  # 2052
+    ),
+    'Asia/Tokyo': (
+        '11011111111111111011011111',  # 1900
+        '11112111111121111111111112',  # 1901
+        '12112211211121111121121112',  # 1902
+        '22122211221221111121122222',  # 1903
+        '22122221221222222122122222',  # 1904
+        '11112111111121111111111112',  # 1905
+        '12112211211121111121121112',  # 1906
+        '22122211221221111121122222',  # 1907
+        '22122221221222222122122222',  # 1908
+        '11112111111121111111111112',  # 1909
+        '12112111211121111121121112',  # 1910
+        '22122211221221111121122222',  # 1911
+        '22122221221222222122122222',  # 1912
+        '11112111111121111111111112',  # 1913
+        '12112111211121111121121112',  # 1914
+        '22112211221221111121122222',  # 1915
+        '22122221221221221122122222',  # 1916
+        '11112111111111111111011111',  # 1917
+        '11112111211121111121111112',  # 1918
+        '22112211211221111121122122',  # 1919
+        '22122221221221221121122222',  # 1920
+        '11112111111111111111011111',  # 1921
+        '11112111211121111111111112',  # 1922
+        '22112211211221111121122122',  # 1923
+        '22122221221221221121122222',  # 1924
+        '11011111111111111011011111',  # 1925
+        '11112111211121111111111112',  # 1926
+        '12112211211221111121122112',  # 1927
+        '22122221221221221121122222',  # 1928
+        '11011111111111111011011111',  # 1929
+        '11112111111121111111111112',  # 1930
+        '12112211211221111121121112',  # 1931
+        '22122221221221111121122222',  # 1932
+        '11011110110111111011011111',  # 1933
+        '11112111111121111111111112',  # 1934
+        '12112211211121111121121112',  # 1935
+        '22122211221221111121122222',  # 1936
+        '11011110110111111011011111',  # 1937
+        '11112111111121111111111112',  # 1938
+        '12112111211121111121121112',  # 1939
+        '22122211221221111121122222',  # 1940
+        '11011110110111111011011111',  # 1941
+        '11112111111121111111111112',  # 1942
+        '12112111211121111121121112',  # 1943
+        '22122211221221111121122222',  # 1944
+        '11011110110111111011011111',  # 1945
+        '11112111111121111111111112',  # 1946
+        '12112111211121111121121112',  # 1947
+        '22122211221221111121122222',  # 1948
+        '11011110110111111011011111',  # 1949
+        '11112111111111111111011111',  # 1950
+        '11112111211121111121121112',  # 1951
+        '22112211211221111121122122',  # 1952
+        '11011110110110110010011111',  # 1953
+        '11111111111111111111011111',  # 1954
+        '11112111211121111121111112',  # 1955
+        '22112211211221111121122122',  # 1956
+        '11011110110110110010011111',  # 1957
+        '11011111111111111011011111',  # 1958
+        '11112111111121111111111112',  # 1959
+        '12112211211221111121122112',  # 1960
+        '11011110110110110010011111',  # 1961
+        '11011110111111111011011111',  # 1962
+        '11112111111121111111111112',  # 1963
+        '12112211211121111121121112',  # 1964
+        '11011100110110100010011111',  # 1965
+        '11011110110111111011011111',  # 1966
+        '11112111111121111111111112',  # 1967
+        '12112211211121111121121112',  # 1968
+        '11011100110110000010011111',  # 1969
+        '11011110110111111011011111',  # 1970
+        '11112111111121111111111112',  # 1971
+        '12112111211121111121121112',  # 1972
+        '11011100110110000010011111',  # 1973
+        '11011110110111111011011111',  # 1974
+        '11112111111121111111111112',  # 1975
+        '12112111211121111121121112',  # 1976
+        '11011100110110000010011111',  # 1977
+        '11011110110111111011011111',  # 1978
+        '11112111111121111111111112',  # 1979
+        '12112111211121111121121112',  # 1980
+        '11001100100110000010011111',  # 1981
+        '11011110110110111011011111',  # 1982
+        '11111111111111111111111111',  # 1983
+        '11112111211121111121121112',  # 1984
+        '11001100100110000010011111',  # 1985
+        '11011110110110110011011111',  # 1986
+        '11011111111111111111011111',  # 1987
+        '11112111111121111121111112',  # 1988
+        '11001100100110000010011011',  # 1989
+        '11011110110110110010011111',  # 1990
+        '11011110111111111011011111',  # 1991
+        '11112111111121111111111112',  # 1992
+        '01001100100010000010011001',  # 1993
+        '11011100110110110010011111',  # 1994
+        '11011110110111111011011111',  # 1995
+        '11112111111121111111111112',  # 1996
+        '01001100100010000010010001',  # 1997
+        '11011100110110010010011111',  # 1998
+        '11011110110111111011011111',  # 1999
+        '11112111111121111111111112',  # 2000
+        '01001000100010000010010001',  # 2001
+        '11011100110110000010011111',  # 2002
+        '11011110110111111011011111',  # 2003
+        '11112111111121111111111112',  # 2004
+        '01001000100010000010010001',  # 2005
+        '11011100110110000010011111',  # 2006
+        '11011110110111111011011111',  # 2007
+        '11112111111121111111111112',  # 2008
+        '01001000100010000010010001',  # 2009
+        '11001100100110000010011111',  # 2010
+        '11011110110111111011011111',  # 2011
+        '11112111111111111111111111',  # 2012
+        '00001000100010000010010001',  # 2013
+        '11001100100110000010011111',  # 2014
+        '11011110110110111011011111',  # 2015
+        '11111111111111111111111111',  # 2016
+        '00001000100010000010010001',  # 2017
+        '11001100100110000010011111',  # 2018
+        '11011110110110110011011111',  # 2019
+        '11011111111111111111011111',  # 2020
+        '00001000000010000010000001',  # 2021
+        '11001100100110000010011011',  # 2022
+        '11011100110110110010011111',  # 2023
+        '11011110110111111111011111',  # 2024
+        '00001000000010000000000001',  # 2025
+        '01001100100010000010011001',  # 2026
+        '11011100110110110010011111',  # 2027
+        '11011110110111111011011111',  # 2028
+        '00001000000010000000000001',  # 2029
+        '01001000100010000010010001',  # 2030
+        '11011100110110000010011111',  # 2031
+        '11011110110111111011011111',  # 2032
+        '00001000000010000000000001',  # 2033
+        '01001000100010000010010001',  # 2034
+        '11011100110110000010011111',  # 2035
+        '11011110110111111011011111',  # 2036
+        '00001000000010000000000001',  # 2037
+        '01001000100010000010010001',  # 2038
+        '11011100110110000010011111',  # 2039
+        '11011110110111111011011111',  # 2040
+        '00001000000010000000000001',  # 2041
+        '01001000100010000010010001',  # 2042
+        '11001100100110000010011111',  # 2043
+        '11011110110111111011011111',  # 2044
+        '00000000000000000000000000',  # 2045
+        '00001000100010000010010001',  # 2046
+        '11001100100110000010011111',  # 2047
+        '11011110110110111011011111',  # 2048
+        '00000000000000000000000000',  # 2049
+        '00001000000010000010010001',  # 2050
+        '11001100100110000010011111',  # 2051
+        '11011110110110110011011111',  # 2052
+    ),
+}
@@ -0,0 +1,227 @@
+"""
+Holiday bitmaps.
+
+A bitmap file stores, for each calendar of the ISO registry, two bitsets with
+one bit per day over a range of years: one for the holidays, one for the
+working days. Build it using :func:`export_bitmap` (or
+``python -m workalendar.bitmap <path>``).
+
+The file is memory-mapped by :class:`BitmapCalendar`, so processes reading
+the same file share one copy of it.
+
+File layout (little-endian):
+
+* header: magic string, offset and length of the metadata,
+* bitmaps: two per calendar (holidays, then working days), bit ``n`` of byte
+  ``n // 8`` is set if the ``n``-th day of the range is a holiday (resp. a
+  working day),
+* metadata: JSON document, with the range of days, and the calendars
+  (ISO code, bitmaps offset, weekend days, years that couldn't be computed).
+"""
+import warnings
+from datetime import date
+from threading import Lock
+
+from .core import cleaned_date
+from .datafile import (
+    DEFAULT_FIRST_YEAR, DEFAULT_LAST_YEAR, HEADER,
+    class_path, get_parser, open_data_file, write_data_file
+)
+from .exceptions import CalendarError
+
+MAGIC = b'WKBITMP1'
+
+
+def export_bitmap(path, first_year=DEFAULT_FIRST_YEAR,
+                  last_year=DEFAULT_LAST_YEAR, iso_codes=None):
+    """
+    Compute the holidays and working days of the registry calendars and
+    store them as bitmaps.
+
+    By default, all the calendars of the ISO registry (with their subregions)
+    are stored. ``iso_codes`` restricts it to the given codes.
+    """
+    from .registry import registry
+    calendars = registry.get_calendars(
+        iso_codes, include_subregions=not iso_codes)
+
+    first_day = date(first_year, 1, 1).toordinal()
+    day_count = date(last_year, 12, 31).toordinal() - first_day + 1
+    bitmap_size = (day_count + 7) // 8
+    bitmaps = []
+    metadata = {
+        'first_day': first_day,
+        'day_count': day_count,
+        'calendars': {},
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for iso_code, cls in sorted(calendars.items()):
+            calendar = cls()
+            weekend_days = calendar.get_weekend_days()
+            holidays_bitmap = bytearray(bitmap_size)
+            working_days_bitmap = bytearray(bitmap_size)
+            missing_years = []
+            for year in range(first_year, last_year + 1):
+                try:
+                    holidays = calendar.holidays_set(year)
+                    start = date(year, 1, 1).toordinal()
+                    end = date(year, 12, 31).toordinal()
+                    if calendar._use_working_days_table():
+                        working_days = [
+                            ordinal for ordinal in range(start, end + 1)
+                            # date.fromordinal(1) is a Monday
+                            if (ordinal - 1) % 7 not in weekend_days
+                        ]
+                        working_days = set(working_days).difference(
+                            day.toordinal() for day in holidays)
+                    else:
+                        # Custom ``is_working_day()`` rules
+                        working_days = [
+                            ordinal for ordinal in range(start, end + 1)
+                            if calendar.is_working_day(
+                                date.fromordinal(ordinal))
+                        ]
+                except Exception:
+                    missing_years.append(year)
+                    continue
+                for day in holidays:
+                    # Same as ``is_holiday()``: only the holidays of the year
+                    if day.year != year:
+                        continue
+                    position = day.toordinal() - first_day
+                    holidays_bitmap[position >> 3] |= 1 << (position & 7)
+                for ordinal in working_days:
+                    position = ordinal - first_day
+                    working_days_bitmap[position >> 3] |= 1 << (position & 7)
+            metadata['calendars'][iso_code] = {
+                'class': class_path(cls),
+                'holidays_offset': HEADER.size + len(bitmaps) * bitmap_size,
+                'working_days_offset': (
+                    HEADER.size + (len(bitmaps) + 1) * bitmap_size),
+                'weekend_days': list(weekend_days),
+                'missing_years': missing_years,
+            }
+            bitmaps.extend((holidays_bitmap, working_days_bitmap))
+
+    write_data_file(path, MAGIC, bitmaps, metadata)
+
+
+class HolidayBitmap:
+    """
+    Read-only access to a bitmap file, memory-mapped.
+    """
+
+    def __init__(self, path):
+        self._mmap, metadata = open_data_file(
+            path, MAGIC, 'holidays bitmap')
+        self.first_day = metadata['first_day']
+        self.day_count = metadata['day_count']
+        self.calendars = metadata['calendars']
+        for entry in self.calendars.values():
+            entry['weekend_days'] = tuple(entry['weekend_days'])
+            entry['missing_years'] = set(entry['missing_years'])
+
+    def close(self):
+        self._mmap.close()
+
+    def test(self, offset, day):
+        """
+        Return the holiday bit of the day, in the bitmap at ``offset``.
+
+        Return None if the day is out of the bitmap range.
+        """
+        position = day.toordinal() - self.first_day
+        if not 0 <= position < self.day_count:
+            return None
+        return bool(self._mmap[offset + (position >> 3)] >> (position & 7) & 1)
+
+
+_bitmaps = {}
+_bitmaps_lock = Lock()
+
+
+def open_bitmap(path):
+    """
+    Return the :class:`HolidayBitmap` for the given path, opened only once
+    per process.
+    """
+    with _bitmaps_lock:
+        if path not in _bitmaps:
+            _bitmaps[path] = HolidayBitmap(path)
+        return _bitmaps[path]
+
+
+class BitmapCalendar:
+    """
+    Calendar reading its holidays and working days from a bitmap file.
+
+    Only ``is_holiday()``, ``is_working_day()`` and ``get_weekend_days()`` are
+    provided, each day is a single bit test. Days out of the bitmap are
+    handled by the registry calendar.
+    """
+
+    def __init__(self, iso_code, path):
+        self.iso_code = iso_code
+        self.bitmap = open_bitmap(path)
+        try:
+            entry = self.bitmap.calendars[iso_code]
+        except KeyError:
+            raise CalendarError(
+                "No `{}` calendar in the bitmap `{}`".format(iso_code, path))
+        self._holidays_offset = entry['holidays_offset']
+        self._working_days_offset = entry['working_days_offset']
+        self._weekend_days = entry['weekend_days']
+        self._missing_years = entry['missing_years']
+        self._calendar = None
+
+    @property
+    def calendar(self):
+        """
+        The registry calendar, for the days out of the bitmap.
+        """
+        if self._calendar is None:
+            from .registry import registry
+            self._calendar = registry.get_calendar_class(self.iso_code)()
+        return self._calendar
+
+    def get_weekend_days(self):
+        return self._weekend_days
+
+    def _test(self, offset, day):
+        if day.year in self._missing_years:
+            return None
+        return self.bitmap.test(offset, day)
+
+    def is_holiday(self, day, extra_holidays=None):
+        """Return True if it's an holiday (see ``Calendar.is_holiday()``)"""
+        day = cleaned_date(day)
+        if extra_holidays and day in map(cleaned_date, extra_holidays):
+            return True
+        holiday = self._test(self._holidays_offset, day)
+        if holiday is None:
+            return self.calendar.is_holiday(day)
+        return holiday
+
+    def is_working_day(self, day,
+                       extra_working_days=None, extra_holidays=None):
+        """Return True if it's a working day (see
+        ``Calendar.is_working_day()``)"""
+        day = cleaned_date(day)
+        if (extra_working_days
+                and day in map(cleaned_date, extra_working_days)):
+            return True
+        if extra_holidays and day in map(cleaned_date, extra_holidays):
+            return False
+        working_day = self._test(self._working_days_offset, day)
+        if working_day is None:
+            return self.calendar.is_working_day(day)
+        return working_day
+
+
+if __name__ == '__main__':
+    parser = get_parser(
+        "Export the holidays of the registry as bitmaps.",
+        "Path of the bitmap file to write")
+    args = parser.parse_args()
+    export_bitmap(args.path, args.first_year, args.last_year, args.iso_codes)
@@ -0,0 +1,135 @@
+"""
+Holiday caches
+"""
+from collections import namedtuple, OrderedDict
+from threading import Lock, RLock
+
+_MISSING = object()
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class HolidayCache(OrderedDict):
+    """
+    Thread-safe cache of the values computed by a calendar, per year.
+
+    * If ``maxsize`` is set, the least recently used years are evicted when
+      the cache grows over ``maxsize`` years.
+    * Concurrent computations of the same year are run only once: other
+      threads wait for the result.
+
+    It's a ``dict`` (year -> value), so it can be read as one.
+    """
+
+    def __init__(self, maxsize=None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = RLock()
+        # year -> Lock, for the years being computed
+        self._pending = {}
+
+    def get_or_compute(self, year, compute):
+        """
+        Return the cached value for the year, computing it using
+        ``compute(year)`` if it's not in the cache.
+        """
+        if self.maxsize is None:
+            # Unbounded cache: no LRU order to maintain, the hits are read
+            # without the lock (the hits count may be approximate).
+            value = self.get(year, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+        with self._lock:
+            if year in self:
+                self.hits += 1
+                self.move_to_end(year)
+                return self[year]
+            self.misses += 1
+            year_lock = self._pending.setdefault(year, RLock())
+
+        with year_lock:
+            # Another thread may have computed it while we were waiting
+            with self._lock:
+                if year in self:
+                    self.move_to_end(year)
+                    return self[year]
+            try:
+                value = compute(year)
+            except BaseException:
+                with self._lock:
+                    self._pending.pop(year, None)
+                raise
+            # Stored and released at once, so that no caller can find
+            # neither the value nor the pending computation.
+            with self._lock:
+                self[year] = value
+                self._evict()
+                self._pending.pop(year, None)
+        return value
+
+    def put(self, year, value):
+        """
+        Store a value computed elsewhere (e.g. in another process).
+        """
+        with self._lock:
+            self[year] = value
+            self.move_to_end(year)
+            self._evict()
+
+    def _evict(self):
+        if self.maxsize is None:
+            return
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def __reduce__(self):
+        # Locks can't be pickled, statistics are reset.
+        return (self.__class__, (self.maxsize,), None, None,
+                iter(list(self.items())))
+
+    def invalidate(self, year=None):
+        """
+        Remove the given year from the cache, or all the years if ``None``.
+        """
+        with self._lock:
+            if year is None:
+                self.clear()
+            else:
+                self.pop(year, None)
+
+    def info(self):
+        """
+        Return the cache statistics, like ``functools.lru_cache``.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+# Process-wide caches, shared by calendar instances with the same
+# configuration (see ``get_shared_cache()``).
+_shared_caches = {}
+_shared_caches_lock = Lock()
+
+
+def get_shared_cache(key, cache_class=HolidayCache, maxsize=None):
+    """
+    Return the process-wide cache for the given ``key``.
+
+    The cache is created using ``cache_class(maxsize=maxsize)`` the first time
+    the key is requested.
+    """
+    with _shared_caches_lock:
+        if key not in _shared_caches:
+            _shared_caches[key] = cache_class(maxsize=maxsize)
+        return _shared_caches[key]
+
+
+def clear_shared_caches():
+    """
+    Drop all the process-wide caches.
+    """
+    with _shared_caches_lock:
+        _shared_caches.clear()
@@ -1,19 +1,84 @@
 """
 Working day tools
 """
+from bisect import bisect_left
 from copy import copy
 import warnings
-from calendar import monthrange
-from datetime import date, timedelta, datetime
-
-from calverter import Calverter
-from dateutil import easter
-from lunardate import LunarDate
+from calendar import isleap, monthrange
+from datetime import date, timedelta, datetime, MINYEAR, MAXYEAR
+from functools import lru_cache
+from itertools import accumulate
 
+from . import instrumentation, lunar_data
+from .cache import HolidayCache, get_shared_cache
 from .exceptions import UnsupportedDateType
 
 MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
 
+# Easter computation methods, same values as in ``dateutil.easter``.
+# Third-party libraries (dateutil, lunardate, calverter) are only imported
+# when they're actually needed, to keep ``import workalendar`` light.
+EASTER_JULIAN, EASTER_ORTHODOX, EASTER_WESTERN = range(1, 4)
+
+# Without an end date, ``Calendar.iter_holidays()`` stops after this number of
+# consecutive years without holidays.
+ITER_HOLIDAYS_MAX_EMPTY_YEARS = 10
+
+
+def _nth_weekday_from(day, month, weekday, n):
+    """
+    Return the ``n``-th ``weekday`` from ``day`` (included), or None if it's
+    not in ``month``.
+    """
+    if day.month != month or n < 0:
+        return None
+    if n == 0:
+        return day
+    delta = (weekday - day.weekday()) % 7 + 7 * (n - 1)
+    if day.day + delta > monthrange(day.year, month)[1]:
+        # "n" is too big
+        return None
+    return day + timedelta(days=delta)
+
+
+@lru_cache(maxsize=4096)
+def _nth_weekday_in_month(year, month, weekday, n):
+    return _nth_weekday_from(date(year, month, 1), month, weekday, n)
+
+
+@lru_cache(maxsize=4096)
+def _last_weekday_in_month(year, month, weekday):
+    day = date(year, month, monthrange(year, month)[1])
+    return day - timedelta(days=(day.weekday() - weekday) % 7)
+
+
+@lru_cache(maxsize=4096)
+def _easter_sunday(year, method):
+    # Memoised process-wide: every Easter-based holiday needs it
+    from dateutil import easter
+    return easter.easter(year, method)
+
+
+@lru_cache(maxsize=None)
+def _lunar_months(year):
+    """
+    Return the (first day ordinal, length) of the 12 regular months of the
+    Chinese lunar year, or None if the year is not in ``lunar_data``.
+    """
+    if not lunar_data.FIRST_YEAR <= year <= lunar_data.LAST_YEAR:
+        return None
+    row = lunar_data.YEARS[year - lunar_data.FIRST_YEAR]
+    first_day = date(year, 1, 1).toordinal() + int(row[:2]) - 1
+    leap_month = int(row[2:4])
+    months = []
+    for index, is_long in enumerate(row[4:]):
+        length = 30 if is_long == '1' else 29
+        # The leap month follows the regular month with the same number
+        if not leap_month or index != leap_month:
+            months.append((first_day, length))
+        first_day += length
+    return tuple(months)
+
 
 class classproperty:
 
@@ -42,13 +107,104 @@ def cleaned_date(day, keep_datetime=False):
     return day
 
 
+def cleaned_date_array(dates, keep_datetime=False):
+    """
+    Return a "clean" NumPy ``datetime64`` array.
+
+    * convert a ``datetime64`` array (or pandas Series / Index) to a day
+      resolution,
+    * convert any other iterable using :func:`cleaned_date` on each item.
+
+    A single date (or ``datetime64``) gives a 0-d array, that NumPy
+    broadcasts against arrays.
+
+    If ``keep_datetime`` is True, the original resolution (and time of the
+    day) is kept.
+
+    NumPy is required by this function.
+    """
+    import numpy
+    if isinstance(dates, (date, numpy.datetime64)):
+        return cleaned_date_array([dates], keep_datetime).reshape(())
+    if not hasattr(dates, '__len__'):
+        dates = list(dates)
+    array = numpy.asarray(dates)
+    if array.dtype.kind == 'M':
+        if keep_datetime:
+            return array
+        return array.astype('datetime64[D]')
+    cleaned = [cleaned_date(day, keep_datetime) for day in array.ravel()]
+    if keep_datetime:
+        # Let NumPy pick the resolution: days for dates, us for datetimes
+        cleaned = numpy.array(cleaned, dtype='datetime64')
+    else:
+        cleaned = numpy.array(cleaned, dtype='datetime64[D]')
+    return cleaned.reshape(array.shape)
+
+
 class Calendar:
 
     FIXED_HOLIDAYS = ()
     WEEKEND_DAYS = ()
+    # Cache class for the computed years, and the maximum number of years
+    # kept in it (``None`` for no limit).
+    holidays_cache_class = HolidayCache
+    holidays_cache_maxsize = None
+    # If True, the caches are shared by all the instances of the same class
+    # with the same configuration, in the whole process.
+    share_holidays_cache = False
+    # Executor running the holidays computations of the async methods
+    # (``aholidays()``...), ``None`` for the default executor of the loop.
+    holidays_executor = None
 
     def __init__(self):
-        self._holidays = {}
+        shared_key = None
+        if self.share_holidays_cache:
+            shared_key = (type(self), self._get_configuration())
+        self._holidays = self._new_holidays_cache(
+            'holidays', shared_key)
+        self._holiday_index = self._new_holidays_cache(
+            'holiday_index', shared_key)
+        self._working_days_table = self._new_holidays_cache(
+            'working_days_table', shared_key)
+        # (event loop, year) -> future, for the years being computed by the
+        # async methods
+        self._pending_years = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The pending computations belong to their event loop
+        state['_pending_years'] = {}
+        return state
+
+    def _new_holidays_cache(self, kind, shared_key=None):
+        if shared_key:
+            return get_shared_cache(
+                (kind,) + shared_key,
+                self.holidays_cache_class, self.holidays_cache_maxsize)
+        return self.holidays_cache_class(maxsize=self.holidays_cache_maxsize)
+
+    def _get_configuration(self):
+        """Return the public class attributes, as a hashable tuple.
+
+        These attributes (``include_*`` flags, labels, ``FIXED_HOLIDAYS``...)
+        define the holidays computed by the calendar, they're used to identify
+        the shared caches.
+        """
+        cls = type(self)
+        configuration = []
+        for name in dir(cls):
+            if name.startswith('_'):
+                continue
+            value = getattr(cls, name)
+            if callable(value):
+                continue
+            try:
+                hash(value)
+            except TypeError:
+                continue
+            configuration.append((name, value))
+        return tuple(configuration)
 
     @classproperty
     def name(cls):
@@ -74,33 +230,147 @@ class Calendar:
         """Get calendar holidays.
         If you want to override this, please make sure that it **must** return
         a list of tuples (date, holiday_name)."""
-        return self.get_fixed_holidays(year) + self.get_variable_days(year)
+        get_fixed_holidays = self.get_fixed_holidays
+        get_variable_days = self.get_variable_days
+        if instrumentation.enabled:
+            get_fixed_holidays = instrumentation.timed(
+                self, 'get_fixed_holidays', get_fixed_holidays)
+            get_variable_days = instrumentation.timed(
+                self, 'get_variable_days', get_variable_days)
+        return get_fixed_holidays(year) + get_variable_days(year)
 
     def holidays(self, year=None):
         """Computes holidays (non-working days) for a given year.
         Return a 2-item tuple, composed of the date and a label."""
         if not year:
             year = date.today().year
-
-        if year in self._holidays:
-            return self._holidays[year]
+        compute = self._compute_holidays
+        if instrumentation.enabled:
+            instrumentation.count(self, 'holidays_calls')
+            # Only called on cache misses
+            compute = instrumentation.timed(self, 'holidays', compute)
+        return self._holidays.get_or_compute(year, compute)
+
+    def _compute_holidays(self, year):
+        # Precomputed holidays, if a database is in use
+        from .database import get_database
+        database = get_database()
+        if database is not None:
+            holidays = database.get_calendar_holidays(self, year)
+            if holidays is not None:
+                return holidays
 
         # Here we process the holiday specific calendar
-        temp_calendar = tuple(self.get_calendar_holidays(year))
-
+        get_calendar_holidays = self.get_calendar_holidays
+        if instrumentation.enabled:
+            get_calendar_holidays = instrumentation.timed(
+                self, 'get_calendar_holidays', get_calendar_holidays)
+        temp_calendar = tuple(get_calendar_holidays(year))
         # it is sorted
-        self._holidays[year] = sorted(temp_calendar)
-        return self._holidays[year]
+        return sorted(temp_calendar)
+
+    def precompute(self, years):
+        """Compute the holidays of the given years in advance.
+
+        The holidays, and the indexes used by :meth:`is_holiday` and the
+        working days computations, are kept in the caches of the calendar.
+        Use it to warm up a calendar, e.g. before serving requests.
+        """
+        for year in years:
+            self._get_holiday_index(year)
+            if self._use_working_days_table():
+                self._get_working_days_table(year)
+
+    async def _aget_holiday_index(self, year):
+        """Return the holiday index of the year, computing it in the
+        ``holidays_executor`` if it's not in the cache.
+
+        Concurrent calls for the same year share the same computation.
+        """
+        import asyncio
+        if year in self._holiday_index:
+            return self._get_holiday_index(year)
+        loop = asyncio.get_event_loop()
+        key = (loop, year)
+        future = self._pending_years.get(key)
+        if future is None:
+            future = loop.run_in_executor(
+                self.holidays_executor, self._get_holiday_index, year)
+            self._pending_years[key] = future
+            future.add_done_callback(
+                lambda _: self._pending_years.pop(key, None))
+        # Cancelling a caller doesn't cancel the computation of the others
+        return await asyncio.shield(future)
+
+    async def aholidays(self, year=None):
+        """Async version of :meth:`holidays`.
+
+        The holidays of a year that is not in the cache are computed in the
+        ``holidays_executor``, so that the event loop isn't blocked.
+        """
+        if not year:
+            year = date.today().year
+        await self._aget_holiday_index(year)
+        return self.holidays(year)
+
+    async def ais_holiday(self, day, extra_holidays=None):
+        """Async version of :meth:`is_holiday`."""
+        day = cleaned_date(day)
+        await self._aget_holiday_index(day.year)
+        return self.is_holiday(day, extra_holidays=extra_holidays)
+
+    async def ais_working_day(self, day,
+                              extra_working_days=None, extra_holidays=None):
+        """Async version of :meth:`is_working_day`."""
+        day = cleaned_date(day)
+        await self._aget_holiday_index(day.year)
+        return self.is_working_day(
+            day, extra_working_days=extra_working_days,
+            extra_holidays=extra_holidays)
+
+    def holidays_cache_info(self):
+        """Return the statistics of the holidays cache.
+
+        It's a ``(hits, misses, maxsize, currsize)`` named tuple.
+        """
+        return self._holidays.info()
+
+    def _get_holiday_index(self, year):
+        """Return the (date set, date -> label map) index for the given year.
+
+        The index is built once per year from :meth:`holidays` and kept
+        until :meth:`clear_holidays_cache` is called.
+        """
+        return self._holiday_index.get_or_compute(
+            year, self._compute_holiday_index)
+
+    def _compute_holiday_index(self, year):
+        holidays = self.holidays(year)
+        return (
+            frozenset(day for day, label in holidays),
+            {day: label for day, label in holidays},
+        )
+
+    def clear_holidays_cache(self, year=None):
+        """Invalidate the computed holidays and their indexes.
+
+        If ``year`` is given, only this year is invalidated. Subclasses that
+        change their holiday rules after computation should call this method.
+        """
+        self._holidays.invalidate(year)
+        self._holiday_index.invalidate(year)
+        self._working_days_table.invalidate(year)
 
     def get_holiday_label(self, day):
         """Return the label of the holiday, if the date is a holiday"""
         day = cleaned_date(day)
-        return {day: label for day, label in self.holidays(day.year)
-                }.get(day)
+        return self._get_holiday_index(day.year)[1].get(day)
 
     def holidays_set(self, year=None):
-        "Return a quick date index (set)"
-        return set([day for day, label in self.holidays(year)])
+        "Return a quick date index (frozenset)"
+        if not year:
+            year = date.today().year
+        return self._get_holiday_index(year)[0]
 
     def get_weekend_days(self):
         """Return a list (or a tuple) of weekdays that are *not* working days.
@@ -130,6 +400,8 @@ class Calendar:
         ``extra_holidays`` list.
 
         """
+        if instrumentation.enabled:
+            instrumentation.count(self, 'is_working_day_calls')
         day = cleaned_date(day)
         if extra_working_days:
             extra_working_days = tuple(map(cleaned_date, extra_working_days))
@@ -164,6 +436,269 @@ class Calendar:
 
         return day in self.holidays_set(day.year)
 
+    def _get_holiday_array(self, years):
+        """Return the sorted holidays of the given years, as day numbers.
+
+        Day numbers are the number of days since 1970-01-01, like the
+        ``datetime64[D]`` NumPy type.
+        """
+        import numpy
+        holidays = []
+        for year in years:
+            # Same as ``is_holiday()``: only the holidays of the year
+            holidays.extend(
+                day for day in self.holidays_set(year) if day.year == year)
+        holidays = numpy.array(sorted(holidays), dtype='datetime64[D]')
+        return holidays.astype('int64')
+
+    def is_working_day_array(self, dates,
+                             extra_working_days=None, extra_holidays=None):
+        """Return a boolean NumPy array, True for the working days.
+
+        ``dates`` is either a NumPy ``datetime64`` array (or a pandas Series)
+        or an iterable of dates. The result has the same shape. Missing dates
+        (``NaT``) are not working days.
+
+        The ``extra_working_days`` and ``extra_holidays`` arguments have the
+        same meaning as in :meth:`is_working_day`.
+
+        NumPy is required by this method.
+        """
+        import numpy
+        days = cleaned_date_array(dates)
+        missing = numpy.isnat(days)
+        if missing.any():
+            result = numpy.zeros(days.shape, dtype=bool)
+            result[~missing] = self.is_working_day_array(
+                days[~missing], extra_working_days=extra_working_days,
+                extra_holidays=extra_holidays)
+            return result
+        if not self._use_working_days_table():
+            # Custom ``is_working_day()`` rules, no shortcut here.
+            result = [
+                self.is_working_day(
+                    day, extra_working_days=extra_working_days,
+                    extra_holidays=extra_holidays)
+                for day in days.ravel().tolist()
+            ]
+            return numpy.array(result, dtype=bool).reshape(days.shape)
+
+        day_numbers = days.astype('int64')
+        # 1970-01-01 is a Thursday
+        weekdays = (day_numbers + THU) % 7
+        result = ~numpy.isin(weekdays, list(self.get_weekend_days()))
+
+        years = numpy.unique(days.astype('datetime64[Y]').astype('int64'))
+        holidays = self._get_holiday_array(int(y) + 1970 for y in years)
+        if len(holidays):
+            positions = numpy.searchsorted(holidays, day_numbers)
+            positions = numpy.minimum(positions, len(holidays) - 1)
+            result &= holidays[positions] != day_numbers
+
+        if extra_holidays:
+            extra_holidays = cleaned_date_array(extra_holidays)
+            result &= ~numpy.isin(days, extra_holidays)
+        if extra_working_days:
+            extra_working_days = cleaned_date_array(extra_working_days)
+            result |= numpy.isin(days, extra_working_days)
+        return result
+
+    def _get_working_days_array(self, first_year, last_year,
+                                extra_working_days=None, extra_holidays=None):
+        """Return the cumulative working days of a range of years.
+
+        Return a ``(first_day, table)`` tuple: ``first_day`` is January 1st of
+        ``first_year`` as a day number (see :meth:`_get_holiday_array`), and
+        ``table[n]`` is the number of working days among the ``n`` first days
+        of the range.
+        """
+        import numpy
+        first_day = numpy.datetime64('{:04d}-01-01'.format(first_year), 'D')
+        if (not extra_working_days and not extra_holidays
+                and self._use_working_days_table()):
+            # Concatenate the per-year tables
+            parts = [numpy.zeros(1, dtype='int64')]
+            offset = 0
+            for year in range(first_year, last_year + 1):
+                table = self._get_working_days_table(year)
+                parts.append(numpy.array(table[1:], dtype='int64') + offset)
+                offset += table[-1]
+            table = numpy.concatenate(parts)
+        else:
+            last_day = numpy.datetime64(
+                '{:04d}-01-01'.format(last_year + 1), 'D')
+            working_days = self.is_working_day_array(
+                numpy.arange(first_day, last_day),
+                extra_working_days=extra_working_days,
+                extra_holidays=extra_holidays)
+            table = numpy.concatenate(([0], numpy.cumsum(working_days)))
+        return first_day.astype('int64'), table
+
+    def add_working_days_array(self, dates, deltas,
+                               extra_working_days=None, extra_holidays=None,
+                               keep_datetime=False):
+        """Add ``deltas`` working days to each date of the ``dates`` array.
+
+        ``dates`` is either a NumPy ``datetime64`` array (or a pandas Series)
+        or an iterable of dates; ``deltas`` is an integer or an array of
+        integers (positive or negative) of the same shape.
+
+        Return a NumPy ``datetime64[D]`` array. If ``keep_datetime`` is True,
+        the resolution and the time of the day of ``dates`` are kept. Missing
+        dates (``NaT``) stay missing.
+
+        Other arguments have the same meaning as in :meth:`add_working_days`.
+
+        NumPy is required by this method.
+        """
+        import numpy
+        originals = cleaned_date_array(dates, keep_datetime)
+        if numpy.isnat(originals).any():
+            originals, deltas = numpy.broadcast_arrays(
+                originals, numpy.asarray(deltas, dtype='int64'))
+            missing = numpy.isnat(originals)
+            dtype = originals.dtype if keep_datetime else 'datetime64[D]'
+            results = numpy.full(originals.shape, 'NaT', dtype=dtype)
+            results[~missing] = self.add_working_days_array(
+                originals[~missing], deltas[~missing],
+                extra_working_days=extra_working_days,
+                extra_holidays=extra_holidays, keep_datetime=keep_datetime)
+            return results
+        days, deltas = numpy.broadcast_arrays(
+            originals.astype('datetime64[D]').astype('int64'),
+            numpy.asarray(deltas, dtype='int64'))
+        if not days.size:
+            return originals.astype('datetime64[D]')
+
+        years = days.astype('datetime64[D]').astype('datetime64[Y]')
+        first_year = int(years.min().astype('int64')) + 1970
+        last_year = int(years.max().astype('int64')) + 1970
+        while True:
+            first_day, table = self._get_working_days_array(
+                first_year, last_year,
+                extra_working_days=extra_working_days,
+                extra_holidays=extra_holidays)
+            # Rank of the resulting working day in the table
+            positions = days - first_day
+            ranks = numpy.where(
+                deltas >= 0,
+                table[positions + 1] + deltas,
+                table[positions] + deltas + 1)
+            # Extend the range of years if some results are out of it
+            moved_ranks = ranks[deltas != 0]
+            missing_before = 1 - min(moved_ranks.min(initial=1), 1)
+            missing_after = max(moved_ranks.max(initial=0), table[-1])
+            missing_after -= table[-1]
+            if not missing_before and not missing_after:
+                break
+            per_year = max(table[-1] // (last_year - first_year + 1), 1)
+            first_year -= -(-missing_before // per_year)
+            last_year += -(-missing_after // per_year)
+
+        results = first_day + numpy.searchsorted(table, ranks) - 1
+        results = numpy.where(deltas == 0, days, results)
+        results = results.astype('datetime64[D]')
+        if keep_datetime:
+            day_shift = results - originals.astype('datetime64[D]')
+            return originals + day_shift
+        return results
+
+    def get_working_days_delta_array(self, starts, ends, include_start=False):
+        """Return the number of working days between each pair of dates.
+
+        ``starts`` and ``ends`` are NumPy ``datetime64`` arrays (or pandas
+        Series) or iterables of dates, of the same shape, or single dates,
+        broadcast against the other argument. Return an integer NumPy array
+        of the resulting shape.
+
+        Each value is computed like :meth:`get_working_days_delta`: the order
+        of the dates doesn't matter, and ``include_start`` has the same
+        meaning. Missing dates (``NaT``) raise a ``ValueError``.
+
+        NumPy is required by this method.
+        """
+        import numpy
+        starts = cleaned_date_array(starts)
+        ends = cleaned_date_array(ends)
+        if numpy.isnat(starts).any() or numpy.isnat(ends).any():
+            raise ValueError(
+                "Can't compute working days deltas of missing dates (NaT)")
+        starts, ends = numpy.broadcast_arrays(
+            starts.astype('int64'), ends.astype('int64'))
+        if not starts.size:
+            return numpy.zeros(starts.shape, dtype='int64')
+        starts, ends = numpy.minimum(starts, ends), numpy.maximum(starts, ends)
+
+        years = starts.astype('datetime64[D]').astype('datetime64[Y]')
+        first_year = int(years.min().astype('int64')) + 1970
+        years = ends.astype('datetime64[D]').astype('datetime64[Y]')
+        last_year = int(years.max().astype('int64')) + 1970
+        first_day, table = self._get_working_days_array(first_year, last_year)
+
+        # Working days after the start day, up to the end day (included)
+        start_positions = starts - first_day + 1
+        counts = table[ends - first_day + 1] - table[start_positions]
+        if include_start:
+            counts += table[start_positions] - table[start_positions - 1]
+        return numpy.where(starts == ends, 0, counts)
+
+    def _get_working_days_table(self, year):
+        """Return the cumulative working days table for the given year.
+
+        ``table[n]`` is the number of working days among the ``n`` first
+        days of the year, so ``table[0]`` is 0 and ``table[-1]`` is the
+        number of working days in the whole year.
+        """
+        return self._working_days_table.get_or_compute(
+            year, self._compute_working_days_table)
+
+    def _compute_working_days_table(self, year):
+        holidays = self.holidays_set(year)
+        weekend_days = self.get_weekend_days()
+        first_weekday = date(year, 1, 1).weekday()
+        # 1 for each working day of the year, 0 otherwise
+        working_days = [
+            0 if (first_weekday + index) % 7 in weekend_days else 1
+            for index in range(366 if isleap(year) else 365)
+        ]
+        for day in holidays:
+            if day.year == year:
+                working_days[day.timetuple().tm_yday - 1] = 0
+        return [0] + list(accumulate(working_days))
+
+    def _use_working_days_table(self):
+        """Return True if working days can be computed using the tables.
+
+        Classes overriding ``is_working_day()`` or ``is_holiday()`` have
+        their own rules, the tables built from ``holidays()`` can't be used
+        for them.
+        """
+        cls = type(self)
+        return (cls.is_working_day is Calendar.is_working_day
+                and cls.is_holiday is Calendar.is_holiday)
+
+    def _add_working_days_indexed(self, day, delta):
+        """Add ``delta`` working days to the ``day`` date using the tables.
+        """
+        year = day.year
+        day_of_year = day.timetuple().tm_yday
+        table = self._get_working_days_table(year)
+        # Target is the rank of the resulting working day, in its year.
+        if delta >= 0:
+            target = table[day_of_year] + delta
+        else:
+            target = table[day_of_year - 1] + delta + 1
+        while target > table[-1]:
+            target -= table[-1]
+            year += 1
+            table = self._get_working_days_table(year)
+        while target <= 0:
+            year -= 1
+            table = self._get_working_days_table(year)
+            target += table[-1]
+        day_of_year = bisect_left(table, target)
+        return date(year, 1, 1) + timedelta(days=day_of_year - 1)
+
     def add_working_days(self, day, delta,
                          extra_working_days=None, extra_holidays=None,
                          keep_datetime=False):
@@ -194,6 +729,15 @@ class Calendar:
         if extra_holidays:
             extra_holidays = tuple(map(cleaned_date, extra_holidays))
 
+        if delta == 0:
+            return day
+
+        if (not extra_working_days and not extra_holidays
+                and self._use_working_days_table()):
+            start = cleaned_date(day)
+            result = self._add_working_days_indexed(start, delta)
+            return day + (result - start)
+
         days = 0
         temp_day = day
         if type(temp_day) is datetime and not keep_datetime:
@@ -265,21 +809,8 @@ class Calendar:
         # If start is `None` or Falsy, no need to check and clean
         if start:
             start = cleaned_date(start)
-
-        day = date(year, month, 1)
-        if start:
-            day = start
-        counter = 0
-        while True:
-            if day.month != month:
-                # Don't forget to break if "n" is too big
-                return None
-            if day.weekday() == weekday:
-                counter += 1
-            if counter == n:
-                break
-            day = day + timedelta(days=1)
-        return day
+            return _nth_weekday_from(start, month, weekday, n)
+        return _nth_weekday_in_month(year, month, weekday, n)
 
     @staticmethod
     def get_last_weekday_in_month(year, month, weekday):
@@ -289,12 +820,7 @@ class Calendar:
         >>> Calendar.get_last_weekday_in_month(2013, 1, MON)
         datetime.date(2013, 1, 28)
         """
-        day = date(year, month, monthrange(year, month)[1])
-        while True:
-            if day.weekday() == weekday:
-                break
-            day = day - timedelta(days=1)
-        return day
+        return _last_weekday_in_month(year, month, weekday)
 
     @staticmethod
     def get_first_weekday_after(day, weekday):
@@ -361,12 +887,139 @@ class Calendar:
 
         # Starting count here
         count = 1 if include_start and self.is_working_day(start) else 0
+
+        if self._use_working_days_table():
+            start_table = self._get_working_days_table(start.year)
+            end_table = self._get_working_days_table(end.year)
+            # Working days in the start year, after the start day
+            count += start_table[-1] - start_table[start.timetuple().tm_yday]
+            for year in range(start.year + 1, end.year + 1):
+                count += self._get_working_days_table(year)[-1]
+            # Working days in the end year, after the end day
+            count -= end_table[-1] - end_table[end.timetuple().tm_yday]
+            return count
+
         while start < end:
             start += timedelta(days=1)
             if self.is_working_day(start):
                 count += 1
         return count
 
+    @staticmethod
+    def _iter_days(start, end, reverse):
+        """Yield the days from ``start`` to ``end`` (included), or up to the
+        last (or first) supported date if ``end`` is None. Backwards if
+        ``reverse`` is True."""
+        step = timedelta(days=-1 if reverse else 1)
+        limit = date.min if reverse else date.max
+        day = start
+        while end is None or (day >= end if reverse else day <= end):
+            yield day
+            if day == limit:
+                return
+            day += step
+
+    def iter_holidays(self, start, end=None, reverse=False):
+        """Yield the ``(date, label)`` holidays from ``start`` to ``end``
+        (both included).
+
+        The holidays of each year are computed when the iteration reaches
+        it, so ``end`` may be None to iterate without limit. In this case,
+        the iteration stops after ``ITER_HOLIDAYS_MAX_EMPTY_YEARS``
+        consecutive years without holidays (e.g. for a calendar without
+        holidays), instead of looking for the next one forever, and at the
+        first (or last) year supported by ``datetime.date``.
+
+        If ``reverse`` is True, the holidays are yielded backwards, from
+        ``start`` down to ``end``.
+        """
+        start = cleaned_date(start)
+        if end is not None:
+            end = cleaned_date(end)
+        year = start.year
+        empty_years = 0
+        while MINYEAR <= year <= MAXYEAR and (end is None or (
+                year >= end.year if reverse else year <= end.year)):
+            holidays = self.holidays(year)
+            if reverse:
+                holidays = reversed(holidays)
+            empty_years += 1
+            for day, label in holidays:
+                # Same as ``is_holiday()``: only the holidays of the year
+                if day.year != year:
+                    continue
+                if (day > start) if reverse else (day < start):
+                    continue
+                if end is not None and (
+                        (day < end) if reverse else (day > end)):
+                    return
+                empty_years = 0
+                yield day, label
+            if end is None and empty_years >= ITER_HOLIDAYS_MAX_EMPTY_YEARS:
+                return
+            year += -1 if reverse else 1
+
+    def iter_working_days(self, start, end=None, reverse=False,
+                          extra_working_days=None, extra_holidays=None):
+        """Yield the working days from ``start`` to ``end`` (both included).
+
+        The holidays of each year are computed when the iteration reaches
+        it, so ``end`` may be None to iterate up to the last (or first) date
+        supported by ``datetime.date``.
+
+        If ``reverse`` is True, the working days are yielded backwards, from
+        ``start`` down to ``end``.
+
+        ``extra_working_days`` and ``extra_holidays`` have the same meaning
+        as in :meth:`is_working_day`.
+        """
+        start = cleaned_date(start)
+        if end is not None:
+            end = cleaned_date(end)
+        days = self._iter_days(start, end, reverse)
+
+        if (extra_working_days or extra_holidays
+                or not self._use_working_days_table()):
+            for day in days:
+                if self.is_working_day(
+                        day, extra_working_days=extra_working_days,
+                        extra_holidays=extra_holidays):
+                    yield day
+            return
+
+        weekend_days = self.get_weekend_days()
+        year = holidays = None
+        for day in days:
+            if day.year != year:
+                year = day.year
+                holidays = self.holidays_set(year)
+            if day.weekday() not in weekend_days and day not in holidays:
+                yield day
+
+    def iter_business_periods(self, start, end=None, reverse=False,
+                              extra_working_days=None, extra_holidays=None):
+        """Yield the periods of consecutive working days from ``start`` to
+        ``end`` (both included), as ``(first day, last day)`` tuples.
+
+        Arguments have the same meaning as in :meth:`iter_working_days`. If
+        ``reverse`` is True, the periods are yielded backwards (each period
+        is still a ``(first day, last day)`` tuple).
+        """
+        step = timedelta(days=-1 if reverse else 1)
+        first = last = None
+        for day in self.iter_working_days(
+                start, end, reverse=reverse,
+                extra_working_days=extra_working_days,
+                extra_holidays=extra_holidays):
+            if last is not None and day == last + step:
+                last = day
+                continue
+            if last is not None:
+                yield (last, first) if reverse else (first, last)
+            first = last = day
+        if last is not None:
+            yield (last, first) if reverse else (first, last)
+
 
 class ChristianMixin(Calendar):
     EASTER_METHOD = None  # to be assigned in the inherited mixin
@@ -428,7 +1081,7 @@ class ChristianMixin(Calendar):
 
     def get_easter_sunday(self, year):
         "Return the date of the easter (sunday) -- following the easter method"
-        return easter.easter(year, self.EASTER_METHOD)
+        return _easter_sunday(year, self.EASTER_METHOD)
 
     def get_easter_monday(self, year):
         "Return the date of the monday after easter"
@@ -525,7 +1178,7 @@ class WesternCalendar(Calendar):
     (chiefly Europe and Northern America)
 
     """
-    EASTER_METHOD = easter.EASTER_WESTERN
+    EASTER_METHOD = EASTER_WESTERN
     WEEKEND_DAYS = (SAT, SUN)
     shift_new_years_day = False
 
@@ -545,7 +1198,7 @@ class WesternCalendar(Calendar):
 
 
 class OrthodoxMixin(ChristianMixin):
-    EASTER_METHOD = easter.EASTER_ORTHODOX
+    EASTER_METHOD = EASTER_ORTHODOX
 
 
 class LunarCalendar(Calendar):
@@ -554,6 +1207,13 @@ class LunarCalendar(Calendar):
     """
     @staticmethod
     def lunar(year, month, day):
+        months = _lunar_months(year)
+        if months and 1 <= month <= 12:
+            first_day, length = months[month - 1]
+            if 1 <= day <= length:
+                return date.fromordinal(first_day + day - 1)
+        # Out of the precomputed table, or invalid date (lunardate raises)
+        from lunardate import LunarDate
         return LunarDate(year, month, day).toSolarDate()
 
 
@@ -681,28 +1341,30 @@ class CalverterMixin(Calendar):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        from calverter import Calverter
         self.calverter = Calverter()
         if self.conversion_method is None:
             raise NotImplementedError
 
     def converted(self, year):
+        """Return the converted dates of all the days of the given year"""
         conversion_method = getattr(
             self.calverter, 'jd_to_%s' % self.conversion_method)
-        current = date(year, 1, 1)
-        days = []
-        while current.year == year:
-            julian_day = self.calverter.gregorian_to_jd(
-                current.year,
-                current.month,
-                current.day)
-            days.append(conversion_method(julian_day))
-            current = current + timedelta(days=1)
-        return days
+        julian_day = self.calverter.gregorian_to_jd(year, 1, 1)
+        year_length = 366 if isleap(year) else 365
+        return [conversion_method(julian_day + delta)
+                for delta in range(year_length)]
 
     def calverted_years(self, year):
-        converted = self.converted(year)
-        generator = (y for y, m, d in converted)
-        return sorted(list(set(generator)))
+        """Return the converted years overlapping the given year"""
+        conversion_method = getattr(
+            self.calverter, 'jd_to_%s' % self.conversion_method)
+        # Converted years are contiguous, only the bounds are needed
+        first_year, _, _ = conversion_method(
+            self.calverter.gregorian_to_jd(year, 1, 1))
+        last_year, _, _ = conversion_method(
+            self.calverter.gregorian_to_jd(year, 12, 31))
+        return list(range(first_year, last_year + 1))
 
     def get_islamic_holidays(self):
         return self.ISLAMIC_HOLIDAYS
@@ -0,0 +1,186 @@
+"""
+Precomputed holidays database.
+
+The holidays of the calendars of the ISO registry can be computed once and
+stored in a compact binary file, using :func:`build_database` (or
+``python -m workalendar.database <path>``).
+
+Once loaded using :func:`use_database`, calendars read their holidays from
+this memory-mapped file instead of computing them, for the years it covers.
+
+File layout (little-endian):
+
+* header: magic string, offset and length of the metadata,
+* records: ``(date ordinal, label id)`` pairs, as ``int32, uint32``,
+* year indexes: for each calendar, ``number of years + 1`` ``uint32`` record
+  numbers, where the holidays of each year start,
+* metadata: JSON document, with the years range, the labels, and the
+  calendars (ISO code, class path, offset of the year index).
+"""
+import struct
+import warnings
+from datetime import date
+
+from .datafile import (
+    DEFAULT_FIRST_YEAR, DEFAULT_LAST_YEAR, HEADER,
+    class_path, get_parser, open_data_file, write_data_file
+)
+
+MAGIC = b'WKHOLDB1'
+RECORD = struct.Struct('<iI')
+YEAR_INDEX = struct.Struct('<II')
+
+
+def build_database(path, first_year=DEFAULT_FIRST_YEAR,
+                   last_year=DEFAULT_LAST_YEAR, iso_codes=None):
+    """
+    Compute the holidays of the registry calendars and store them in ``path``.
+
+    By default, all the calendars of the ISO registry (with their subregions)
+    are stored. ``iso_codes`` restricts it to the given codes.
+
+    Years that can't be computed for a calendar (e.g. out of its supported
+    range) are skipped, the calendar computes them as usual.
+    """
+    from .registry import registry
+    calendars = registry.get_calendars(
+        iso_codes, include_subregions=not iso_codes)
+
+    records = []
+    year_indexes = []
+    labels = {}
+    metadata = {
+        'first_year': first_year,
+        'last_year': last_year,
+        'calendars': {},
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for iso_code, cls in sorted(calendars.items()):
+            calendar = cls()
+            year_index = []
+            missing_years = []
+            for year in range(first_year, last_year + 1):
+                year_index.append(len(records))
+                try:
+                    holidays = calendar.holidays(year)
+                except Exception:
+                    missing_years.append(year)
+                    continue
+                for day, label in holidays:
+                    label_id = labels.setdefault(label, len(labels))
+                    records.append((day.toordinal(), label_id))
+            year_index.append(len(records))
+            metadata['calendars'][iso_code] = {
+                'class': class_path(cls),
+                'index': len(year_indexes),
+                'missing_years': missing_years,
+            }
+            year_indexes.append(year_index)
+
+    metadata['labels'] = sorted(labels, key=labels.get)
+    records_offset = HEADER.size
+    indexes_offset = records_offset + len(records) * RECORD.size
+    metadata['records_offset'] = records_offset
+    metadata['indexes_offset'] = indexes_offset
+    blocks = [RECORD.pack(*record) for record in records]
+    blocks.extend(
+        struct.pack('<{}I'.format(len(year_index)), *year_index)
+        for year_index in year_indexes)
+    write_data_file(path, MAGIC, blocks, metadata)
+
+
+class HolidayDatabase:
+    """
+    Read-only access to a holidays database file, memory-mapped.
+    """
+
+    def __init__(self, path):
+        self._mmap, metadata = open_data_file(
+            path, MAGIC, 'holidays database')
+        self.first_year = metadata['first_year']
+        self.last_year = metadata['last_year']
+        self.labels = metadata['labels']
+        self.calendars = metadata['calendars']
+        self._records_offset = metadata['records_offset']
+        self._indexes_offset = metadata['indexes_offset']
+        self._classes = {}
+        for iso_code, entry in sorted(self.calendars.items()):
+            entry['missing_years'] = set(entry['missing_years'])
+            self._classes.setdefault(entry['class'], iso_code)
+
+    def close(self):
+        self._mmap.close()
+
+    def get_iso_code(self, cls):
+        """
+        Return the ISO code under which the calendar class is stored, if any.
+        """
+        return self._classes.get(class_path(cls))
+
+    def get_holidays(self, iso_code, year):
+        """
+        Return the sorted holidays of the calendar for the given year, or None
+        if they're not stored in the database.
+        """
+        entry = self.calendars.get(iso_code)
+        if entry is None:
+            return None
+        if not self.first_year <= year <= self.last_year:
+            return None
+        if year in entry['missing_years']:
+            return None
+        index_size = (self.last_year - self.first_year + 2) * 4
+        offset = self._indexes_offset + entry['index'] * index_size
+        offset += (year - self.first_year) * 4
+        start, end = YEAR_INDEX.unpack_from(self._mmap, offset)
+        offset = self._records_offset + start * RECORD.size
+        holidays = []
+        for ordinal, label_id in struct.iter_unpack(
+                RECORD.format,
+                self._mmap[offset:offset + (end - start) * RECORD.size]):
+            holidays.append((date.fromordinal(ordinal), self.labels[label_id]))
+        return holidays
+
+    def get_calendar_holidays(self, calendar, year):
+        """
+        Return the holidays of the calendar instance for the given year, or
+        None if they're not stored in the database.
+        """
+        iso_code = self.get_iso_code(type(calendar))
+        if iso_code is None:
+            return None
+        return self.get_holidays(iso_code, year)
+
+
+_database = None
+
+
+def use_database(database):
+    """
+    Make calendars read their holidays from the given database.
+
+    ``database`` is either a :class:`HolidayDatabase`, a path to a database
+    file, or None to stop using the current database. The holidays already
+    computed by calendar instances are kept.
+    """
+    global _database
+    if database is not None and not isinstance(database, HolidayDatabase):
+        database = HolidayDatabase(database)
+    _database = database
+    return database
+
+
+def get_database():
+    """
+    Return the database in use, or None.
+    """
+    return _database
+
+
+if __name__ == '__main__':
+    parser = get_parser(
+        "Build a precomputed holidays database.",
+        "Path of the database file to write")
+    args = parser.parse_args()
+    build_database(args.path, args.first_year, args.last_year, args.iso_codes)
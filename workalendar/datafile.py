@@ -0,0 +1,83 @@
+"""
+Memory-mapped data files, shared by the holidays database and the bitmaps.
+
+File layout (little-endian):
+
+* header: magic string, offset and length of the metadata,
+* data: specific to each file type,
+* metadata: JSON document.
+"""
+import argparse
+import json
+import mmap
+import struct
+
+from .exceptions import CalendarError
+
+HEADER = struct.Struct('<8sQQ')
+
+DEFAULT_FIRST_YEAR = 1950
+DEFAULT_LAST_YEAR = 2100
+
+
+def class_path(cls):
+    """
+    Return the dotted path of the calendar class, stored in the metadata.
+    """
+    return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+
+def write_data_file(path, magic, blocks, metadata):
+    """
+    Write a data file: the header, the ``blocks`` of bytes, then the
+    ``metadata`` as JSON.
+
+    The data starts at ``HEADER.size``.
+    """
+    metadata = json.dumps(metadata).encode('utf-8')
+    with open(path, 'wb') as fd:
+        fd.write(HEADER.pack(magic, 0, len(metadata)))
+        for block in blocks:
+            fd.write(block)
+        metadata_offset = fd.tell()
+        fd.write(metadata)
+        fd.seek(0)
+        fd.write(HEADER.pack(magic, metadata_offset, len(metadata)))
+
+
+def open_data_file(path, magic, kind):
+    """
+    Memory-map the data file, return a ``(mmap, metadata)`` tuple.
+
+    Raise a ``CalendarError`` if the file isn't a ``kind`` file, i.e. its
+    magic string is not ``magic``.
+    """
+    with open(path, 'rb') as fd:
+        data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        file_magic, metadata_offset, metadata_length = HEADER.unpack_from(
+            data)
+    except struct.error:
+        file_magic = None
+    if file_magic != magic:
+        data.close()
+        raise CalendarError(
+            "`{}` is not a workalendar {}".format(path, kind))
+    metadata = data[metadata_offset:metadata_offset + metadata_length]
+    return data, json.loads(metadata.decode('utf-8'))
+
+
+def get_parser(description, path_help):
+    """
+    Return the command-line parser of the data files builders.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('path', help=path_help)
+    parser.add_argument(
+        '--first-year', type=int, default=DEFAULT_FIRST_YEAR)
+    parser.add_argument(
+        '--last-year', type=int, default=DEFAULT_LAST_YEAR)
+    parser.add_argument(
+        '--iso-code', action='append', dest='iso_codes',
+        help="ISO code of a calendar to include (default: all)")
+    return parser
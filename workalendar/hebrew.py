@@ -0,0 +1,81 @@
+"""
+Hebrew calendar tools
+"""
+from datetime import timedelta
+
+from .cache import HolidayCache
+
+# Gregorian year -> {(Hebrew month, Hebrew day): date}, shared by all the
+# calendars using Hebrew holidays.
+_hebrew_calendars = HolidayCache(maxsize=128)
+
+
+def get_rosh_hashanah(hebrew_year):
+    """
+    Return the Gregorian date of the 1st of Tishrei of the Hebrew year.
+    """
+    from pyluach.dates import HebrewDate
+    return HebrewDate(hebrew_year, 7, 1).to_pydate()
+
+
+def get_month_lengths(year_length):
+    """
+    Return the (month, length) of the months of a Hebrew year, in order
+    (starting with Tishrei), given the number of days of the year.
+
+    Months are numbered like in ``pyluach``: Nisan is 1, Tishrei is 7, Adar
+    (Adar I in leap years) is 12, and Adar II is 13.
+    """
+    leap = year_length > 355
+    # Cheshvan and Kislev have 29 or 30 days, depending on the year length
+    cheshvan, kislev = {
+        353: (29, 29),
+        354: (29, 30),
+        355: (30, 30),
+    }[year_length - 30 if leap else year_length]
+    months = [(7, 30), (8, cheshvan), (9, kislev), (10, 29), (11, 30)]
+    if leap:
+        months.extend([(12, 30), (13, 29)])
+    else:
+        months.append((12, 29))
+    months.extend([(1, 30), (2, 29), (3, 30), (4, 29), (5, 30), (6, 29)])
+    return months
+
+
+def _compute_hebrew_calendar(year):
+    # January 1st always belongs to the Hebrew year ``year + 3760``, which
+    # started at the Rosh Hashanah of the previous Gregorian year.
+    hebrew_year = year + 3760
+    start = get_rosh_hashanah(hebrew_year)
+    index = {}
+    while start.year <= year:
+        end = get_rosh_hashanah(hebrew_year + 1)
+        day = start
+        for month, length in get_month_lengths((end - start).days):
+            for hebrew_day in range(1, length + 1):
+                if day.year == year:
+                    # Keep the first one, if the same day appears twice
+                    index.setdefault((month, hebrew_day), day)
+                day += timedelta(days=1)
+        start = end
+        hebrew_year += 1
+    return index
+
+
+def get_hebrew_calendar(year):
+    """
+    Return the Hebrew calendar of the Gregorian year, as a dict
+    ``{(Hebrew month, Hebrew day): date}``.
+
+    It's computed from the Rosh Hashanah dates, and cached for the most
+    recently used years.
+    """
+    return _hebrew_calendars.get_or_compute(year, _compute_hebrew_calendar)
+
+
+def get_hebrew_date(year, hebrew_month, hebrew_day):
+    """
+    Return the date of the Hebrew month and day in the Gregorian year, or
+    None if it's not in this year.
+    """
+    return get_hebrew_calendar(year).get((hebrew_month, hebrew_day))
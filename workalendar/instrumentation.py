@@ -0,0 +1,157 @@
+"""
+Opt-in instrumentation of the holidays computation.
+
+When enabled (using :func:`enable`, or the ``WORKALENDAR_INSTRUMENTATION``
+environment variable), calendars record, per calendar class:
+
+* the calls to ``holidays()``, and the hits and misses of its cache,
+* the calls to ``is_working_day()``,
+* the number of calls and the wall time of the holidays computation phases:
+  ``holidays`` (whole computation of a year), ``get_calendar_holidays``
+  (including the substitution / shift rules of the calendar),
+  ``get_fixed_holidays`` and ``get_variable_days``.
+
+When disabled (the default), the only cost is a flag check.
+"""
+import os
+import sys
+import time
+from collections import defaultdict
+from functools import wraps
+from threading import Lock
+
+ENVIRONMENT_VARIABLE = 'WORKALENDAR_INSTRUMENTATION'
+
+PHASES = (
+    'holidays', 'get_calendar_holidays',
+    'get_fixed_holidays', 'get_variable_days',
+)
+
+enabled = os.environ.get(ENVIRONMENT_VARIABLE, '') not in ('', '0')
+
+_lock = Lock()
+
+
+def _new_class_stats():
+    return {
+        'holidays_calls': 0,
+        'is_working_day_calls': 0,
+        'phases': defaultdict(lambda: {'calls': 0, 'time': 0.}),
+    }
+
+
+# Calendar class path -> statistics
+_stats = defaultdict(_new_class_stats)
+
+
+def _class_path(calendar):
+    cls = type(calendar)
+    return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+
+def enable():
+    """
+    Start recording the statistics.
+    """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """
+    Stop recording the statistics. The recorded ones are kept.
+    """
+    global enabled
+    enabled = False
+
+
+def reset():
+    """
+    Drop the recorded statistics.
+    """
+    with _lock:
+        _stats.clear()
+
+
+def count(calendar, counter):
+    """
+    Increment the counter of the calendar class.
+    """
+    with _lock:
+        _stats[_class_path(calendar)][counter] += 1
+
+
+def timed(calendar, phase, function):
+    """
+    Return ``function``, recording its calls and duration as the ``phase``
+    of the calendar class.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            with _lock:
+                stats = _stats[_class_path(calendar)]['phases'][phase]
+                stats['calls'] += 1
+                stats['time'] += duration
+    return wrapper
+
+
+def get_stats():
+    """
+    Return the recorded statistics, as a dict::
+
+        {calendar class path: {
+            'holidays_calls': ..., 'cache_hits': ..., 'cache_misses': ...,
+            'is_working_day_calls': ...,
+            'phases': {phase: {'calls': ..., 'time': ...}},
+        }}
+
+    Times are in seconds.
+    """
+    result = {}
+    with _lock:
+        for path, stats in _stats.items():
+            # The holidays are only computed on cache misses
+            misses = stats['phases'].get('holidays', {}).get('calls', 0)
+            result[path] = {
+                'holidays_calls': stats['holidays_calls'],
+                'cache_hits': stats['holidays_calls'] - misses,
+                'cache_misses': misses,
+                'is_working_day_calls': stats['is_working_day_calls'],
+                'phases': {
+                    phase: dict(values)
+                    for phase, values in stats['phases'].items()
+                },
+            }
+    return result
+
+
+def print_stats(file=None):
+    """
+    Print a summary of the recorded statistics, the slowest calendar classes
+    first.
+    """
+    file = file or sys.stdout
+    stats = get_stats()
+
+    def total_time(path):
+        return stats[path]['phases'].get('holidays', {}).get('time', 0.)
+
+    header = '{:<50} {:>8} {:>8} {:>10}'.format(
+        'calendar', 'hits', 'misses', 'is_working')
+    header += ''.join(' {:>22}'.format(phase) for phase in PHASES)
+    print(header, file=file)
+    for path in sorted(stats, key=total_time, reverse=True):
+        values = stats[path]
+        line = '{:<50} {:>8} {:>8} {:>10}'.format(
+            path, values['cache_hits'], values['cache_misses'],
+            values['is_working_day_calls'])
+        for phase in PHASES:
+            phase_stats = values['phases'].get(phase, {'calls': 0, 'time': 0.})
+            line += ' {:>10} {:>9.3f}ms'.format(
+                phase_stats['calls'], phase_stats['time'] * 1000)
+        print(line, file=file)
@@ -0,0 +1,215 @@
+"""
+Precomputed Chinese lunar calendar, used by ``LunarCalendar.lunar()``.
+
+Generated by ``scripts/generate_lunar_data.py``. Do not edit.
+
+A year row is made of: the day of year of the Chinese New Year (2 digits),
+the leap month (2 digits, ``00`` if none), then the length of each month of
+the year, in order (leap month included): ``0`` for 29 days, ``1`` for 30.
+"""
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2099
+
+YEARS = (
+    '31080100101101101',  # 1900
+    '5000010010101110',  # 1901
+    '3900101001010111',  # 1902
+    '29050101001001101',  # 1903
+    '4700110100100110',  # 1904
+    '3500110110010101',  # 1905
+    '25040110101010101',  # 1906
+    '4400010101101010',  # 1907
+    '3300100110101101',  # 1908
+    '22020100101011101',  # 1909
+    '4100010010101110',  # 1910
+    '30061010010011011',  # 1911
+    '4900101001001101',  # 1912
+    '3700110100100101',  # 1913
+    '26051101010100101',  # 1914
+    '4500101101010100',  # 1915
+    '3400110101101010',  # 1916
+    '23021001011011010',  # 1917
+    '4200100101011011',  # 1918
+    '32070100100110111',  # 1919
+    '5100010010010111',  # 1920
+    '3900101001001011',  # 1921
+    '28051011001001011',  # 1922
+    '4700011010100101',  # 1923
+    '3600011011010100',  # 1924
+    '24041010110110101',  # 1925
+    '4400001010110110',  # 1926
+    '3300100101010111',  # 1927
+    '23020100100101111',  # 1928
+    '4100010010010111',  # 1929
+    '30060110010010110',  # 1930
+    '4800110101001010',  # 1931
+    '3700111010100101',  # 1932
+    '26050110101101001',  # 1933
+    '4500010110101101',  # 1934
+    '3500001010110110',  # 1935
+    '24031001001101110',  # 1936
+    '4200100100101110',  # 1937
+    '31071100100101101',  # 1938
+    '5000110010010101',  # 1939
+    '3900110101001010',  # 1940
+    '27061101101001010',  # 1941
+    '4600101101010101',  # 1942
+    '3600010101101010',  # 1943
+    '25041010101011011',  # 1944
+    '4400001001011101',  # 1945
+    '3300100100101101',  # 1946
+    '22021100100101011',  # 1947
+    '4100101010010101',  # 1948
+    '29071011010010101',  # 1949
+    '4800011011001010',  # 1950
+    '3700101101010101',  # 1951
+    '27050101010110101',  # 1952
+    '4500010011011010',  # 1953
+    '3400101001011101',  # 1954
+    '24030101001010111',  # 1955
+    '4300010100101011',  # 1956
+    '31081010100101010',  # 1957
+    '4900111010010101',  # 1958
+    '3900011010101010',  # 1959
+    '28061010110101010',  # 1960
+    '4600101010110101',  # 1961
+    '3600010010110110',  # 1962
+    '25041010010101110',  # 1963
+    '4400101001010111',  # 1964
+    '3300010100100110',  # 1965
+    '21031110100100110',  # 1966
+    '4000110110010101',  # 1967
+    '30070101101010101',  # 1968
+    '4800010101101010',  # 1969
+    '3700100101101101',  # 1970
+    '27050100101011101',  # 1971
+    '4600010010101101',  # 1972
+    '3400101001001101',  # 1973
+    '23041101001001101',  # 1974
+    '4200110100100101',  # 1975
+    '31081101010100101',  # 1976
+    '4900101101010100',  # 1977
+    '3800101101011010',  # 1978
+    '28061001011011010',  # 1979
+    '4700100101011011',  # 1980
+    '3600010010011011',  # 1981
+    '25041010010010111',  # 1982
+    '4400101001001011',  # 1983
+    '33101011001001011',  # 1984
+    '5100011010100101',  # 1985
+    '4000011011010100',  # 1986
+    '29061010110110100',  # 1987
+    '4800101010110110',  # 1988
+    '3700100101010111',  # 1989
+    '27050100100101111',  # 1990
+    '4600010010010111',  # 1991
+    '3500011001001011',  # 1992
+    '23030110101001010',  # 1993
+    '4100111010100101',  # 1994
+    '31080110101100101',  # 1995
+    '5000010110101100',  # 1996
+    '3800101010110110',  # 1997
+    '28051001001101101',  # 1998
+    '4700100100101110',  # 1999
+    '3600110010010110',  # 2000
+    '24041101010010101',  # 2001
+    '4300110101001010',  # 2002
+    '3200110110100101',  # 2003
+    '22020101101010101',  # 2004
+    '4000010101101010',  # 2005
+    '29071010101011011',  # 2006
+    '4900001001011101',  # 2007
+    '3800100100101101',  # 2008
+    '26051100100101011',  # 2009
+    '4500101010010101',  # 2010
+    '3400101101001010',  # 2011
+    '23041011010101010',  # 2012
+    '4100101011010101',  # 2013
+    '31090101010110101',  # 2014
+    '5000010010111010',  # 2015
+    '3900101001011011',  # 2016
+    '28060101001010111',  # 2017
+    '4700010100101011',  # 2018
+    '3600101010010011',  # 2019
+    '25040111010010101',  # 2020
+    '4300011010101010',  # 2021
+    '3200101011010101',  # 2022
+    '22020100110110101',  # 2023
+    '4100010010110110',  # 2024
+    '29061010010101110',  # 2025
+    '4800101001001110',  # 2026
+    '3700110100100110',  # 2027
+    '26051110100100110',  # 2028
+    '4400110101010011',  # 2029
+    '3400010110101010',  # 2030
+    '23030110101101010',  # 2031
+    '4200100101101101',  # 2032
+    '31110100101011101',  # 2033
+    '5000010010101101',  # 2034
+    '3900101001001101',  # 2035
+    '28061101001001011',  # 2036
+    '4600110100100101',  # 2037
+    '3500110101010010',  # 2038
+    '24051101101010100',  # 2039
+    '4300101101011010',  # 2040
+    '3200010101101101',  # 2041
+    '22020100101011011',  # 2042
+    '4100010010011011',  # 2043
+    '30071010010010111',  # 2044
+    '4800101001001011',  # 2045
+    '3700101010100101',  # 2046
+    '26051011010100101',  # 2047
+    '4500011011010010',  # 2048
+    '3300101011011010',  # 2049
+    '23030101010110110',  # 2050
+    '4200100100110111',  # 2051
+    '32080100100101111',  # 2052
+    '5000010010010111',  # 2053
+    '3900011001001011',  # 2054
+    '28060110101001010',  # 2055
+    '4600111010100101',  # 2056
+    '3500011010101010',  # 2057
+    '24041010101101100',  # 2058
+    '4300101010101110',  # 2059
+    '3300100100101110',  # 2060
+    '21031100100101110',  # 2061
+    '4000110010010110',  # 2062
+    '29071101010010101',  # 2063
+    '4800110101001010',  # 2064
+    '3600110110100101',  # 2065
+    '26050101101010101',  # 2066
+    '4500010101101010',  # 2067
+    '3400101001101101',  # 2068
+    '23040101001011101',  # 2069
+    '4200010100101101',  # 2070
+    '31081010100101011',  # 2071
+    '5000101010010101',  # 2072
+    '3800101101001010',  # 2073
+    '27061011010101010',  # 2074
+    '4600101011010101',  # 2075
+    '3600010101011010',  # 2076
+    '24041010010111010',  # 2077
+    '4300101001011011',  # 2078
+    '3300010100101011',  # 2079
+    '22031010100100111',  # 2080
+    '4000011010010011',  # 2081
+    '29070111001010011',  # 2082
+    '4800011010101010',  # 2083
+    '3700101011010101',  # 2084
+    '26050100110110101',  # 2085
+    '4500010010110110',  # 2086
+    '3400101001010111',  # 2087
+    '24040101001001110',  # 2088
+    '4100110100010110',  # 2089
+    '30081110100100110',  # 2090
+    '4900110101010010',  # 2091
+    '3800110110101010',  # 2092
+    '27060110101101010',  # 2093
+    '4600010101101101',  # 2094
+    '3600010010101110',  # 2095
+    '25041010010011101',  # 2096
+    '4300101000101101',  # 2097
+    '3200110100010101',  # 2098
+    '21021101100100101',  # 2099
+)
@@ -1,8 +1,29 @@
+from concurrent.futures import ProcessPoolExecutor
 from importlib import import_module
 import warnings
 
 from .core import Calendar
 from .exceptions import ISORegistryError
+from .registry_manifest import REGISTRY_MANIFEST
+
+
+def _compute_holidays(cls, years):
+    """
+    Return the holidays of the calendar class for the given years, as a
+    ``{year: holidays}`` dict. Years that can't be computed are skipped.
+
+    Run in the worker processes of ``IsoRegistry.warm()``.
+    """
+    calendar = cls()
+    result = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for year in years:
+            try:
+                result[year] = calendar.holidays(year)
+            except Exception:
+                continue
+    return result
 
 
 class IsoRegistry:
@@ -12,6 +33,10 @@ class IsoRegistry:
     where they are used as official calendars.
 
     Two letter codes are favored for any subdivisions.
+
+    In ``lazy`` mode, the standard calendars are listed using the static
+    ``REGISTRY_MANIFEST`` and their module is only imported when they're
+    looked up.
     """
 
     STANDARD_MODULES = (
@@ -29,13 +54,49 @@ class IsoRegistry:
         'oceania',
     )
 
-    def __init__(self, load_standard_modules=True):
-        self.region_registry = dict()
+    def __init__(self, load_standard_modules=True, lazy=False):
+        self._region_registry = dict()
+        # ISO code -> (module name, class name) of the calendars that are
+        # not imported yet (lazy mode only).
+        self._lazy_items = dict()
         if load_standard_modules:
-            for module_name in self.STANDARD_MODULES:
-                module = 'workalendar.{}'.format(module_name)
-                all_classes = getattr(import_module(module), '__all__')
-                self.load_module_from_items(module, all_classes)
+            if lazy:
+                self._lazy_items.update(REGISTRY_MANIFEST)
+            else:
+                for module_name in self.STANDARD_MODULES:
+                    module = 'workalendar.{}'.format(module_name)
+                    all_classes = getattr(import_module(module), '__all__')
+                    self.load_module_from_items(module, all_classes)
+
+    @property
+    def region_registry(self):
+        """
+        Return the dict of all registered calendar classes.
+
+        In lazy mode, accessing it imports every registered calendar.
+        """
+        self._load_lazy_items(list(self._lazy_items))
+        return self._region_registry
+
+    def _load_lazy_items(self, iso_codes):
+        """
+        Import and register the lazy calendar classes for the given codes.
+
+        Unknown or already loaded codes are ignored.
+        """
+        for iso_code in iso_codes:
+            if iso_code in self._lazy_items:
+                module_name, class_name = self._lazy_items[iso_code]
+                cls = getattr(import_module(module_name), class_name)
+                self.register(iso_code, cls)
+
+    def _get_subregion_codes(self, iso_code):
+        """
+        Return the ISO codes of the subregions of ``iso_code``, loaded or not.
+        """
+        prefix = "{}-".format(iso_code)
+        codes = list(self._region_registry) + list(self._lazy_items)
+        return [code for code in codes if code.startswith(prefix)]
 
     def register(self, iso_code, cls):
         """
@@ -45,7 +106,8 @@ class IsoRegistry:
             raise ISORegistryError(
                 "Class `{}` is not a Calendar class".format(cls)
             )
-        self.region_registry[iso_code] = cls
+        self._region_registry[iso_code] = cls
+        self._lazy_items.pop(iso_code, None)
 
     def load_module_from_items(self, module_name, items):
         """
@@ -70,13 +132,14 @@ class IsoRegistry:
 
         :rtype: Calendar
         """
-        return self.region_registry.get(iso_code)
+        self._load_lazy_items([iso_code])
+        return self._region_registry.get(iso_code)
 
     def get_subregions(self, iso_code):
         """
         Returns subregion calendar classes for given region iso_code.
 
-        >>> registry = IsoRegistry()
+        >>> registry = IsoRegistry(lazy=True)
         >>> # assuming calendars registered are: DE, DE-HH, DE-BE
         >>> registry.get_subregions('DE')
         {'DE-HH': <class 'workalendar.europe.germany.Hamburg'>,
@@ -85,11 +148,9 @@ class IsoRegistry:
         :return dict where keys are ISO codes strings
         and values are calendar classes
         """
-        items = dict()
-        for key, value in self.region_registry.items():
-            if key.startswith("{}-".format(iso_code)):
-                items[key] = value
-        return items
+        codes = self._get_subregion_codes(iso_code)
+        self._load_lazy_items(codes)
+        return {code: self._region_registry[code] for code in codes}
 
     def items(self, region_codes=None, include_subregions=False):
         """
@@ -132,13 +193,55 @@ class IsoRegistry:
 
         items = dict()
         for code in region_codes:
+            self._load_lazy_items([code])
             try:
-                items[code] = self.region_registry[code]
+                items[code] = self._region_registry[code]
             except KeyError:
                 continue
             if include_subregions:
                 items.update(self.get_subregions(code))
         return items
 
+    def warm(self, region_codes, years, workers=None,
+             include_subregions=False):
+        """
+        Compute the holidays of the given calendars and years, in a pool of
+        ``workers`` processes (by default, one per CPU; ``1`` computes them
+        in the current process).
 
-registry = IsoRegistry()
+        ``region_codes`` and ``include_subregions`` select the calendars like
+        in :meth:`get_calendars`.
+
+        Return a dict where keys are ISO codes and values are calendar
+        instances, with the holidays of these years already in their caches
+        (see :meth:`Calendar.precompute`). Years that can't be computed for a
+        calendar are skipped: they'll be computed (and fail) when requested.
+        """
+        years = list(years)
+        classes = self.get_calendars(region_codes, include_subregions)
+        if workers == 1:
+            results = {
+                code: _compute_holidays(cls, years)
+                for code, cls in classes.items()
+            }
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    code: executor.submit(_compute_holidays, cls, years)
+                    for code, cls in classes.items()
+                }
+                results = {
+                    code: future.result() for code, future in futures.items()
+                }
+
+        calendars = {}
+        for code, holidays in results.items():
+            calendar = classes[code]()
+            for year, year_holidays in holidays.items():
+                calendar._holidays.put(year, year_holidays)
+            calendar.precompute(holidays)
+            calendars[code] = calendar
+        return calendars
+
+
+registry = IsoRegistry(lazy=True)
@@ -0,0 +1,380 @@
+"""
+ISO code -> (module, class name) manifest, used by the lazy ISO registry.
+
+Generated by ``scripts/generate_registry_manifest.py``. Do not edit.
+"""
+
+REGISTRY_MANIFEST = {
+    'AT': (
+        'workalendar.europe.austria', 'Austria'),
+    'BY': (
+        'workalendar.europe.belarus', 'Belarus'),
+    'BE': (
+        'workalendar.europe.belgium', 'Belgium'),
+    'BG': (
+        'workalendar.europe.bulgaria', 'Bulgaria'),
+    'KY': (
+        'workalendar.europe.cayman_islands', 'CaymanIslands'),
+    'HR': (
+        'workalendar.europe.croatia', 'Croatia'),
+    'CY': (
+        'workalendar.europe.cyprus', 'Cyprus'),
+    'CZ': (
+        'workalendar.europe.czech_republic', 'CzechRepublic'),
+    'DK': (
+        'workalendar.europe.denmark', 'Denmark'),
+    'EE': (
+        'workalendar.europe.estonia', 'Estonia'),
+    'FI': (
+        'workalendar.europe.finland', 'Finland'),
+    'FR': (
+        'workalendar.europe.france', 'France'),
+    'GR': (
+        'workalendar.europe.greece', 'Greece'),
+    'HU': (
+        'workalendar.europe.hungary', 'Hungary'),
+    'IS': (
+        'workalendar.europe.iceland', 'Iceland'),
+    'IE': (
+        'workalendar.europe.ireland', 'Ireland'),
+    'IT': (
+        'workalendar.europe.italy', 'Italy'),
+    'LV': (
+        'workalendar.europe.latvia', 'Latvia'),
+    'LT': (
+        'workalendar.europe.lithuania', 'Lithuania'),
+    'LU': (
+        'workalendar.europe.luxembourg', 'Luxembourg'),
+    'MT': (
+        'workalendar.europe.malta', 'Malta'),
+    'NL': (
+        'workalendar.europe.netherlands', 'Netherlands'),
+    'NO': (
+        'workalendar.europe.norway', 'Norway'),
+    'PL': (
+        'workalendar.europe.poland', 'Poland'),
+    'PT': (
+        'workalendar.europe.portugal', 'Portugal'),
+    'RO': (
+        'workalendar.europe.romania', 'Romania'),
+    'RU': (
+        'workalendar.europe.russia', 'Russia'),
+    'RS': (
+        'workalendar.europe.serbia', 'Serbia'),
+    'SK': (
+        'workalendar.europe.slovakia', 'Slovakia'),
+    'SI': (
+        'workalendar.europe.slovenia', 'Slovenia'),
+    'ES': (
+        'workalendar.europe.spain', 'Spain'),
+    'SE': (
+        'workalendar.europe.sweden', 'Sweden'),
+    'CH': (
+        'workalendar.europe.switzerland', 'Switzerland'),
+    'CH-VD': (
+        'workalendar.europe.switzerland', 'Vaud'),
+    'CH-GE': (
+        'workalendar.europe.switzerland', 'Geneva'),
+    'UA': (
+        'workalendar.europe.ukraine', 'Ukraine'),
+    'GB': (
+        'workalendar.europe.united_kingdom', 'UnitedKingdom'),
+    'GB-NIR': (
+        'workalendar.europe.united_kingdom', 'UnitedKingdomNorthernIreland'),
+    'TR': (
+        'workalendar.europe.turkey', 'Turkey'),
+    'DE': (
+        'workalendar.europe.germany', 'Germany'),
+    'DE-BW': (
+        'workalendar.europe.germany', 'BadenWurttemberg'),
+    'DE-BY': (
+        'workalendar.europe.germany', 'Bavaria'),
+    'DE-BE': (
+        'workalendar.europe.germany', 'Berlin'),
+    'DE-BB': (
+        'workalendar.europe.germany', 'Brandenburg'),
+    'DE-HB': (
+        'workalendar.europe.germany', 'Bremen'),
+    'DE-HH': (
+        'workalendar.europe.germany', 'Hamburg'),
+    'DE-HE': (
+        'workalendar.europe.germany', 'Hesse'),
+    'DE-MV': (
+        'workalendar.europe.germany', 'MecklenburgVorpommern'),
+    'DE-NI': (
+        'workalendar.europe.germany', 'LowerSaxony'),
+    'DE-NW': (
+        'workalendar.europe.germany', 'NorthRhineWestphalia'),
+    'DE-RP': (
+        'workalendar.europe.germany', 'RhinelandPalatinate'),
+    'DE-SL': (
+        'workalendar.europe.germany', 'Saarland'),
+    'DE-SN': (
+        'workalendar.europe.germany', 'Saxony'),
+    'DE-ST': (
+        'workalendar.europe.germany', 'SaxonyAnhalt'),
+    'DE-SH': (
+        'workalendar.europe.germany', 'SchleswigHolstein'),
+    'DE-TH': (
+        'workalendar.europe.germany', 'Thuringia'),
+    'US': (
+        'workalendar.usa.core', 'UnitedStates'),
+    'US-AL': (
+        'workalendar.usa.alabama', 'Alabama'),
+    'US-AK': (
+        'workalendar.usa.alaska', 'Alaska'),
+    'US-AZ': (
+        'workalendar.usa.arizona', 'Arizona'),
+    'US-AR': (
+        'workalendar.usa.arkansas', 'Arkansas'),
+    'US-CA': (
+        'workalendar.usa.california', 'California'),
+    'US-CO': (
+        'workalendar.usa.colorado', 'Colorado'),
+    'US-CT': (
+        'workalendar.usa.connecticut', 'Connecticut'),
+    'US-DE': (
+        'workalendar.usa.delaware', 'Delaware'),
+    'US-DC': (
+        'workalendar.usa.district_columbia', 'DistrictOfColumbia'),
+    'US-FL': (
+        'workalendar.usa.florida', 'Florida'),
+    'US-GA': (
+        'workalendar.usa.georgia', 'Georgia'),
+    'US-HI': (
+        'workalendar.usa.hawaii', 'Hawaii'),
+    'US-ID': (
+        'workalendar.usa.idaho', 'Idaho'),
+    'US-IL': (
+        'workalendar.usa.illinois', 'Illinois'),
+    'US-IN': (
+        'workalendar.usa.indiana', 'Indiana'),
+    'US-IA': (
+        'workalendar.usa.iowa', 'Iowa'),
+    'US-KS': (
+        'workalendar.usa.kansas', 'Kansas'),
+    'US-KY': (
+        'workalendar.usa.kentucky', 'Kentucky'),
+    'US-LA': (
+        'workalendar.usa.louisiana', 'Louisiana'),
+    'US-ME': (
+        'workalendar.usa.maine', 'Maine'),
+    'US-MD': (
+        'workalendar.usa.maryland', 'Maryland'),
+    'US-MA': (
+        'workalendar.usa.massachusetts', 'Massachusetts'),
+    'US-MI': (
+        'workalendar.usa.michigan', 'Michigan'),
+    'US-MN': (
+        'workalendar.usa.minnesota', 'Minnesota'),
+    'US-MS': (
+        'workalendar.usa.mississippi', 'Mississippi'),
+    'US-MO': (
+        'workalendar.usa.missouri', 'Missouri'),
+    'US-MT': (
+        'workalendar.usa.montana', 'Montana'),
+    'US-NE': (
+        'workalendar.usa.nebraska', 'Nebraska'),
+    'US-NV': (
+        'workalendar.usa.nevada', 'Nevada'),
+    'US-NH': (
+        'workalendar.usa.new_hampshire', 'NewHampshire'),
+    'US-NJ': (
+        'workalendar.usa.new_jersey', 'NewJersey'),
+    'US-NM': (
+        'workalendar.usa.new_mexico', 'NewMexico'),
+    'US-NY': (
+        'workalendar.usa.new_york', 'NewYork'),
+    'US-NC': (
+        'workalendar.usa.north_carolina', 'NorthCarolina'),
+    'US-ND': (
+        'workalendar.usa.north_dakota', 'NorthDakota'),
+    'US-OH': (
+        'workalendar.usa.ohio', 'Ohio'),
+    'US-OK': (
+        'workalendar.usa.oklahoma', 'Oklahoma'),
+    'US-OR': (
+        'workalendar.usa.oregon', 'Oregon'),
+    'US-PA': (
+        'workalendar.usa.pennsylvania', 'Pennsylvania'),
+    'US-RI': (
+        'workalendar.usa.rhode_island', 'RhodeIsland'),
+    'US-SC': (
+        'workalendar.usa.south_carolina', 'SouthCarolina'),
+    'US-SD': (
+        'workalendar.usa.south_dakota', 'SouthDakota'),
+    'US-TN': (
+        'workalendar.usa.tennessee', 'Tennessee'),
+    'US-TX': (
+        'workalendar.usa.texas', 'Texas'),
+    'US-UT': (
+        'workalendar.usa.utah', 'Utah'),
+    'US-VT': (
+        'workalendar.usa.vermont', 'Vermont'),
+    'US-VA': (
+        'workalendar.usa.virginia', 'Virginia'),
+    'US-WA': (
+        'workalendar.usa.washington', 'Washington'),
+    'US-WV': (
+        'workalendar.usa.west_virginia', 'WestVirginia'),
+    'US-WI': (
+        'workalendar.usa.wisconsin', 'Wisconsin'),
+    'US-WY': (
+        'workalendar.usa.wyoming', 'Wyoming'),
+    'US-AS': (
+        'workalendar.usa.american_samoa', 'AmericanSamoa'),
+    'US-GU': (
+        'workalendar.usa.guam', 'Guam'),
+    'BR': (
+        'workalendar.america.brazil', 'Brazil'),
+    'BR-AC': (
+        'workalendar.america.brazil', 'BrazilAcre'),
+    'BR-AL': (
+        'workalendar.america.brazil', 'BrazilAlagoas'),
+    'BR-AP': (
+        'workalendar.america.brazil', 'BrazilAmapa'),
+    'BR-AM': (
+        'workalendar.america.brazil', 'BrazilAmazonas'),
+    'BR-BA': (
+        'workalendar.america.brazil', 'BrazilBahia'),
+    'BR-CE': (
+        'workalendar.america.brazil', 'BrazilCeara'),
+    'BR-DF': (
+        'workalendar.america.brazil', 'BrazilDistritoFederal'),
+    'BR-ES': (
+        'workalendar.america.brazil', 'BrazilEspiritoSanto'),
+    'BR-GO': (
+        'workalendar.america.brazil', 'BrazilGoias'),
+    'BR-MA': (
+        'workalendar.america.brazil', 'BrazilMaranhao'),
+    'BR-MG': (
+        'workalendar.america.brazil', 'BrazilMinasGerais'),
+    'BR-MT': (
+        'workalendar.america.brazil', 'BrazilMatoGrosso'),
+    'BR-MS': (
+        'workalendar.america.brazil', 'BrazilMatoGrossoDoSul'),
+    'BR-PA': (
+        'workalendar.america.brazil', 'BrazilPara'),
+    'BR-PB': (
+        'workalendar.america.brazil', 'BrazilParaiba'),
+    'BR-PE': (
+        'workalendar.america.brazil', 'BrazilPernambuco'),
+    'BR-PI': (
+        'workalendar.america.brazil', 'BrazilPiaui'),
+    'BR-PR': (
+        'workalendar.america.brazil', 'BrazilParana'),
+    'BR-RJ': (
+        'workalendar.america.brazil', 'BrazilRioDeJaneiro'),
+    'BR-RN': (
+        'workalendar.america.brazil', 'BrazilRioGrandeDoNorte'),
+    'BR-RS': (
+        'workalendar.america.brazil', 'BrazilRioGrandeDoSul'),
+    'BR-RO': (
+        'workalendar.america.brazil', 'BrazilRondonia'),
+    'BR-RR': (
+        'workalendar.america.brazil', 'BrazilRoraima'),
+    'BR-SC': (
+        'workalendar.america.brazil', 'BrazilSantaCatarina'),
+    'BR-SP': (
+        'workalendar.america.brazil', 'BrazilSaoPauloState'),
+    'BR-SE': (
+        'workalendar.america.brazil', 'BrazilSergipe'),
+    'BR-TO': (
+        'workalendar.america.brazil', 'BrazilTocantins'),
+    'CA': (
+        'workalendar.america.canada', 'Canada'),
+    'CA-ON': (
+        'workalendar.america.canada', 'Ontario'),
+    'CA-QC': (
+        'workalendar.america.canada', 'Quebec'),
+    'CA-BC': (
+        'workalendar.america.canada', 'BritishColumbia'),
+    'CA-AB': (
+        'workalendar.america.canada', 'Alberta'),
+    'CA-SK': (
+        'workalendar.america.canada', 'Saskatchewan'),
+    'CA-MB': (
+        'workalendar.america.canada', 'Manitoba'),
+    'CA-NB': (
+        'workalendar.america.canada', 'NewBrunswick'),
+    'CA-NS': (
+        'workalendar.america.canada', 'NovaScotia'),
+    'CA-PE': (
+        'workalendar.america.canada', 'PrinceEdwardIsland'),
+    'CA-NL': (
+        'workalendar.america.canada', 'Newfoundland'),
+    'CA-YT': (
+        'workalendar.america.canada', 'Yukon'),
+    'CA-NT': (
+        'workalendar.america.canada', 'NorthwestTerritories'),
+    'CA-NU': (
+        'workalendar.america.canada', 'Nunavut'),
+    'BB': (
+        'workalendar.america.barbados', 'Barbados'),
+    'CL': (
+        'workalendar.america.chile', 'Chile'),
+    'CO': (
+        'workalendar.america.colombia', 'Colombia'),
+    'MX': (
+        'workalendar.america.mexico', 'Mexico'),
+    'PA': (
+        'workalendar.america.panama', 'Panama'),
+    'PY': (
+        'workalendar.america.paraguay', 'Paraguay'),
+    'AR': (
+        'workalendar.america.argentina', 'Argentina'),
+    'DZ': (
+        'workalendar.africa.algeria', 'Algeria'),
+    'BJ': (
+        'workalendar.africa.benin', 'Benin'),
+    'CI': (
+        'workalendar.africa.ivory_coast', 'IvoryCoast'),
+    'MG': (
+        'workalendar.africa.madagascar', 'Madagascar'),
+    'ST': (
+        'workalendar.africa.sao_tome', 'SaoTomeAndPrincipe'),
+    'ZA': (
+        'workalendar.africa.south_africa', 'SouthAfrica'),
+    'AO': (
+        'workalendar.africa.angola', 'Angola'),
+    'CN': (
+        'workalendar.asia.china', 'China'),
+    'HK': (
+        'workalendar.asia.hong_kong', 'HongKong'),
+    'JP': (
+        'workalendar.asia.japan', 'Japan'),
+    'MY': (
+        'workalendar.asia.malaysia', 'Malaysia'),
+    'QA': (
+        'workalendar.asia.qatar', 'Qatar'),
+    'SG': (
+        'workalendar.asia.singapore', 'Singapore'),
+    'KR': (
+        'workalendar.asia.south_korea', 'SouthKorea'),
+    'TW': (
+        'workalendar.asia.taiwan', 'Taiwan'),
+    'IL': (
+        'workalendar.asia.israel', 'Israel'),
+    'AU': (
+        'workalendar.oceania.australia', 'Australia'),
+    'AU-ACT': (
+        'workalendar.oceania.australia', 'AustralianCapitalTerritory'),
+    'AU-NSW': (
+        'workalendar.oceania.australia', 'NewSouthWales'),
+    'AU-NT': (
+        'workalendar.oceania.australia', 'NorthernTerritory'),
+    'AU-QLD': (
+        'workalendar.oceania.australia', 'Queensland'),
+    'AU-SA': (
+        'workalendar.oceania.australia', 'SouthAustralia'),
+    'AU-TAS': (
+        'workalendar.oceania.australia', 'Tasmania'),
+    'AU-VIC': (
+        'workalendar.oceania.australia', 'Victoria'),
+    'AU-WA': (
+        'workalendar.oceania.australia', 'WesternAustralia'),
+    'MH': (
+        'workalendar.oceania.marshall_islands', 'MarshallIslands'),
+    'NZ': (
+        'workalendar.oceania.new_zealand', 'NewZealand'),
+}
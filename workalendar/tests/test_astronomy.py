@@ -1,6 +1,11 @@
 from datetime import date
 
-from ..astronomy import calculate_equinoxes, solar_term
+import pytz
+
+from ..astronomy import (
+    calculate_equinoxes, solar_term, get_ephemeris, preload,
+    equinox_datetimes, solar_term_datetime
+)
 
 
 def test_calculate_some_equinoxes():
@@ -27,3 +32,30 @@ def test_qingming_festivals_hk():
     assert solar_term(2019, 15, 'Asia/Hong_Kong') == date(2019, 4, 5)
     assert solar_term(2020, 15, 'Asia/Hong_Kong') == date(2020, 4, 4)
     assert solar_term(2021, 15, 'Asia/Hong_Kong') == date(2021, 4, 4)
+
+
+def test_ephemeris_loaded_once():
+    preload()
+    assert get_ephemeris() is get_ephemeris()
+
+
+def test_tables_match_computation():
+    for year in (1900, 1987, 2020, 2052):
+        for degrees in (0, 15, 90, 285):
+            computed = solar_term_datetime(year, degrees)
+            assert solar_term(year, degrees, 'Asia/Taipei') == \
+                computed.astimezone(pytz.timezone('Asia/Taipei')).date()
+        vernal, autumn = equinox_datetimes(year)
+        tz = pytz.timezone('Asia/Tokyo')
+        assert calculate_equinoxes(year, 'Asia/Tokyo') == (
+            vernal.astimezone(tz).date(), autumn.astimezone(tz).date()
+        )
+
+
+def test_out_of_tables():
+    # Not in the tables: computed using the ephemeris
+    assert solar_term(2001, 15, 'Europe/Paris') == date(2001, 4, 4)
+    assert solar_term(2001, 7.5) == date(2001, 3, 28)
+    assert calculate_equinoxes(2010, 'Europe/Paris') == (
+        date(2010, 3, 20), date(2010, 9, 23)
+    )
@@ -0,0 +1,91 @@
+import os
+import tempfile
+from datetime import date, timedelta
+from unittest import TestCase
+
+from ..asia import China
+from ..bitmap import BitmapCalendar, HolidayBitmap, export_bitmap
+from ..europe import France
+from ..exceptions import CalendarError
+
+
+class BitmapTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'holidays.bitmap')
+        export_bitmap(cls.path, 2018, 2020, iso_codes=['FR', 'CN'])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+    def assertSameDays(self, bitmap_calendar, calendar, start, end):
+        day = start
+        while day <= end:
+            self.assertEqual(
+                bitmap_calendar.is_holiday(day), calendar.is_holiday(day))
+            self.assertEqual(
+                bitmap_calendar.is_working_day(day),
+                calendar.is_working_day(day))
+            day += timedelta(days=1)
+
+    def test_bits(self):
+        bitmap = HolidayBitmap(self.path)
+        self.addCleanup(bitmap.close)
+        self.assertEqual(bitmap.first_day, date(2018, 1, 1).toordinal())
+        self.assertEqual(bitmap.day_count, 365 * 3 + 1)
+        entry = bitmap.calendars['FR']
+        holidays, working_days = (
+            entry['holidays_offset'], entry['working_days_offset'])
+        self.assertTrue(bitmap.test(holidays, date(2018, 7, 14)))
+        self.assertFalse(bitmap.test(holidays, date(2018, 7, 13)))
+        self.assertTrue(bitmap.test(working_days, date(2018, 7, 13)))
+        # Holiday, and Sunday
+        self.assertFalse(bitmap.test(working_days, date(2018, 7, 14)))
+        self.assertFalse(bitmap.test(working_days, date(2018, 7, 15)))
+        # First and last bits
+        self.assertTrue(bitmap.test(holidays, date(2018, 1, 1)))
+        self.assertFalse(bitmap.test(holidays, date(2020, 12, 31)))
+        self.assertTrue(bitmap.test(working_days, date(2020, 12, 31)))
+        self.assertIsNone(bitmap.test(holidays, date(2017, 12, 31)))
+        self.assertIsNone(bitmap.test(holidays, date(2021, 1, 1)))
+
+    def test_calendar(self):
+        self.assertSameDays(
+            BitmapCalendar('FR', self.path), France(),
+            date(2018, 1, 1), date(2020, 12, 31))
+
+    def test_custom_working_days(self):
+        # China overrides ``is_working_day()``: some week-end days are
+        # working days, the working days bitmap isn't derived from the
+        # holidays and the week-end days.
+        cal = BitmapCalendar('CN', self.path)
+        day = date(2018, 2, 11)  # a Sunday
+        self.assertFalse(cal.is_holiday(day))
+        self.assertIn(day.weekday(), cal.get_weekend_days())
+        self.assertTrue(cal.is_working_day(day))
+        self.assertSameDays(
+            cal, China(), date(2018, 1, 1), date(2020, 12, 31))
+
+    def test_out_of_range(self):
+        cal = BitmapCalendar('FR', self.path)
+        self.assertTrue(cal.is_holiday(date(2017, 7, 14)))
+        self.assertTrue(cal.is_holiday(date(2021, 7, 14)))
+        self.assertFalse(cal.is_working_day(date(2021, 7, 14)))
+
+    def test_extra_days(self):
+        cal = BitmapCalendar('FR', self.path)
+        day = date(2018, 7, 13)
+        self.assertTrue(cal.is_holiday(day, extra_holidays=[day]))
+        self.assertFalse(cal.is_working_day(day, extra_holidays=[day]))
+        holiday = date(2018, 7, 14)
+        self.assertTrue(
+            cal.is_working_day(holiday, extra_working_days=[holiday]))
+
+    def test_unknown_calendar(self):
+        with self.assertRaises(CalendarError):
+            BitmapCalendar('BE', self.path)
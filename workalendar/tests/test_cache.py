@@ -0,0 +1,270 @@
+import asyncio
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest import TestCase
+
+from ..cache import HolidayCache, clear_shared_caches
+from ..core import Calendar, SAT, SUN
+
+
+class HolidayCacheTest(TestCase):
+
+    def test_get_or_compute(self):
+        cache = HolidayCache()
+        self.assertEqual(cache.get_or_compute(2018, str), '2018')
+        self.assertEqual(cache.get_or_compute(2018, repr), '2018')
+        self.assertEqual(cache, {2018: '2018'})
+        self.assertEqual(cache.info(), (1, 1, None, 1))
+        self.assertEqual(cache._pending, {})
+
+    def test_lru_eviction(self):
+        cache = HolidayCache(maxsize=2)
+        cache.get_or_compute(2018, str)
+        cache.get_or_compute(2019, str)
+        # 2018 is now the most recently used
+        cache.get_or_compute(2018, str)
+        cache.get_or_compute(2020, str)
+        self.assertEqual(list(cache), [2018, 2020])
+        self.assertEqual(cache.info(), (1, 3, 2, 2))
+
+    def test_invalidate(self):
+        cache = HolidayCache()
+        cache.get_or_compute(2018, str)
+        cache.get_or_compute(2019, str)
+        cache.invalidate(2018)
+        self.assertEqual(list(cache), [2019])
+        cache.invalidate()
+        self.assertEqual(cache, {})
+
+    def test_failure_not_cached(self):
+        cache = HolidayCache()
+
+        def compute(year):
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute(2018, compute)
+        self.assertEqual(cache, {})
+        self.assertEqual(cache._pending, {})
+
+    def test_single_flight(self):
+        cache = HolidayCache()
+        calls = []
+
+        def compute(year):
+            calls.append(year)
+            time.sleep(0.05)
+            return year
+
+        threads = [
+            threading.Thread(target=cache.get_or_compute, args=(2018, compute))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [2018])
+        self.assertEqual(cache._pending, {})
+
+    def test_put(self):
+        cache = HolidayCache(maxsize=2)
+        cache.put(2018, 'a')
+        cache.put(2019, 'b')
+        cache.put(2020, 'c')
+        self.assertEqual(cache, {2019: 'b', 2020: 'c'})
+        self.assertEqual(cache.get_or_compute(2020, str), 'c')
+
+    def test_pickle(self):
+        cache = HolidayCache(maxsize=3)
+        cache.get_or_compute(2018, str)
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(copy, {2018: '2018'})
+        self.assertEqual(copy.maxsize, 3)
+
+
+class SmallCacheCalendar(Calendar):
+    WEEKEND_DAYS = (SAT, SUN)
+    FIXED_HOLIDAYS = ((1, 1, 'New year'),)
+    holidays_cache_maxsize = 2
+
+
+class CalendarCacheTest(TestCase):
+
+    def test_bounded_cache(self):
+        cal = SmallCacheCalendar()
+        for year in range(2010, 2020):
+            self.assertTrue(cal.is_holiday(date(year, 1, 1)))
+        self.assertEqual(list(cal._holidays), [2018, 2019])
+        self.assertEqual(len(cal._holiday_index), 2)
+        info = cal.holidays_cache_info()
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.misses, 10)
+
+    def test_hits(self):
+        cal = SmallCacheCalendar()
+        cal.holidays(2018)
+        cal.holidays(2018)
+        self.assertEqual(cal.holidays_cache_info().hits, 1)
+
+    def test_precompute(self):
+        cal = SmallCacheCalendar()
+        cal.precompute([2018, 2019])
+        self.assertEqual(list(cal._holidays), [2018, 2019])
+        self.assertEqual(list(cal._holiday_index), [2018, 2019])
+        self.assertEqual(list(cal._working_days_table), [2018, 2019])
+        self.assertTrue(cal.is_holiday(date(2019, 1, 1)))
+        self.assertEqual(cal.holidays_cache_info().misses, 2)
+
+    def test_pickle_calendar(self):
+        cal = SmallCacheCalendar()
+        cal.holidays(2018)
+        copy = pickle.loads(pickle.dumps(cal))
+        self.assertEqual(copy.holidays(2018), cal.holidays(2018))
+
+
+class CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class SlowCalendar(Calendar):
+    WEEKEND_DAYS = (SAT, SUN)
+    FIXED_HOLIDAYS = ((1, 1, 'New year'),)
+
+    def __init__(self):
+        super().__init__()
+        self.computed = 0
+        self.holidays_executor = CountingExecutor(max_workers=4)
+
+    def get_variable_days(self, year):
+        self.computed += 1
+        time.sleep(0.05)
+        return []
+
+
+class AsyncTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.cal = SlowCalendar()
+
+    def tearDown(self):
+        self.loop.close()
+        self.cal.holidays_executor.shutdown()
+        super().tearDown()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_aholidays(self):
+        self.assertEqual(
+            self.run_async(self.cal.aholidays(2018)),
+            [(date(2018, 1, 1), 'New year')])
+        self.assertEqual(self.cal.holidays_executor.submitted, 1)
+
+    def test_ais_working_day(self):
+        self.assertFalse(
+            self.run_async(self.cal.ais_working_day(date(2018, 1, 1))))
+        self.assertTrue(
+            self.run_async(self.cal.ais_working_day(date(2018, 1, 2))))
+        self.assertFalse(self.run_async(self.cal.ais_working_day(
+            date(2018, 1, 2), extra_holidays=[date(2018, 1, 2)])))
+        self.assertTrue(
+            self.run_async(self.cal.ais_holiday(date(2018, 1, 1))))
+        self.assertEqual(self.cal.holidays_executor.submitted, 1)
+
+    def test_concurrent_requests(self):
+        # Concurrent requests for the same year share one computation
+        days = [date(2018, 1, day) for day in range(1, 11)]
+
+        async def requests():
+            return await asyncio.gather(
+                *[self.cal.ais_working_day(day) for day in days],
+                self.cal.aholidays(2019))
+        results = self.run_async(requests())
+        self.assertEqual(results[:3], [False, True, True])
+        self.assertEqual(self.cal.computed, 2)
+        self.assertEqual(self.cal.holidays_executor.submitted, 2)
+        self.assertEqual(self.cal._pending_years, {})
+
+    def test_warm(self):
+        # Warm lookups don't use the executor
+        self.cal.precompute([2018])
+        self.run_async(self.cal.aholidays(2018))
+        self.run_async(self.cal.ais_working_day(date(2018, 1, 1)))
+        self.assertEqual(self.cal.holidays_executor.submitted, 0)
+
+    def test_failure(self):
+        class FailingCalendar(SlowCalendar):
+            def get_variable_days(self, year):
+                raise ValueError(year)
+        cal = FailingCalendar()
+        with self.assertRaises(ValueError):
+            self.run_async(cal.aholidays(2018))
+        self.assertEqual(cal._pending_years, {})
+        cal.holidays_executor.shutdown()
+
+
+class SharedCacheCalendar(Calendar):
+    WEEKEND_DAYS = (SAT, SUN)
+    FIXED_HOLIDAYS = ((1, 1, 'New year'),)
+    include_something = False
+    share_holidays_cache = True
+
+
+class OtherSharedCacheCalendar(SharedCacheCalendar):
+    include_something = True
+
+
+class SharedCacheTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        clear_shared_caches()
+
+    def tearDown(self):
+        clear_shared_caches()
+        super().tearDown()
+
+    def test_shared(self):
+        cal = SharedCacheCalendar()
+        holidays = cal.holidays(2018)
+        other = SharedCacheCalendar()
+        self.assertIs(other._holidays, cal._holidays)
+        self.assertIs(other.holidays(2018), holidays)
+        self.assertEqual(other.holidays_cache_info().hits, 1)
+
+    def test_not_shared_across_classes(self):
+        cal = SharedCacheCalendar()
+        self.assertIsNot(OtherSharedCacheCalendar()._holidays, cal._holidays)
+
+    def test_not_shared_across_configurations(self):
+        cal = SharedCacheCalendar()
+        SharedCacheCalendar.include_something = True
+        try:
+            other = SharedCacheCalendar()
+        finally:
+            SharedCacheCalendar.include_something = False
+        self.assertIsNot(other._holidays, cal._holidays)
+        self.assertIs(SharedCacheCalendar()._holidays, cal._holidays)
+
+    def test_not_shared_by_default(self):
+        self.assertIsNot(
+            SmallCacheCalendar()._holidays, SmallCacheCalendar()._holidays)
+
+    def test_clear_shared_caches(self):
+        cal = SharedCacheCalendar()
+        clear_shared_caches()
+        self.assertIsNot(SharedCacheCalendar()._holidays, cal._holidays)
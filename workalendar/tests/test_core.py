@@ -1,14 +1,20 @@
 from datetime import date
 from datetime import datetime
+from datetime import timedelta
+from itertools import islice
+import time
 from unittest import TestCase
 
+import numpy
 import pandas
+from lunardate import LunarDate
 
 from . import GenericCalendarTest
 from ..core import (
     MON, TUE, THU, FRI, WED, SAT, SUN,
-    Calendar, LunarCalendar, WesternCalendar,
-    IslamicMixin, JalaliMixin, ChristianMixin
+    Calendar, LunarCalendar, WesternCalendar, OrthodoxMixin,
+    IslamicMixin, JalaliMixin, ChristianMixin, _easter_sunday,
+    ITER_HOLIDAYS_MAX_EMPTY_YEARS
 )
 from ..exceptions import UnsupportedDateType
 
@@ -104,6 +110,72 @@ class CalendarTest(GenericCalendarTest):
         )
 
 
+def brute_force_nth_weekday(year, month, weekday, n, start=None):
+    # Day by day reference implementation
+    day = start or date(year, month, 1)
+    counter = 0
+    while day.month == month:
+        if day.weekday() == weekday:
+            counter += 1
+            if counter == n:
+                return day
+        day += timedelta(days=1)
+    return None
+
+
+class WeekdayInMonthTest(TestCase):
+
+    def test_nth_weekday_too_big_with_start(self):
+        # There's no 3rd friday after the 18th of April 2013
+        self.assertIsNone(
+            Calendar.get_nth_weekday_in_month(
+                2013, 4, FRI, 3, start=date(2013, 4, 18)))
+        # Start in another month
+        self.assertIsNone(
+            Calendar.get_nth_weekday_in_month(
+                2013, 4, FRI, start=date(2013, 5, 1)))
+
+    def test_nth_weekday_matches_day_by_day(self):
+        for year in (2015, 2016):
+            for month in range(1, 13):
+                for weekday in range(7):
+                    for n in range(1, 7):
+                        self.assertEqual(
+                            Calendar.get_nth_weekday_in_month(
+                                year, month, weekday, n),
+                            brute_force_nth_weekday(year, month, weekday, n))
+                        start = date(year, month, 1 + 3 * n)
+                        self.assertEqual(
+                            Calendar.get_nth_weekday_in_month(
+                                year, month, weekday, n, start=start),
+                            brute_force_nth_weekday(
+                                year, month, weekday, n, start))
+
+    def test_last_weekday_matches_day_by_day(self):
+        for month in range(1, 13):
+            for weekday in range(7):
+                last = Calendar.get_last_weekday_in_month(2016, month, weekday)
+                self.assertEqual(last.weekday(), weekday)
+                self.assertEqual(last.month, month)
+                self.assertNotEqual((last + timedelta(days=7)).month, month)
+
+    def test_benchmark(self):
+        # Floating holidays of a century, with and without ``start``.
+        # Generous budget: it's ~5 times faster than walking day by day.
+        start = time.perf_counter()
+        for year in range(2000, 2100):
+            for month in range(1, 13):
+                for weekday in (MON, THU):
+                    for n in range(1, 6):
+                        Calendar.get_nth_weekday_in_month(
+                            year, month, weekday, n)
+                        Calendar.get_nth_weekday_in_month(
+                            year, month, weekday, n,
+                            start=date(year, month, 15))
+                    Calendar.get_last_weekday_in_month(year, month, weekday)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+
 class LunarCalendarTest(GenericCalendarTest):
     cal_class = LunarCalendar
 
@@ -113,6 +185,26 @@ class LunarCalendarTest(GenericCalendarTest):
             date(2014, 1, 31)
         )
 
+    def test_lunar_table(self):
+        # Computed using the precomputed table, checked against lunardate
+        for year in (1900, 1976, 2020, 2033, 2099):
+            for month in range(1, 13):
+                for day in (1, 29):
+                    self.assertEqual(
+                        self.cal.lunar(year, month, day),
+                        LunarDate(year, month, day).toSolarDate())
+        # 2020 has a leap 4th month
+        self.assertEqual(self.cal.lunar(2020, 5, 1), date(2020, 6, 21))
+
+    def test_lunar_invalid(self):
+        # Errors are still raised by lunardate
+        with self.assertRaises(ValueError):
+            self.cal.lunar(2004, 1, 30)
+        with self.assertRaises(ValueError):
+            self.cal.lunar(2004, 13, 1)
+        with self.assertRaises(ValueError):
+            self.cal.lunar(2100, 1, 1)
+
 
 class MockCalendar(Calendar):
 
@@ -221,6 +313,24 @@ class MockCalendarTest(GenericCalendarTest):
         self.assertIsNone(
             self.cal.get_holiday_label(date(2014, 1, 2)))
 
+    def test_holidays_set_is_cached(self):
+        holidays_set = self.cal.holidays_set(self.year)
+        self.assertIsInstance(holidays_set, frozenset)
+        self.assertIs(holidays_set, self.cal.holidays_set(self.year))
+
+    def test_clear_holidays_cache(self):
+        self.cal.holidays_set(2014)
+        self.cal.holidays_set(2015)
+        self.assertIn(2014, self.cal._holiday_index)
+        self.cal.clear_holidays_cache(2014)
+        self.assertNotIn(2014, self.cal._holiday_index)
+        self.assertIn(2015, self.cal._holiday_index)
+        self.cal.clear_holidays_cache()
+        self.assertEqual(self.cal._holiday_index, {})
+        # The index is rebuilt on demand
+        self.assertEqual(
+            self.cal.get_holiday_label(date(2014, 1, 1)), 'New year')
+
     def test_add_working_days_backwards(self):
         day = date(self.year, 1, 3)
         # since this calendar has no weekends, we'll just have a 1-day-shift
@@ -246,6 +356,16 @@ class IslamicMixinTest(GenericCalendarTest):
         days = self.cal.converted(2013)
         self.assertEquals(len(days), 365)
 
+    def test_calverted_years(self):
+        self.assertEqual(self.cal.calverted_years(2013), [1434, 1435])
+        # Three Islamic years overlap 2008
+        self.assertEqual(self.cal.calverted_years(2008), [1428, 1429, 1430])
+        for year in (2008, 2013, 2020):
+            converted_years = sorted(set(
+                y for y, m, d in self.cal.converted(year)))
+            self.assertEqual(
+                self.cal.calverted_years(year), converted_years)
+
 
 class JalaliMixinTest(GenericCalendarTest):
     cal_class = JalaliMixin
@@ -253,12 +373,20 @@ class JalaliMixinTest(GenericCalendarTest):
     def test_year_conversion(self):
         days = self.cal.converted(2013)
         self.assertEquals(len(days), 365)
+        self.assertEquals(len(self.cal.converted(2012)), 366)
+
+    def test_calverted_years(self):
+        self.assertEqual(self.cal.calverted_years(2013), [1391, 1392])
 
 
 class MockChristianCalendar(WesternCalendar, ChristianMixin):
     pass
 
 
+class MockOrthodoxCalendar(OrthodoxMixin, WesternCalendar):
+    pass
+
+
 class MockChristianCalendarTest(GenericCalendarTest):
     cal_class = MockChristianCalendar
 
@@ -289,6 +417,22 @@ class MockChristianCalendarTest(GenericCalendarTest):
         # Only 2 days: Jan 1st and Christmas
         self.assertEquals(len(holidays), 2)
 
+    def test_easter_sunday(self):
+        self.assertEqual(self.cal.get_easter_sunday(2014), date(2014, 4, 20))
+        self.assertEqual(
+            MockOrthodoxCalendar().get_easter_sunday(2014), date(2014, 4, 20))
+        self.assertEqual(
+            MockOrthodoxCalendar().get_easter_sunday(2015), date(2015, 4, 12))
+        self.assertEqual(self.cal.get_easter_sunday(2015), date(2015, 4, 5))
+
+    def test_easter_sunday_memoised(self):
+        self.cal.get_easter_sunday(2014)
+        hits = _easter_sunday.cache_info().hits
+        # Shared by the Easter-based days, and by all the calendars
+        self.cal.get_good_friday(2014)
+        MockChristianCalendar().get_whit_monday(2014)
+        self.assertEqual(_easter_sunday.cache_info().hits, hits + 2)
+
 
 class NoWeekendCalendar(Calendar):
     """
@@ -440,6 +584,453 @@ class WorkingDaysDeltatest(TestCase):
         self.assertEqual(delta, 1)
 
 
+class WorkingDaysTableTest(TestCase):
+
+    def test_table(self):
+        cal = NoHolidayCalendar()
+        table = cal._get_working_days_table(2018)
+        self.assertEqual(len(table), 366)
+        self.assertEqual(table[0], 0)
+        # 2018-01-01 is a Monday, 2018-01-06 is a Saturday
+        self.assertEqual(table[1:8], [1, 2, 3, 4, 5, 5, 5])
+        self.assertEqual(table[-1], 261)
+        cal.clear_holidays_cache()
+        self.assertEqual(cal._working_days_table, {})
+
+    def test_add_working_days_matches_loop(self):
+        cal = MockChristianCalendar()
+        day = date(2018, 12, 20)
+        # An extra holiday out of the range forces the day by day loop
+        extra_holidays = [date(2000, 1, 1)]
+        for delta in (-400, -30, -5, -1, 0, 1, 5, 30, 400):
+            self.assertEqual(
+                cal.add_working_days(day, delta),
+                cal.add_working_days(
+                    day, delta, extra_holidays=extra_holidays),
+            )
+
+    def test_add_working_days_from_holiday(self):
+        cal = MockChristianCalendar()
+        christmas = date(2018, 12, 25)
+        self.assertEqual(
+            cal.add_working_days(christmas, 1), date(2018, 12, 26))
+        self.assertEqual(
+            cal.add_working_days(christmas, -1), date(2018, 12, 24))
+        self.assertEqual(
+            cal.add_working_days(date(2018, 12, 31), 1), date(2019, 1, 2))
+        self.assertEqual(
+            cal.add_working_days(date(2019, 1, 2), -1), date(2018, 12, 31))
+
+    def test_delta_matches_loop(self):
+        cal = MockChristianCalendar()
+        loop_cal = MockChristianCalendar()
+        loop_cal._use_working_days_table = lambda: False
+        start = date(2016, 2, 29)
+        for end in (date(2016, 3, 1), date(2017, 12, 31), date(2020, 7, 14)):
+            for include_start in (False, True):
+                self.assertEqual(
+                    cal.get_working_days_delta(start, end, include_start),
+                    loop_cal.get_working_days_delta(
+                        start, end, include_start),
+                )
+
+    def test_overridden_is_working_day(self):
+        class EveryDayWorks(NoHolidayCalendar):
+            def is_working_day(self, day, *args, **kwargs):
+                return True
+
+        cal = EveryDayWorks()
+        self.assertFalse(cal._use_working_days_table())
+        day = date(2018, 12, 21)  # a Friday
+        self.assertEqual(cal.add_working_days(day, 1), date(2018, 12, 22))
+        self.assertEqual(
+            cal.get_working_days_delta(day, date(2018, 12, 24)), 3)
+
+    def test_overridden_is_holiday(self):
+        extra_holiday = date(2019, 1, 2)
+
+        class OtherHoliday(MockChristianCalendar):
+            def is_holiday(self, day, extra_holidays=None):
+                return day == extra_holiday or super().is_holiday(
+                    day, extra_holidays=extra_holidays)
+
+        cal = OtherHoliday()
+        self.assertFalse(cal._use_working_days_table())
+        self.assertFalse(cal.is_working_day(extra_holiday))
+        start = date(2018, 12, 31)
+        self.assertEqual(cal.add_working_days(start, 1), date(2019, 1, 3))
+        self.assertEqual(
+            cal.get_working_days_delta(start, date(2019, 1, 4)), 2)
+        days = [start + timedelta(days=i) for i in range(5)]
+        self.assertEqual(
+            cal.is_working_day_array(days).tolist(),
+            [cal.is_working_day(day) for day in days])
+        self.assertEqual(
+            cal.add_working_days_array([start], 1).tolist(),
+            [date(2019, 1, 3)])
+        self.assertEqual(
+            cal.get_working_days_delta_array(
+                [start], [date(2019, 1, 4)]).tolist(), [2])
+        self.assertEqual(
+            list(cal.iter_working_days(start, date(2019, 1, 4))),
+            [start, date(2019, 1, 3), date(2019, 1, 4)])
+
+    def test_overridden_holidays_set(self):
+        extra_holiday = date(2019, 1, 2)
+
+        class OtherHoliday(MockChristianCalendar):
+            def holidays_set(self, year=None):
+                holidays = super().holidays_set(year)
+                if year == extra_holiday.year:
+                    holidays = holidays | {extra_holiday}
+                return holidays
+
+        cal = OtherHoliday()
+        self.assertTrue(cal.is_holiday(extra_holiday))
+        self.assertFalse(cal.is_working_day(extra_holiday))
+        start = date(2018, 12, 31)
+        self.assertEqual(cal.add_working_days(start, 1), date(2019, 1, 3))
+        self.assertEqual(
+            cal.get_working_days_delta(start, date(2019, 1, 4)), 2)
+        self.assertEqual(
+            cal.is_working_day_array([extra_holiday]).tolist(), [False])
+
+
+class WorkingDayArrayTest(TestCase):
+
+    def setUp(self):
+        self.cal = MockChristianCalendar()
+        self.days = [date(2018, 12, 20) + timedelta(days=i)
+                     for i in range(20)]
+
+    def test_is_working_day_array(self):
+        expected = [self.cal.is_working_day(day) for day in self.days]
+        result = self.cal.is_working_day_array(self.days)
+        self.assertEqual(result.dtype, bool)
+        self.assertEqual(result.tolist(), expected)
+        # datetime64 arrays
+        array = numpy.array(self.days, dtype='datetime64[D]')
+        self.assertEqual(
+            self.cal.is_working_day_array(array).tolist(), expected)
+        array = numpy.array(self.days, dtype='datetime64[ns]')
+        self.assertEqual(
+            self.cal.is_working_day_array(array).tolist(), expected)
+        # pandas Series & generators
+        series = pandas.Series(pandas.to_datetime(self.days))
+        self.assertEqual(
+            self.cal.is_working_day_array(series).tolist(), expected)
+        generator = (datetime(d.year, d.month, d.day, 12) for d in self.days)
+        self.assertEqual(
+            self.cal.is_working_day_array(generator).tolist(), expected)
+
+    def test_is_working_day_array_extra_days(self):
+        christmas = date(2018, 12, 25)
+        friday = date(2018, 12, 21)
+        kwargs = dict(
+            extra_working_days=[christmas], extra_holidays=[friday])
+        expected = [self.cal.is_working_day(day, **kwargs)
+                    for day in self.days]
+        result = self.cal.is_working_day_array(self.days, **kwargs)
+        self.assertEqual(result.tolist(), expected)
+
+    def test_is_working_day_array_empty(self):
+        self.assertEqual(self.cal.is_working_day_array([]).tolist(), [])
+        # No weekend days
+        cal = MockCalendar()
+        days = [date(2018, 12, 22), date(2019, 1, 1)]
+        result = cal.is_working_day_array(days)
+        self.assertEqual(result.tolist(), [True, False])
+
+    def test_is_working_day_array_missing_dates(self):
+        series = pandas.Series(pandas.to_datetime(['2018-12-24', None]))
+        result = self.cal.is_working_day_array(series)
+        self.assertEqual(result.tolist(), [True, False])
+        array = numpy.array(['NaT', 'NaT'], dtype='datetime64[D]')
+        result = self.cal.is_working_day_array(array)
+        self.assertEqual(result.tolist(), [False, False])
+
+    def test_is_working_day_array_across_years(self):
+        # The holidays of a year may contain days of the previous year,
+        # they're ignored like in ``is_holiday()``.
+        class NewYearEve(MockCalendar):
+            def holidays(self, year=None):
+                return ((date(year - 1, 12, 31), 'New year eve'),)
+
+        cal = NewYearEve()
+        eve = date(2020, 12, 31)
+        self.assertTrue(cal.is_working_day(eve))
+        for days in ([eve], [eve, date(2021, 1, 4)]):
+            self.assertEqual(
+                cal.is_working_day_array(days).tolist(),
+                [cal.is_working_day(day) for day in days])
+        # Extra days use the arrays too
+        kwargs = dict(extra_holidays=[date(2021, 1, 5)])
+        self.assertEqual(
+            cal.add_working_days_array([date(2020, 12, 30)], 1, **kwargs)
+            .tolist(),
+            [cal.add_working_days(date(2020, 12, 30), 1, **kwargs)])
+
+    def test_is_working_day_array_unsupported_type(self):
+        with self.assertRaises(UnsupportedDateType):
+            self.cal.is_working_day_array(['2018-12-25'])
+
+
+class AddWorkingDaysArrayTest(TestCase):
+
+    def setUp(self):
+        self.cal = MockChristianCalendar()
+        self.days = [date(2018, 12, 20) + timedelta(days=i)
+                     for i in range(20)]
+
+    def test_add_working_days_array(self):
+        for delta in (-400, -5, -1, 0, 1, 5, 400):
+            expected = [self.cal.add_working_days(day, delta)
+                        for day in self.days]
+            result = self.cal.add_working_days_array(self.days, delta)
+            self.assertEqual(result.dtype, numpy.dtype('datetime64[D]'))
+            self.assertEqual(result.tolist(), expected)
+
+    def test_array_of_deltas(self):
+        deltas = [(i % 7) * 3 - 9 for i in range(len(self.days))]
+        expected = [self.cal.add_working_days(day, delta)
+                    for day, delta in zip(self.days, deltas)]
+        array = numpy.array(self.days, dtype='datetime64[D]')
+        result = self.cal.add_working_days_array(array, numpy.array(deltas))
+        self.assertEqual(result.tolist(), expected)
+
+    def test_extra_days(self):
+        kwargs = dict(
+            extra_working_days=[date(2018, 12, 25)],
+            extra_holidays=[date(2018, 12, 27)])
+        for delta in (-3, 3):
+            expected = [self.cal.add_working_days(day, delta, **kwargs)
+                        for day in self.days]
+            result = self.cal.add_working_days_array(
+                self.days, delta, **kwargs)
+            self.assertEqual(result.tolist(), expected)
+
+    def test_keep_datetime(self):
+        day = datetime(2018, 12, 24, 14, 30)
+        expected = self.cal.add_working_days(day, 2, keep_datetime=True)
+        result = self.cal.add_working_days_array(
+            [day], 2, keep_datetime=True)
+        self.assertEqual(result.tolist(), [expected])
+        # Datetime arrays keep their resolution
+        array = numpy.array([day], dtype='datetime64[ns]')
+        result = self.cal.add_working_days_array(
+            array, 2, keep_datetime=True)
+        self.assertEqual(result.dtype, numpy.dtype('datetime64[ns]'))
+        self.assertEqual(result[0], numpy.datetime64(expected, 'ns'))
+        # ... unless ``keep_datetime`` is False
+        result = self.cal.add_working_days_array(array, 2)
+        self.assertEqual(result.tolist(), [expected.date()])
+
+    def test_empty(self):
+        result = self.cal.add_working_days_array([], 2)
+        self.assertEqual(result.tolist(), [])
+
+    def test_missing_dates(self):
+        series = pandas.Series(pandas.to_datetime(['2018-12-24', None]))
+        result = self.cal.add_working_days_array(series, [1, 1])
+        self.assertEqual(result.dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(result.tolist(), [date(2018, 12, 26), None])
+        result = self.cal.add_working_days_array(
+            series, 1, keep_datetime=True)
+        self.assertEqual(result.dtype, series.dtype)
+        self.assertEqual(result[0], numpy.datetime64('2018-12-26'))
+        self.assertTrue(numpy.isnat(result[1]))
+
+
+class WorkingDaysDeltaArrayTest(TestCase):
+
+    def setUp(self):
+        self.cal = MockChristianCalendar()
+        self.starts = [date(2018, 12, 20) + timedelta(days=i)
+                       for i in range(20)]
+        # Before, after and on the start days, across years
+        self.ends = [date(2018, 12, 30) + timedelta(days=(i % 5) * 200 - 400)
+                     for i in range(20)]
+        self.ends[3] = self.starts[3]
+
+    def test_delta_array(self):
+        for include_start in (False, True):
+            expected = [
+                self.cal.get_working_days_delta(start, end, include_start)
+                for start, end in zip(self.starts, self.ends)
+            ]
+            result = self.cal.get_working_days_delta_array(
+                self.starts, self.ends, include_start=include_start)
+            self.assertEqual(result.dtype, numpy.dtype('int64'))
+            self.assertEqual(result.tolist(), expected)
+
+    def test_datetimes(self):
+        start = datetime(2018, 5, 9, 0, 1)
+        end = datetime(2018, 5, 10, 19, 1)
+        starts = pandas.Series([start, end])
+        ends = numpy.array([end, start], dtype='datetime64[ns]')
+        result = self.cal.get_working_days_delta_array(starts, ends)
+        self.assertEqual(result.tolist(), [1, 1])
+
+    def test_custom_is_working_day(self):
+        class SaturdayWorks(MockChristianCalendar):
+            def is_working_day(self, day, *args, **kwargs):
+                return day.weekday() == SAT or super().is_working_day(
+                    day, *args, **kwargs)
+
+        cal = SaturdayWorks()
+        expected = [
+            cal.get_working_days_delta(start, end)
+            for start, end in zip(self.starts, self.ends)
+        ]
+        result = cal.get_working_days_delta_array(self.starts, self.ends)
+        self.assertEqual(result.tolist(), expected)
+
+    def test_empty(self):
+        result = self.cal.get_working_days_delta_array([], [])
+        self.assertEqual(result.tolist(), [])
+
+    def test_single_date(self):
+        end = date(2019, 1, 10)
+        expected = [
+            self.cal.get_working_days_delta(start, end)
+            for start in self.starts
+        ]
+        result = self.cal.get_working_days_delta_array(self.starts, end)
+        self.assertEqual(result.tolist(), expected)
+        result = self.cal.get_working_days_delta_array(
+            self.starts, numpy.datetime64(end))
+        self.assertEqual(result.tolist(), expected)
+        result = self.cal.get_working_days_delta_array(end, self.starts)
+        self.assertEqual(result.tolist(), expected)
+        result = self.cal.get_working_days_delta_array(self.starts[0], end)
+        self.assertEqual(result.shape, ())
+        self.assertEqual(result, expected[0])
+
+    def test_missing_dates(self):
+        series = pandas.Series(pandas.to_datetime(['2018-12-24', None]))
+        with self.assertRaises(ValueError):
+            self.cal.get_working_days_delta_array(series, self.ends[:2])
+
+
+class IterDaysTest(TestCase):
+
+    def setUp(self):
+        self.cal = MockChristianCalendar()
+        self.start = date(2018, 12, 20)
+        self.end = date(2019, 1, 8)
+
+    def test_iter_holidays(self):
+        self.assertEqual(
+            list(self.cal.iter_holidays(self.start, self.end)),
+            [(date(2018, 12, 25), 'Christmas Day'),
+             (date(2019, 1, 1), 'New year')])
+        # Bounds are included
+        self.assertEqual(
+            list(self.cal.iter_holidays(
+                date(2018, 12, 25), date(2019, 1, 1))),
+            [(date(2018, 12, 25), 'Christmas Day'),
+             (date(2019, 1, 1), 'New year')])
+        self.assertEqual(
+            list(self.cal.iter_holidays(self.start, date(2018, 12, 24))), [])
+
+    def test_iter_holidays_reverse(self):
+        self.assertEqual(
+            list(self.cal.iter_holidays(self.end, self.start, reverse=True)),
+            [(date(2019, 1, 1), 'New year'),
+             (date(2018, 12, 25), 'Christmas Day')])
+
+    def test_iter_holidays_without_end(self):
+        holidays = self.cal.iter_holidays(self.start)
+        self.assertEqual(
+            [day for day, _ in islice(holidays, 5)],
+            [date(2018, 12, 25), date(2019, 1, 1), date(2019, 12, 25),
+             date(2020, 1, 1), date(2020, 12, 25)])
+        # Only the years reached are computed
+        self.assertEqual(sorted(self.cal._holidays), [2018, 2019, 2020])
+
+    def test_iter_holidays_without_holidays(self):
+        # The iteration stops instead of looking for holidays forever
+        cal = Calendar()
+        self.assertEqual(list(cal.iter_holidays(self.start)), [])
+        self.assertEqual(len(cal._holidays), ITER_HOLIDAYS_MAX_EMPTY_YEARS)
+        self.assertEqual(
+            list(cal.iter_holidays(self.start, reverse=True)), [])
+        # ... but not while there are holidays in the following years
+        cal = MockChristianCalendar()
+        holidays = cal.iter_holidays(date(2018, 12, 26), reverse=True)
+        self.assertEqual(len(list(islice(holidays, 40))), 40)
+
+    def test_iter_date_limits(self):
+        # Unbounded iterations stop at the first and last supported dates
+        holidays = self.cal.iter_holidays(date(1, 3, 1), reverse=True)
+        self.assertEqual(
+            [day for day, _ in holidays], [date(1, 1, 1)])
+        holidays = self.cal.iter_holidays(date(9999, 12, 1))
+        self.assertEqual(
+            [day for day, _ in holidays], [date(9999, 12, 25)])
+        self.assertEqual(
+            list(self.cal.iter_working_days(date(1, 1, 3), reverse=True)),
+            [date(1, 1, 3), date(1, 1, 2)])
+        self.assertEqual(
+            list(self.cal.iter_working_days(date(9999, 12, 29))),
+            [date(9999, 12, 29), date(9999, 12, 30), date(9999, 12, 31)])
+        self.assertEqual(
+            list(self.cal.iter_business_periods(
+                date(1, 1, 10), reverse=True)),
+            [(date(1, 1, 8), date(1, 1, 10)), (date(1, 1, 2), date(1, 1, 5))])
+        # No holidays: the iteration stops at the first year
+        self.assertEqual(
+            list(Calendar().iter_holidays(date(3, 1, 1), reverse=True)), [])
+
+    def test_iter_working_days(self):
+        expected = [
+            day for day in (self.start + timedelta(days=i) for i in range(20))
+            if self.cal.is_working_day(day)
+        ]
+        self.assertEqual(
+            list(self.cal.iter_working_days(self.start, self.end)), expected)
+        self.assertEqual(
+            list(self.cal.iter_working_days(
+                self.end, self.start, reverse=True)),
+            expected[::-1])
+        self.assertEqual(
+            list(islice(self.cal.iter_working_days(self.start), 3)),
+            expected[:3])
+
+    def test_iter_working_days_extra_days(self):
+        kwargs = dict(
+            extra_working_days=[date(2018, 12, 25)],
+            extra_holidays=[date(2018, 12, 27)])
+        expected = [
+            day for day in (self.start + timedelta(days=i) for i in range(20))
+            if self.cal.is_working_day(day, **kwargs)
+        ]
+        self.assertEqual(
+            list(self.cal.iter_working_days(self.start, self.end, **kwargs)),
+            expected)
+
+    def test_iter_business_periods(self):
+        periods = [
+            (date(2018, 12, 20), date(2018, 12, 21)),
+            (date(2018, 12, 24), date(2018, 12, 24)),
+            (date(2018, 12, 26), date(2018, 12, 28)),
+            (date(2018, 12, 31), date(2018, 12, 31)),
+            (date(2019, 1, 2), date(2019, 1, 4)),
+            (date(2019, 1, 7), date(2019, 1, 8)),
+        ]
+        self.assertEqual(
+            list(self.cal.iter_business_periods(self.start, self.end)),
+            periods)
+        self.assertEqual(
+            list(self.cal.iter_business_periods(
+                self.end, self.start, reverse=True)),
+            periods[::-1])
+        self.assertEqual(
+            list(self.cal.iter_business_periods(
+                date(2018, 12, 22), date(2018, 12, 23))),
+            [])
+
+
 class NoDocstring(Calendar):
     pass
 
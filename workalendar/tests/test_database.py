@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+from datetime import date
+from unittest import TestCase
+
+from ..asia import China
+from ..database import (
+    HolidayDatabase, build_database, get_database, use_database
+)
+from ..europe import France, Berlin
+from ..exceptions import CalendarError
+
+
+class DatabaseTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'holidays.db')
+        build_database(
+            self.path, 2017, 2020, iso_codes=['FR', 'DE-BE', 'CN'])
+        self.database = HolidayDatabase(self.path)
+
+    def tearDown(self):
+        use_database(None)
+        self.database.close()
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def test_content(self):
+        self.assertEqual(set(self.database.calendars), {'FR', 'DE-BE', 'CN'})
+        for year in range(2017, 2021):
+            self.assertEqual(
+                self.database.get_holidays('FR', year),
+                France().holidays(year))
+            self.assertEqual(
+                self.database.get_holidays('DE-BE', year),
+                Berlin().holidays(year))
+
+    def test_not_stored(self):
+        self.assertIsNone(self.database.get_holidays('FR', 2016))
+        self.assertIsNone(self.database.get_holidays('FR', 2021))
+        self.assertIsNone(self.database.get_holidays('BE', 2018))
+        # China is only configured for a few years
+        self.assertEqual(
+            self.database.calendars['CN']['missing_years'], {2017})
+        self.assertIsNone(self.database.get_holidays('CN', 2017))
+
+    def test_calendar_classes(self):
+        self.assertEqual(self.database.get_iso_code(France), 'FR')
+
+        class MyFrance(France):
+            pass
+
+        self.assertIsNone(self.database.get_iso_code(MyFrance))
+        self.assertIsNone(
+            self.database.get_calendar_holidays(MyFrance(), 2018))
+
+    def test_use_database(self):
+        self.assertIsNone(get_database())
+        use_database(self.path)
+        self.assertIsInstance(get_database(), HolidayDatabase)
+        cal = France()
+        # Holidays are read from the database, not computed
+        cal.get_calendar_holidays = None
+        self.assertEqual(cal.holidays(2018), France().holidays(2018))
+        self.assertTrue(cal.is_holiday(date(2018, 7, 14)))
+        # Out of the database, holidays are computed
+        with self.assertRaises(TypeError):
+            cal.holidays(2021)
+
+    def test_missing_year_is_computed(self):
+        use_database(self.database)
+        with self.assertRaises(CalendarError):
+            China().holidays(2017)
+
+    def test_not_a_database(self):
+        path = os.path.join(self.directory, 'other')
+        with open(path, 'wb') as fd:
+            fd.write(b'\0' * 64)
+        with self.assertRaises(CalendarError):
+            HolidayDatabase(path)
@@ -0,0 +1,39 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ..datafile import HEADER, class_path, open_data_file, write_data_file
+from ..europe import France
+from ..exceptions import CalendarError
+
+
+class DataFileTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'data')
+
+    def test_write_and_open(self):
+        write_data_file(
+            self.path, b'WKTEST01', [b'abc', b'de'], {'key': 'value'})
+        data, metadata = open_data_file(self.path, b'WKTEST01', 'test file')
+        self.addCleanup(data.close)
+        self.assertEqual(metadata, {'key': 'value'})
+        self.assertEqual(data[HEADER.size:HEADER.size + 5], b'abcde')
+
+    def test_wrong_magic(self):
+        write_data_file(self.path, b'WKTEST01', [], {})
+        with self.assertRaises(CalendarError):
+            open_data_file(self.path, b'WKTEST02', 'test file')
+
+    def test_not_a_data_file(self):
+        with open(self.path, 'wb') as fd:
+            fd.write(b'\0' * 4)
+        with self.assertRaises(CalendarError):
+            open_data_file(self.path, b'WKTEST01', 'test file')
+
+    def test_class_path(self):
+        self.assertEqual(
+            class_path(France), 'workalendar.europe.france.France')
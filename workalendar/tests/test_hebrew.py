@@ -0,0 +1,56 @@
+from datetime import date, timedelta
+
+from pyluach.dates import GregorianDate
+
+from ..hebrew import (
+    get_hebrew_calendar, get_hebrew_date, get_month_lengths,
+    get_rosh_hashanah, _hebrew_calendars
+)
+
+
+def day_by_day_calendar(year):
+    # Reference implementation, converting every day of the year
+    result = {}
+    day = date(year, 1, 1)
+    while day.year == year:
+        hebrew_date = GregorianDate(day.year, day.month, day.day).to_heb()
+        result.setdefault((hebrew_date.month, hebrew_date.day), day)
+        day += timedelta(days=1)
+    return result
+
+
+def test_rosh_hashanah():
+    assert get_rosh_hashanah(5780) == date(2019, 9, 30)
+    assert get_rosh_hashanah(5781) == date(2020, 9, 19)
+
+
+def test_month_lengths():
+    for year_length in (353, 354, 355, 383, 384, 385):
+        months = get_month_lengths(year_length)
+        assert sum(length for _, length in months) == year_length
+        assert len(months) == (13 if year_length > 355 else 12)
+        assert months[0] == (7, 30)  # Tishrei
+
+
+def test_hebrew_calendar():
+    # Leap and non-leap years, deficient, regular and complete years
+    for year in (1948, 2000, 2014, 2016, 2019, 2020, 2024, 2100):
+        assert get_hebrew_calendar(year) == day_by_day_calendar(year)
+
+
+def test_hebrew_date():
+    assert get_hebrew_date(2019, 7, 1) == date(2019, 9, 30)
+    assert get_hebrew_date(2019, 7, 10) == date(2019, 10, 9)
+    # Tevet 15th is in January and December 2010, the first one is kept
+    assert get_hebrew_date(2010, 10, 15) == date(2010, 1, 1)
+    # Tevet 29th 5774 is on January 1st 2014, Tevet 5775 ends in 2015
+    assert get_hebrew_date(2014, 10, 29) == date(2014, 1, 1)
+    assert get_hebrew_date(2014, 10, 28) is None
+
+
+def test_bounded_cache():
+    for year in range(1800, 2000):
+        get_hebrew_calendar(year)
+    assert len(_hebrew_calendars) == _hebrew_calendars.maxsize
+    assert 1999 in _hebrew_calendars
+    assert 1800 not in _hebrew_calendars
@@ -0,0 +1,57 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+# Generous budget: importing a European calendar should be far below it.
+IMPORT_TIME_BUDGET = 0.5  # seconds
+
+HEAVY_MODULES = (
+    'calverter', 'dateutil', 'lunardate', 'pkg_resources', 'pyluach',
+    'pytz', 'skyfield', 'skyfield_data',
+)
+
+
+def run_import(statement):
+    """
+    Run the import ``statement`` in a fresh interpreter.
+
+    Return the import duration, and the list of imported heavy modules.
+    """
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "{statement}\n"
+        "duration = time.perf_counter() - start\n"
+        "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+        "print(json.dumps([duration, heavy]))\n"
+    ).format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return json.loads(output.decode())
+
+
+class ImportTest(TestCase):
+
+    def test_import_version(self):
+        duration, heavy = run_import(
+            "import workalendar\n"
+            "assert workalendar.__version__"
+        )
+        # The version is not looked up using ``pkg_resources``
+        self.assertEqual(heavy, [])
+        self.assertLess(duration, IMPORT_TIME_BUDGET)
+
+    def test_import_france(self):
+        duration, heavy = run_import("import workalendar.europe.france")
+        self.assertEqual(heavy, [])
+        self.assertLess(duration, IMPORT_TIME_BUDGET)
+
+    def test_import_astronomy(self):
+        duration, heavy = run_import(
+            "from workalendar.asia import Japan, Taiwan, HongKong\n"
+            "Japan().holidays(2020)\n"
+            "Taiwan().holidays(2020)\n"
+            "HongKong().holidays(2020)"
+        )
+        # Dates are read from the precomputed tables.
+        self.assertNotIn('skyfield', heavy)
@@ -0,0 +1,86 @@
+import io
+import json
+import os
+import subprocess
+import sys
+from datetime import date
+from unittest import TestCase
+
+from .. import instrumentation
+from ..core import Calendar, SAT, SUN
+
+
+class InstrumentedCalendar(Calendar):
+    WEEKEND_DAYS = (SAT, SUN)
+    FIXED_HOLIDAYS = ((1, 1, 'New year'),)
+
+    def get_variable_days(self, year):
+        return [(date(year, 7, 14), 'Bastille day')]
+
+
+CLASS_PATH = '{}.InstrumentedCalendar'.format(__name__)
+
+
+class InstrumentationTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        instrumentation.reset()
+        instrumentation.enable()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+        super().tearDown()
+
+    def test_stats(self):
+        cal = InstrumentedCalendar()
+        cal.holidays(2018)
+        cal.holidays(2018)
+        cal.holidays(2019)
+        cal.is_working_day(date(2018, 1, 1))
+        stats = instrumentation.get_stats()[CLASS_PATH]
+        # The 4th call comes from the holiday index, for is_working_day()
+        self.assertEqual(stats['holidays_calls'], 4)
+        self.assertEqual(stats['cache_hits'], 2)
+        self.assertEqual(stats['cache_misses'], 2)
+        self.assertEqual(stats['is_working_day_calls'], 1)
+        self.assertEqual(
+            sorted(stats['phases']), sorted(instrumentation.PHASES))
+        for phase in stats['phases'].values():
+            self.assertEqual(phase['calls'], 2)
+            self.assertGreater(phase['time'], 0)
+
+    def test_disabled(self):
+        instrumentation.disable()
+        cal = InstrumentedCalendar()
+        cal.holidays(2018)
+        cal.is_working_day(date(2018, 7, 14))
+        self.assertEqual(instrumentation.get_stats(), {})
+
+    def test_reset(self):
+        InstrumentedCalendar().holidays(2018)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.get_stats(), {})
+
+    def test_print_stats(self):
+        InstrumentedCalendar().holidays(2018)
+        output = io.StringIO()
+        instrumentation.print_stats(output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith(CLASS_PATH))
+
+    def test_environment_variable(self):
+        code = (
+            "import json\n"
+            "from workalendar import instrumentation\n"
+            "from workalendar.europe import France\n"
+            "France().holidays(2018)\n"
+            "print(json.dumps(sorted(instrumentation.get_stats())))\n"
+        )
+        env = dict(os.environ, WORKALENDAR_INSTRUMENTATION='1')
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+        self.assertEqual(
+            json.loads(output.decode()),
+            ['workalendar.europe.france.France'])
@@ -0,0 +1,119 @@
+import io
+import subprocess
+import sys
+from unittest import TestCase, mock
+
+from ..__main__ import main
+
+
+class MainTest(TestCase):
+
+    def run_main(self, argv, input_text):
+        stdin = io.StringIO(input_text)
+        stdout = io.StringIO()
+        with mock.patch('sys.stdin', stdin), mock.patch('sys.stdout', stdout):
+            main(argv)
+        return stdout.getvalue()
+
+    def test_working_day(self):
+        output = self.run_main(
+            ['FR', 'working-day'],
+            "2018-12-24\n2018-12-25\n2018-12-29\n2018-12-26T10:30\n")
+        self.assertEqual(output, (
+            "2018-12-24,true\n"
+            "2018-12-25,false\n"
+            "2018-12-29,false\n"
+            "2018-12-26T10:30,true\n"
+        ))
+
+    def test_holiday(self):
+        output = self.run_main(
+            ['FR', 'holiday'], "2018-12-24\n2018-12-25\n")
+        self.assertEqual(output, "2018-12-24,\n2018-12-25,Christmas Day\n")
+
+    def test_add_working_days(self):
+        output = self.run_main(
+            ['FR', 'add-working-days', '--delta', '3'],
+            "2018-12-24\n2018-12-25\n")
+        self.assertEqual(
+            output, "2018-12-24,2018-12-28\n2018-12-25,2018-12-28\n")
+        output = self.run_main(
+            ['FR', '--header', '--delimiter', ';',
+             'add-working-days', '--delta-column', '1'],
+            "day;delta\n2018-12-24;3\n2018-12-24;-2\n")
+        self.assertEqual(output, (
+            "day;delta;add-working-days\n"
+            "2018-12-24;3;2018-12-28\n"
+            "2018-12-24;-2;2018-12-20\n"
+        ))
+
+    def test_delta(self):
+        input_text = "2018-12-24,2019-01-10\n2019-01-10,2018-12-24\n"
+        output = self.run_main(['FR', 'delta'], input_text)
+        self.assertEqual(output, (
+            "2018-12-24,2019-01-10,11\n"
+            "2019-01-10,2018-12-24,11\n"
+        ))
+        output = self.run_main(['FR', 'delta', '--include-start'], input_text)
+        self.assertEqual(output, (
+            "2018-12-24,2019-01-10,12\n"
+            "2019-01-10,2018-12-24,12\n"
+        ))
+
+    def test_empty_lines(self):
+        output = self.run_main(
+            ['FR', '--chunk-size', '1', 'working-day'],
+            "\n2018-12-24\n\n\n2018-12-25\n\n")
+        self.assertEqual(output, "2018-12-24,true\n2018-12-25,false\n")
+
+    def test_chunks(self):
+        # Rows spanning several chunks are all written, in order
+        days = ["2018-12-{:02}".format(day) for day in range(1, 32)]
+        output = self.run_main(
+            ['FR', '--chunk-size', '4', 'working-day'],
+            "\n".join(days) + "\n")
+        rows = [line.split(',') for line in output.splitlines()]
+        self.assertEqual([row[0] for row in rows], days)
+        self.assertEqual(
+            sum(row[1] == 'true' for row in rows), 20)
+
+    def test_errors(self):
+        with self.assertRaises(SystemExit):
+            self.run_main(['XX', 'working-day'], "2018-12-24\n")
+        with self.assertRaises(SystemExit):
+            self.run_main(['FR', 'working-day'], "2018-12-24\nfoo\n")
+        with self.assertRaises(SystemExit):
+            self.run_main(['FR', 'delta'], "2018-12-24\n")
+        with self.assertRaises(SystemExit):
+            self.run_main(
+                ['FR', 'add-working-days', '--delta-column', '1'],
+                "2018-12-24\n")
+
+    def test_missing_dates(self):
+        # Blank date fields are rejected, whatever the command
+        commands = (
+            ['working-day'], ['holiday'], ['add-working-days', '--delta', '1'],
+            ['delta'],
+        )
+        for command in commands:
+            for input_text in ("2018-12-25,2018-12-26\n,2018-12-26\n",
+                               "2018-12-25,NaT\n"):
+                if command != ['delta'] and input_text.endswith('NaT\n'):
+                    continue
+                stderr = io.StringIO()
+                with self.assertRaises(SystemExit) as context, \
+                        mock.patch('sys.stderr', stderr):
+                    self.run_main(['FR'] + command, input_text)
+                self.assertEqual(context.exception.code, 1)
+                self.assertIn('missing date', stderr.getvalue())
+
+    def test_numpy_missing(self):
+        with mock.patch.dict('sys.modules', {'numpy': None}):
+            with self.assertRaises(SystemExit):
+                self.run_main(['FR', 'working-day'], "2018-12-24\n")
+
+    def test_module(self):
+        output = subprocess.check_output(
+            [sys.executable, '-m', 'workalendar', 'FR', 'working-day'],
+            input=b"2018-12-25\n")
+        self.assertEqual(output, b"2018-12-25,false\n")
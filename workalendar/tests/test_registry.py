@@ -1,9 +1,12 @@
 from unittest import TestCase
+import subprocess
+import sys
 import warnings
 
 from ..core import Calendar
 from ..exceptions import ISORegistryError
 from ..registry import IsoRegistry
+from ..registry_manifest import REGISTRY_MANIFEST
 
 
 class RegionCalendar(Calendar):
@@ -149,3 +152,74 @@ class NonStandardRegistryTest(TestCase):
         self.assertEqual(
             set({"RE", "RE2", "RE3", "RE-SR"}),
             set(calendars.keys()))
+
+
+class LazyRegistryTest(TestCase):
+
+    def test_manifest_up_to_date(self):
+        # If this test fails, run ``make registry_manifest``
+        registry = IsoRegistry(lazy=False)
+        manifest = {
+            code: (cls.__module__, cls.__name__)
+            for code, cls in registry.region_registry.items()
+        }
+        self.assertEqual(manifest, REGISTRY_MANIFEST)
+
+    def test_same_as_eager(self):
+        eager = IsoRegistry(lazy=False)
+        lazy = IsoRegistry(lazy=True)
+        self.assertEqual(
+            lazy.get_calendar_class('FR'), eager.get_calendar_class('FR'))
+        self.assertIsNone(lazy.get_calendar_class('XX'))
+        self.assertEqual(lazy.get_subregions('AU'), eager.get_subregions('AU'))
+        self.assertEqual(
+            lazy.get_calendars(['FR', 'CA'], include_subregions=True),
+            eager.get_calendars(['FR', 'CA'], include_subregions=True),
+        )
+        self.assertEqual(lazy.get_calendars(), eager.get_calendars())
+        self.assertEqual(lazy.region_registry, eager.region_registry)
+
+    def test_lazy_loading(self):
+        registry = IsoRegistry(lazy=True)
+        self.assertEqual(registry._region_registry, {})
+        registry.get_calendar_class('FR')
+        self.assertEqual(list(registry._region_registry), ['FR'])
+        registry.get_subregions('CH')
+        self.assertEqual(
+            set(registry._region_registry), {'FR', 'CH-VD', 'CH-GE'})
+
+    def test_imported_modules(self):
+        # Looking up a European calendar doesn't import other continents
+        code = (
+            "import sys\n"
+            "from workalendar.registry import registry\n"
+            "registry.get_calendar_class('FR')\n"
+            "print('workalendar.asia' in sys.modules)\n"
+        )
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.strip(), b'False')
+
+
+class WarmTest(TestCase):
+
+    def check_calendars(self, calendars):
+        self.assertEqual(set(calendars), {'FR', 'CN'})
+        france = calendars['FR']
+        self.assertEqual(sorted(france._holidays), [2017, 2018, 2019, 2020])
+        self.assertEqual(
+            sorted(france._holiday_index), [2017, 2018, 2019, 2020])
+        self.assertEqual(
+            france.holidays(2018), type(france)().holidays(2018))
+        self.assertEqual(france.holidays_cache_info().misses, 0)
+        # China is only configured for a few years
+        self.assertEqual(sorted(calendars['CN']._holidays), [2018, 2019, 2020])
+
+    def test_warm(self):
+        registry = IsoRegistry(lazy=True)
+        self.check_calendars(
+            registry.warm(['FR', 'CN'], range(2017, 2021), workers=2))
+
+    def test_warm_in_process(self):
+        registry = IsoRegistry(lazy=True)
+        self.check_calendars(
+            registry.warm(['FR', 'CN'], range(2017, 2021), workers=1))
@@ -1,51 +1,27 @@
-from datetime import date, timedelta
+from datetime import date
 import warnings
-from pyluach.dates import GregorianDate
 
 from .core import UnitedStates
+from ..hebrew import get_hebrew_calendar, get_hebrew_date
 from ..registry_tools import iso_register
 
 
 class HebrewHolidays:
 
-    hebrew_calendars = {}
-
     @classmethod
     def get_hebrew_calendar(cls, gregorian_year):
         """
-        Build and cache the Hebrew calendar for the given Gregorian Year.
+        Return the Hebrew calendar for the given Gregorian Year, as a dict
+        ``{(Hebrew month, Hebrew day): date}``.
         """
-        if gregorian_year not in cls.hebrew_calendars:
-            # Build the hebrew calendar for year
-            days = []
-            current_date = date(gregorian_year, 1, 1)
-
-            while current_date.year == gregorian_year:
-                hebrew_date = GregorianDate(
-                    year=current_date.year,
-                    month=current_date.month,
-                    day=current_date.day,
-                ).to_heb()
-                days.append(
-                    (hebrew_date, current_date)
-                )
-                current_date += timedelta(days=1)
-            # Store it in the class property
-            cls.hebrew_calendars[gregorian_year] = days
-
-        # Return the hebrew calendar
-        return cls.hebrew_calendars[gregorian_year]
+        return get_hebrew_calendar(gregorian_year)
 
     @classmethod
     def search_hebrew_calendar(cls, gregorian_year, hebrew_month, hebrew_day):
         """
         Search for a specific Hebrew month and day in the Hebrew calendar.
         """
-        calendar = cls.get_hebrew_calendar(gregorian_year)
-        search = filter(lambda item: item[0].month == hebrew_month, calendar)
-        search = filter(lambda item: item[0].day == hebrew_day, search)
-        for item in search:
-            return item[1]
+        return get_hebrew_date(gregorian_year, hebrew_month, hebrew_day)
 
     @classmethod
     def get_rosh_hashanah(cls, year):